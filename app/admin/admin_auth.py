@@ -1,9 +1,12 @@
 from typing import Optional
 
-from fastapi import APIRouter, Request, Query
+from fastapi import APIRouter, Depends, Request, Query
 from starlette import status
 
+from common.enums import PaginationMode, CountMode
 from common.response import ApiResponse
+from custom_middleware.public_routes import public_route
+from db_domains.db import get_unit_of_work
 from models.user import User
 from schemas.auth_schemas import AdminLoginRequest, AddUserRequest, UserUpdateData
 from services.auth_service import AdminAuthService
@@ -13,6 +16,7 @@ admin_auth_service = AdminAuthService(User)
 
 
 @router.post("/auth", summary="Admin Authentication")
+@public_route
 def admin_authentication(request: Request, login_request: AdminLoginRequest):
     response = admin_auth_service.login(login_request=login_request)
 
@@ -31,11 +35,15 @@ def get_all_users(
         order_by: Optional[str] = Query(None, description="Field Name to Order By"),
         order_direction: Optional[str] = Query(None, description="Field Name to Order Direction"),
         limit: int = Query(10, description="Number of items per page"),
-        offset: int = Query(0, description="Number of items to skip")
+        offset: int = Query(0, description="Number of items to skip"),
+        pagination: PaginationMode = Query(PaginationMode.OFFSET, description="Offset or cursor (keyset) pagination"),
+        cursor: Optional[str] = Query(None, description="next_cursor of the previous page, cursor pagination only"),
+        count_mode: CountMode = Query(CountMode.ESTIMATE, description="Total count mode, cursor pagination only"),
 ):
     response = admin_auth_service.get_all_users(
         search=search, status_filter=status_filter,
-        order_by=order_by, order_direction=order_direction, limit=limit, offset=offset
+        order_by=order_by, order_direction=order_direction, limit=limit, offset=offset,
+        pagination=pagination, cursor=cursor, count_mode=count_mode
     )
 
     return ApiResponse.create_response(
@@ -58,7 +66,7 @@ def get_users_details(user_id: str):
     )
 
 
-@router.post("/add-user", summary="Add User")
+@router.post("/add-user", summary="Add User", dependencies=[Depends(get_unit_of_work)])
 def add_user(request: Request, form_data: AddUserRequest):
     response = admin_auth_service.create_user(form_data)
 
@@ -70,8 +78,8 @@ def add_user(request: Request, form_data: AddUserRequest):
     )
 
 
-@router.put("/update-user/{user_id}", summary="Update User Details")
-async def update_user_details(user_id: str, form_data: UserUpdateData):
+@router.put("/update-user/{user_id}", summary="Update User Details", dependencies=[Depends(get_unit_of_work)])
+def update_user_details(user_id: str, form_data: UserUpdateData):
     response = admin_auth_service.update_user(user_id, form_data)
     return ApiResponse.create_response(
         success=response.get("success"),
@@ -81,8 +89,8 @@ async def update_user_details(user_id: str, form_data: UserUpdateData):
     )
 
 
-@router.delete("/delete-user/{user_id}", summary="Delete User")
-async def delete_user(request: Request, user_id: str):
+@router.delete("/delete-user/{user_id}", summary="Delete User", dependencies=[Depends(get_unit_of_work)])
+def delete_user(request: Request, user_id: str):
     user_state = getattr(request.state, "user", None)
     response = admin_auth_service.delete_user(logged_in_user_id=user_state.get("id"), user_id=user_id)
     return ApiResponse.create_response(
@@ -10,7 +10,7 @@ dashboard_service = DashboardService(LoanApplicant)
 
 
 @router.get("/get-counts", summary="Get All Counts")
-async def get_counts():
+def get_counts():
     response = dashboard_service.get_counts()
 
     return ApiResponse.create_response(
@@ -19,3 +19,15 @@ async def get_counts():
         status_code=response.get("status_code") if response.get("status_code") else status.HTTP_200_OK,
         data=response.get("data")
     )
+
+
+@router.get("/portfolio-risk", summary="Get CIBIL Portfolio Risk")
+def get_portfolio_risk():
+    response = dashboard_service.get_portfolio_risk()
+
+    return ApiResponse.create_response(
+        success=response.get("success"),
+        message=response.get("message"),
+        status_code=response.get("status_code") if response.get("status_code") else status.HTTP_200_OK,
+        data=response.get("data")
+    )
@@ -0,0 +1,56 @@
+from fastapi import APIRouter
+from starlette import status
+
+from common.common_services.jwt_service import JWTService
+from common.email_outbox import email_outbox_stats
+from common.response import ApiResponse
+from common.utils import emi_schedule_cache_info
+from db_domains.db import async_engine, engine
+from db_domains.db.pool import get_pool_stats
+
+router = APIRouter(prefix="/admin/internal", tags=["Admin Internal API's"])
+
+
+@router.get("/pool-stats", summary="Database Connection Pool Stats")
+def pool_stats():
+    return ApiResponse.create_response(
+        success=True,
+        message="Pool stats fetched successfully",
+        status_code=status.HTTP_200_OK,
+        data={
+            "sync_pool": get_pool_stats(engine.pool),
+            "async_pool": get_pool_stats(async_engine.pool),
+        }
+    )
+
+
+@router.get("/emi-schedule-cache-stats", summary="EMI Schedule Cache Stats")
+def emi_schedule_cache_stats():
+    return ApiResponse.create_response(
+        success=True,
+        message="EMI schedule cache stats fetched successfully",
+        status_code=status.HTTP_200_OK,
+        data=emi_schedule_cache_info()
+    )
+
+
+@router.get("/jwt-cache-stats", summary="Verified Access Token Cache Stats")
+def jwt_cache_stats():
+    return ApiResponse.create_response(
+        success=True,
+        message="JWT cache stats fetched successfully",
+        status_code=status.HTTP_200_OK,
+        data={
+            "verified": JWTService.VERIFIED_ACCESS_TOKENS.stats(),
+        }
+    )
+
+
+@router.get("/email-outbox-stats", summary="Email Outbox Queue Stats")
+def email_outbox_queue_stats():
+    return ApiResponse.create_response(
+        success=True,
+        message="Email outbox stats fetched successfully",
+        status_code=status.HTTP_200_OK,
+        data=email_outbox_stats()
+    )
@@ -1,9 +1,11 @@
 from typing import Optional, List
 
-from fastapi import APIRouter, Query, Request, BackgroundTasks
+from fastapi import APIRouter, Depends, Query, Request, BackgroundTasks
 from starlette import status
 
+from common.enums import PaginationMode, CountMode
 from common.response import ApiResponse
+from db_domains.db import get_unit_of_work
 from models.loan import LoanApplicant
 from schemas.loan_schemas import LoanForm, UpdateLoanForm, LoanApprovedDocumentForm
 from services.loan_service.admin_loan import AdminLoanService
@@ -22,10 +24,14 @@ def get_all_loans(
         offset: int = Query(0, description="Number of items to skip"),
         start_date: Optional[str] = Query(None, description="Start Date for Range Filter"),
         end_date: Optional[str] = Query(None, description="End Date for Range Filter"),
+        pagination: PaginationMode = Query(PaginationMode.OFFSET, description="Offset or cursor (keyset) pagination"),
+        cursor: Optional[str] = Query(None, description="next_cursor of the previous page, cursor pagination only"),
+        count_mode: CountMode = Query(CountMode.ESTIMATE, description="Total count mode, cursor pagination only"),
 ):
     response = admin_loan_service.get_all_loans(
         search=search, status_filter=status_filter, order_by=order_by, order_direction=order_direction, limit=limit,
-        offset=offset, start_date=start_date, end_date=end_date
+        offset=offset, start_date=start_date, end_date=end_date, pagination=pagination, cursor=cursor,
+        count_mode=count_mode
     )
 
     return ApiResponse.create_response(
@@ -49,7 +55,7 @@ def get_all_loan(loan_id: str):
 
 
 @router.post("/create-loan-application", summary="Create Loan Application")
-async def create_loan_application(request: Request, form_data: LoanForm, background_tasks: BackgroundTasks):
+def create_loan_application(request: Request, form_data: LoanForm, background_tasks: BackgroundTasks):
     user_state = getattr(request.state, "user", None)
     response = admin_loan_service.add_loan_application(user_id=user_state.get("id"), loan_application_form=form_data, background_tasks=background_tasks, is_created_by_admin=True)
 
@@ -61,8 +67,8 @@ async def create_loan_application(request: Request, form_data: LoanForm, backgro
     )
 
 
-@router.put("/update-loan-application/{loan_id}", summary="Update Loan Application")
-async def update_loan_application(request: Request, loan_id: str, form_data: UpdateLoanForm):
+@router.put("/update-loan-application/{loan_id}", summary="Update Loan Application", dependencies=[Depends(get_unit_of_work)])
+def update_loan_application(request: Request, loan_id: str, form_data: UpdateLoanForm):
     user_state = getattr(request.state, "user", None)
 
     response = admin_loan_service.update_loan_applications(
@@ -77,8 +83,8 @@ async def update_loan_application(request: Request, loan_id: str, form_data: Upd
     )
 
 
-@router.delete("/delete-loan-application/{loan_id}", summary="Delete Loan Application")
-async def update_loan_application(request: Request, loan_id: str):
+@router.delete("/delete-loan-application/{loan_id}", summary="Delete Loan Application", dependencies=[Depends(get_unit_of_work)])
+def update_loan_application(request: Request, loan_id: str):
     user_state = getattr(request.state, "user", None)
 
     response = admin_loan_service.delete_loan_applications(logged_in_user_id=user_state.get("id"), loan_id=loan_id)
@@ -115,7 +121,7 @@ def get_all_user_approved_loans(
 
 
 
-@router.post("/add-approved-document", summary="Add Approve Loan Document")
+@router.post("/add-approved-document", summary="Add Approve Loan Document", dependencies=[Depends(get_unit_of_work)])
 def add_approved_loan_document(request: Request, form_data: LoanApprovedDocumentForm):
     user_state = getattr(request.state, "user", None)
 
@@ -127,7 +133,7 @@ def add_approved_loan_document(request: Request, form_data: LoanApprovedDocument
         data=response.get("data")
     )
 
-@router.delete("/delete-approved-document/{document_id}", summary="Delete Approve Loan Document")
+@router.delete("/delete-approved-document/{document_id}", summary="Delete Approve Loan Document", dependencies=[Depends(get_unit_of_work)])
 def delete_approved_loan_document(request: Request, document_id: str):
     user_state = getattr(request.state, "user", None)
 
@@ -139,7 +145,7 @@ def delete_approved_loan_document(request: Request, document_id: str):
         data=response.get("data")
     )
 
-@router.put("/update-approved-document/{document_id}", summary="Update Approve Loan Document")
+@router.put("/update-approved-document/{document_id}", summary="Update Approve Loan Document", dependencies=[Depends(get_unit_of_work)])
 def update_approved_loan_document(request: Request, document_id: str, form_data: LoanApprovedDocumentForm):
     user_state = getattr(request.state, "user", None)
 
@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Request
 from starlette import status
 
+from common.enums import PaginationMode, CountMode
 from common.response import ApiResponse
+from custom_middleware.public_routes import public_route
 from schemas.contact_us_schema import ContactUsCreateSchema, ContactUsUpdateSchema
 from services.contact_us_service import ContactUsService
 
@@ -10,7 +12,8 @@ contact_service = ContactUsService()
 
 
 @router.post("/create-contact-message", summary="Create a new contact entry")
-async def create_contact(request: Request, form_data: ContactUsCreateSchema):
+@public_route
+def create_contact(request: Request, form_data: ContactUsCreateSchema):
     response = contact_service.create_contact(form_data=form_data)
     return ApiResponse.create_response(
         success=response.get("success"),
@@ -21,14 +24,17 @@ async def create_contact(request: Request, form_data: ContactUsCreateSchema):
 
 
 @router.get("/get-all-contact-messages", summary="Get all contact entries")
-async def get_all_contacts(
+def get_all_contacts(
     search: str | None = None,
     order_by: str | None = None,
     order_direction: str | None = None,
     limit: int = 10,
     offset: int = 0,
     start_date: str | None = None,
-    end_date: str | None = None
+    end_date: str | None = None,
+    pagination: PaginationMode = PaginationMode.OFFSET,
+    cursor: str | None = None,
+    count_mode: CountMode = CountMode.ESTIMATE
 ):
     response = contact_service.get_all_contacts(
         search=search,
@@ -37,7 +43,10 @@ async def get_all_contacts(
         limit=limit,
         offset=offset,
         start_date=start_date,
-        end_date=end_date
+        end_date=end_date,
+        pagination=pagination,
+        cursor=cursor,
+        count_mode=count_mode
     )
     return ApiResponse.create_response(
         success=response.get("success"),
@@ -48,7 +57,7 @@ async def get_all_contacts(
 
 
 @router.put("/update-contact-message/{contact_id}", summary="Update a contact entry")
-async def update_contact(contact_id: str, form_data: ContactUsUpdateSchema, logged_in_user_id: str):
+def update_contact(contact_id: str, form_data: ContactUsUpdateSchema, logged_in_user_id: str):
     response = contact_service.update_contact(
         logged_in_user_id=logged_in_user_id,
         contact_id=contact_id,
@@ -63,7 +72,7 @@ async def update_contact(contact_id: str, form_data: ContactUsUpdateSchema, logg
 
 
 @router.delete("/delete-contact-message/{contact_id}", summary="Delete a contact entry")
-async def delete_contact(contact_id: str, logged_in_user_id: str):
+def delete_contact(contact_id: str, logged_in_user_id: str):
     response = contact_service.delete_contact(
         logged_in_user_id=logged_in_user_id, contact_id=contact_id)
     return ApiResponse.create_response(
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Request
 from starlette import status
 
 from common.response import ApiResponse
+from custom_middleware.public_routes import public_route
 from models.user import User
 from schemas.auth_schemas import LoginRequest, VerifyOTPRequest, RefreshToken, UpdateProfileRequest
 from services.auth_service import UserAuthService
@@ -11,6 +12,7 @@ auth_service = UserAuthService(User)
 
 
 @router.post("/send-otp", summary="Send OTP for Login")
+@public_route
 async def send_otp(request: Request, login_request: LoginRequest):
     response = auth_service.send_otp(login_request=login_request)
     return ApiResponse.create_response(
@@ -22,7 +24,8 @@ async def send_otp(request: Request, login_request: LoginRequest):
 
 
 @router.post("/verify-otp", summary="Verify OTP for Login")
-async def verify_otp(verify_otp_request: VerifyOTPRequest):
+@public_route
+def verify_otp(verify_otp_request: VerifyOTPRequest):
     response = auth_service.verify_otp(verify_otp_request=verify_otp_request)
     return ApiResponse.create_response(
         success=response.get("success"),
@@ -33,7 +36,8 @@ async def verify_otp(verify_otp_request: VerifyOTPRequest):
 
 
 @router.post("/refresh-token", summary="Refresh Access Token")
-async def refresh_token(token: RefreshToken):
+@public_route
+def refresh_token(token: RefreshToken):
     response = auth_service.refresh_token(token)
     return ApiResponse.create_response(
         success=response.get("success"),
@@ -44,7 +48,7 @@ async def refresh_token(token: RefreshToken):
 
 
 @router.put("/update-profile/{user_id}", summary="Update User Profile")
-async def update_profile(user_id: str, form_data: UpdateProfileRequest):
+def update_profile(user_id: str, form_data: UpdateProfileRequest):
     response = auth_service.update_profile(user_id, form_data=form_data)
 
     return ApiResponse.create_response(
@@ -56,7 +60,7 @@ async def update_profile(user_id: str, form_data: UpdateProfileRequest):
 
 
 @router.get("/get-profile/{user_id}", summary="Get User Profile")
-async def get_profile(user_id: str):
+def get_profile(user_id: str):
     response = auth_service.get_profile_details(user_id)
 
     return ApiResponse.create_response(
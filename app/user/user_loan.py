@@ -7,7 +7,7 @@ from common.enums import UploadFileType
 from common.response import ApiResponse
 from models.loan import LoanApplicant
 from schemas.loan_schemas import LoanForm, UserApprovedLoanForm, InstantCashForm, LoanConsentForm, LoanDisbursementForm, \
-    LoanAadharVerifiedStatusForm
+    LoanAadharVerifiedStatusForm, PresignedUploadForm, UploadCompleteForm
 from services.loan_service.user_loan import UserLoanService
 
 router = APIRouter(prefix="/loan", tags=["User Panel Loan API's"])
@@ -78,7 +78,31 @@ def get_loan_foreclosure_details(request: Request, loan_application_id: str):
 @router.post("/upload-file", summary="Upload Documents")
 async def upload_file(request: Request, file_type: UploadFileType = Form(...), files: List[UploadFile] = File(...)):
     user = getattr(request.state, "user", None)
-    response = await loan_service.upload_files_to_s3(file_type=file_type, files=files)
+    response = await loan_service.upload_files_to_s3(user_id=user.get("id"), file_type=file_type, files=files)
+
+    return ApiResponse.create_response(
+        success=response.get("success"),
+        message=response.get("message"),
+        status_code=response.get("status_code", status.HTTP_200_OK),
+        data=response.get("data")
+    )
+
+@router.post("/upload-url", summary="Create Direct Upload URL")
+async def create_upload_url(request: Request, form_data: PresignedUploadForm):
+    user_state = getattr(request.state, "user", None)
+    response = await loan_service.create_upload_url(user_id=user_state.get("id"), form_data=form_data)
+
+    return ApiResponse.create_response(
+        success=response.get("success"),
+        message=response.get("message"),
+        status_code=response.get("status_code", status.HTTP_200_OK),
+        data=response.get("data")
+    )
+
+@router.post("/upload-complete", summary="Complete Direct Upload")
+async def complete_upload(request: Request, form_data: UploadCompleteForm):
+    user_state = getattr(request.state, "user", None)
+    response = await loan_service.complete_upload(user_id=user_state.get("id"), form_data=form_data)
 
     return ApiResponse.create_response(
         success=response.get("success"),
@@ -3,21 +3,23 @@ from datetime import datetime, timedelta
 from fastapi import Request, Query
 from fastapi import APIRouter, Depends
 from starlette import status
+from starlette.concurrency import run_in_threadpool
 from db_domains.db import DBSession
+from db_domains.db_interface import DBInterface
 from sqlalchemy.orm import selectinload
-from models.loan import LoanApplicant, EmiScheduleDate
+from models.loan import LoanApplicant
 from models.razorpay import Plan, Subscription
 from services.plan_service import PlanService
 from services.subscription_service import SubscriptionService
 from services.foreclosure_service import ForeClosureService
 from services.payment_details_service import PaymentDetailsService
 from services.loan_service.user_loan import UserLoanService
-from services.razorpay_service import RazorpayService
+from services.razorpay_gateway import RazorpayGateway, gather_with_timeout
 from services.dependencies import get_razorpay_service
 from schemas.razorpay_schema import CreatePlanSchema, CreateSubscriptionSchema
-from common.utils import calculate_emi_schedule
+from common.utils import calculate_emi_schedule, resolve_emi_schedule_day
 from fastapi.responses import JSONResponse
-from db_domains.db_interface import DBInterface
+from app_logging import app_logger
 
 
 
@@ -29,22 +31,34 @@ sub_service = SubscriptionService(Subscription)
 foreclosure_service = ForeClosureService()
 payment_details_service = PaymentDetailsService()
 
-@router.post("/create-razorpay-plan-sub/{applicant_id}")
-def create_emi_mandate(
-    request: Request,
-    applicant_id: str,  # Assuming this is needed; otherwise, remove
-    service: RazorpayService = Depends(get_razorpay_service)
-):
-    user_state = getattr(request.state, "user", None)
-    if not user_state or "id" not in user_state:
-        return {
-            "success": False,
-            "message": "User authentication failed",
-            "status_code": status.HTTP_401_UNAUTHORIZED,
-            "data": {}
-        }
-
-    # Step 1: Fetch Loan Details
+def _serialize_plan(plan: Plan) -> dict:
+    return {
+        "id": plan.id,
+        "razorpay_plan_id": plan.razorpay_plan_id,
+        "period": plan.period,
+        "interval": plan.interval,
+        "item_name": plan.item_name,
+        "item_amount": plan.item_amount,
+        "item_currency": plan.item_currency
+    }
+
+
+def _serialize_subscription(subscription: Subscription) -> dict:
+    return {
+        "id": subscription.id,
+        "razorpay_subscription_id": subscription.razorpay_subscription_id,
+        "status": subscription.status.value,
+        "start_at": subscription.start_at if subscription.start_at else None,
+        "end_at": subscription.end_at if subscription.end_at else None,
+        "short_url": subscription.short_url if subscription.short_url else None
+    }
+
+
+def _load_emi_mandate(applicant_id: str) -> dict:
+    """
+    Database part of create_emi_mandate, run in the threadpool. Returns either a finished response
+    ("response") or the plain loan values the Razorpay calls need, the session is closed before they start.
+    """
     filters = [
         LoanApplicant.id == applicant_id,
         LoanApplicant.is_deleted == False
@@ -61,21 +75,21 @@ def create_emi_mandate(
         )
 
         if not loan_details:
-            return {
+            return {"response": {
                 "success": False,
                 "message": "Loan applicant not found",
                 "status_code": status.HTTP_404_NOT_FOUND,
                 "data": {}
-            }
+            }}
 
         # Step 2: Check for approval details
         if not loan_details.approval_details:
-            return {
+            return {"response": {
                 "success": False,
                 "message": "No approval details found for the applicant",
                 "status_code": status.HTTP_404_NOT_FOUND,
                 "data": {}
-            }
+            }}
 
         # Step 3: Check for existing plan/subscription (optional, based on requirements)
         if loan_details.plans:
@@ -83,33 +97,15 @@ def create_emi_mandate(
             subscription = first_plan.subscriptions[0] if first_plan.subscriptions else None
             if subscription:
                 # Serialize to avoid exposing raw SQLAlchemy objects
-                plan_data = {
-                    "id": first_plan.id,
-                    "razorpay_plan_id": first_plan.razorpay_plan_id,
-                    "period": first_plan.period,
-                    "interval": first_plan.interval,
-                    "item_name": first_plan.item_name,
-                    "item_amount": first_plan.item_amount,
-                    "item_currency": first_plan.item_currency
-                }
-                subscription_data = {
-                    "id": subscription.id,
-                    "razorpay_subscription_id": subscription.razorpay_subscription_id,
-                    "status": subscription.status.value,
-                    "start_at": subscription.start_at if subscription.start_at else None,
-                    "end_at": subscription.end_at if subscription.end_at else None,
-                    "short_url": subscription.short_url if subscription.short_url else None
-                    
-                }
-                return {
+                return {"response": {
                     "success": True,
                     "message": "Plan and subscription already exist",
                     "status_code": status.HTTP_200_OK,
                     "data": {
-                        "plan_data": plan_data,
-                        "subscription_data": subscription_data
+                        "plan_data": _serialize_plan(first_plan),
+                        "subscription_data": _serialize_subscription(subscription)
                     }
-                }
+                }}
 
         # Step 4: Fetch Approved Loan Details
         loan_approval_detail = loan_details.approval_details[0]
@@ -125,174 +121,181 @@ def create_emi_mandate(
             annual_interest_rate=approved_interest_rate,
             processing_fee=approved_processing_fee,
             is_fee_percentage=True,
-            loan_type=loan_details.loan_type,
-            emi_start_day_atm=loan_details.emi_start_day_atm
+            emi_schedule_day=resolve_emi_schedule_day(loan_details.loan_type, loan_details.emi_start_day_atm)
         )
         if emi_result["status_code"] != status.HTTP_200_OK:
-            return {
+            return {"response": {
                 "success": False,
                 "message": "Failed to calculate EMI",
                 "status_code": status.HTTP_400_BAD_REQUEST,
                 "data": {}
-            }
-        emi = emi_result["data"].get("monthly_emi", 0.0)
+            }}
 
-        # Step 6: Create Plan
+        emi_schedule_date = 5
         try:
-            created_plan = plan_service.add_plan(
-                applicant_id=loan_details.id,
-                user_id=user_state["id"],
-                form_data={
-                    "period": "monthly",
-                    "interval": 1,
-                    "item": {
-                        "name": f"{loan_details.loan_uid}_{datetime.now().strftime('%d%m%Y')}",
-                        "amount": int(emi * 100),  # Convert to paise, ensure integer
-                        "currency": "INR",
-                        "description": f"₹{user_accepted_amount} loan at {approved_interest_rate}% interest for {approved_tenure_months} months"
-                    }
-                }
-            )
-            if not created_plan:
-                return {
-                    "success": False,
-                    "message": "Failed to create plan",
-                    "status_code": status.HTTP_400_BAD_REQUEST,
-                    "data": {}
-                }
+            emi_schedule_date = int(resolve_emi_schedule_day(loan_details.loan_type))
+        except Exception as e:
+            print(f"Error fetching EMI schedule date: {e}")
 
-            # Step 7: Create Subscription
-            emi_schedule_date = 5
-            try:
-                emi_schedule_db_interface = DBInterface(EmiScheduleDate)
-                existing_entry = emi_schedule_db_interface.read_single_by_fields(
-                        fields=[
-                            EmiScheduleDate.emi_schedule_loan_type == loan_details.loan_type,
-                            EmiScheduleDate.is_deleted == False,
-                        ]
-                    )
-                emi_schedule_date = int(existing_entry.emi_schedule_date) if existing_entry else 5
-            except Exception as e:
-                print(f"Error fetching EMI schedule date: {e}")
-                
-            # NOTE: calculation for start_at date in unix value
-            # Get current date
-            current_date = datetime.now()
-
-            # Calculate the first day of the next month
-            if current_date.month == 12:
-                next_month = 1
-                next_year = current_date.year + 1
-            else:
-                next_month = current_date.month + 1
-                next_year = current_date.year
+        return {
+            "loan_id": loan_details.id,
+            "loan_uid": loan_details.loan_uid,
+            "user_accepted_amount": user_accepted_amount,
+            "approved_interest_rate": approved_interest_rate,
+            "approved_tenure_months": approved_tenure_months,
+            "emi": emi_result["data"].get("monthly_emi", 0.0),
+            "emi_schedule_date": emi_schedule_date
+        }
 
-            # Create datetime object for the emi_schedule_date of next month
-            try:
-                next_month_date = datetime(next_year, next_month, emi_schedule_date)
-            except ValueError:
-                # Handle case where emi_schedule_date is invalid for the month (e.g., 31st in February)
-                # Use the last day of the month instead
-                next_month_first = datetime(next_year, next_month, 1)
-                next_month_date = (next_month_first.replace(day=1, month=next_month % 12 + 1, year=next_year if next_month < 12 else next_year + 1) - timedelta(days=1))
-
-            # Convert to Unix timestamp (seconds since epoch)
-            unix_timestamp = int(time.mktime(next_month_date.timetuple()))
-            created_sub = sub_service.add_subscription(
-                plan_id=created_plan.id,
-                user_id=user_state["id"],
-                form_data={
-                    "plan_id": created_plan.razorpay_plan_id,
-                    "total_count": approved_tenure_months,
-                    "quantity": 1,
-                    "customer_notify": 1,
-                    "start_at": unix_timestamp
-                }
-            )
-            if not created_sub:
-                return {
-                    "success": False,
-                    "message": "Failed to create subscription",
-                    "status_code": status.HTTP_400_BAD_REQUEST,
-                    "data": {}
-                }
 
-            loan_details.emi_start_day_atm = emi_schedule_date
+@router.post("/create-razorpay-plan-sub/{applicant_id}")
+async def create_emi_mandate(
+    request: Request,
+    applicant_id: str,  # Assuming this is needed; otherwise, remove
+    service: RazorpayGateway = Depends(get_razorpay_service)
+):
+    user_state = getattr(request.state, "user", None)
+    if not user_state or "id" not in user_state:
+        return {
+            "success": False,
+            "message": "User authentication failed",
+            "status_code": status.HTTP_401_UNAUTHORIZED,
+            "data": {}
+        }
 
-            # Commit the transaction
-            session.commit()
+    # Steps 1-5: Loan, approval and EMI details, read off the event loop
+    mandate = await run_in_threadpool(_load_emi_mandate, applicant_id)
+    if "response" in mandate:
+        return mandate["response"]
 
-            # Serialize response
-            plan_data = {
-                "id": created_plan.id,
-                "razorpay_plan_id": created_plan.razorpay_plan_id,
-                "period": created_plan.period,
-                "interval": created_plan.interval,
-                "item_name": created_plan.item_name,
-                "item_amount": created_plan.item_amount,
-                "item_currency": created_plan.item_currency
-            }
-            subscription_data = {
-                "id": created_sub.id,
-                "razorpay_subscription_id": created_sub.razorpay_subscription_id,
-                "status": created_sub.status.value,
-                "start_at": created_sub.start_at if created_sub.start_at else None,
-                "end_at": created_sub.end_at if created_sub.end_at else None,
-                "short_url": created_sub.short_url if created_sub.short_url else None
-            }
+    user_accepted_amount = mandate["user_accepted_amount"]
+    approved_interest_rate = mandate["approved_interest_rate"]
+    approved_tenure_months = mandate["approved_tenure_months"]
+    emi = mandate["emi"]
 
-            return {
-                "success": True,
-                "message": "Successfully created plan and subscription",
-                "status_code": status.HTTP_201_CREATED,  # Use 201 for creation
-                "data": {
-                    "plan_data": plan_data,
-                    "subscription_data": subscription_data
+    # Step 6: Create Plan
+    try:
+        created_plan = await plan_service.add_plan(
+            applicant_id=mandate["loan_id"],
+            user_id=user_state["id"],
+            form_data={
+                "period": "monthly",
+                "interval": 1,
+                "item": {
+                    "name": f"{mandate['loan_uid']}_{datetime.now().strftime('%d%m%Y')}",
+                    "amount": int(emi * 100),  # Convert to paise, ensure integer
+                    "currency": "INR",
+                    "description": f"₹{user_accepted_amount} loan at {approved_interest_rate}% interest for {approved_tenure_months} months"
                 }
             }
-
-        except ValueError as ve:
-            session.rollback()
+        )
+        if not created_plan:
             return {
                 "success": False,
-                "message": f"Invalid input: {str(ve)}",
+                "message": "Failed to create plan",
                 "status_code": status.HTTP_400_BAD_REQUEST,
                 "data": {}
             }
-        except Exception as e:
-            session.rollback()
-            # Log the error internally (e.g., using logging module)
-            print(f"Error: {str(e)}")  # Replace with proper logging
+
+        # Step 7: Create Subscription
+        emi_schedule_date = mandate["emi_schedule_date"]
+
+        # NOTE: calculation for start_at date in unix value
+        # Get current date
+        current_date = datetime.now()
+
+        # Calculate the first day of the next month
+        if current_date.month == 12:
+            next_month = 1
+            next_year = current_date.year + 1
+        else:
+            next_month = current_date.month + 1
+            next_year = current_date.year
+
+        # Create datetime object for the emi_schedule_date of next month
+        try:
+            next_month_date = datetime(next_year, next_month, emi_schedule_date)
+        except ValueError:
+            # Handle case where emi_schedule_date is invalid for the month (e.g., 31st in February)
+            # Use the last day of the month instead
+            next_month_first = datetime(next_year, next_month, 1)
+            next_month_date = (next_month_first.replace(day=1, month=next_month % 12 + 1, year=next_year if next_month < 12 else next_year + 1) - timedelta(days=1))
+
+        # Convert to Unix timestamp (seconds since epoch)
+        unix_timestamp = int(time.mktime(next_month_date.timetuple()))
+        created_sub = await sub_service.add_subscription(
+            plan_id=created_plan.id,
+            user_id=user_state["id"],
+            form_data={
+                "plan_id": created_plan.razorpay_plan_id,
+                "total_count": approved_tenure_months,
+                "quantity": 1,
+                "customer_notify": 1,
+                "start_at": unix_timestamp
+            }
+        )
+        if not created_sub:
             return {
                 "success": False,
-                "message": "An error occurred while creating plan or subscription",
-                "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
-                "data": {
-                    "error": str(e)
-                }
+                "message": "Failed to create subscription",
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "data": {}
+            }
+
+        await run_in_threadpool(
+            DBInterface(LoanApplicant).update, _id=mandate["loan_id"], data={"emi_start_day_atm": emi_schedule_date}
+        )
+
+        return {
+            "success": True,
+            "message": "Successfully created plan and subscription",
+            "status_code": status.HTTP_201_CREATED,  # Use 201 for creation
+            "data": {
+                "plan_data": _serialize_plan(created_plan),
+                "subscription_data": _serialize_subscription(created_sub)
+            }
+        }
+
+    except ValueError as ve:
+        return {
+            "success": False,
+            "message": f"Invalid input: {str(ve)}",
+            "status_code": status.HTTP_400_BAD_REQUEST,
+            "data": {}
+        }
+    except Exception as e:
+        # Log the error internally (e.g., using logging module)
+        print(f"Error: {str(e)}")  # Replace with proper logging
+        return {
+            "success": False,
+            "message": "An error occurred while creating plan or subscription",
+            "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "data": {
+                "error": str(e)
             }
+        }
 
 @router.post("/create-emi-plan")
-def create_emi_plan(payload: CreatePlanSchema, service: RazorpayService = Depends(get_razorpay_service)):
+async def create_emi_plan(payload: CreatePlanSchema, service: RazorpayGateway = Depends(get_razorpay_service)):
     plan_data = payload.dict(exclude_none=True)  # exclude None values
-    plan = service.create_plan(plan_data)
+    plan = await service.create_plan(plan_data)
     return {"plan": plan}
 
 
 @router.post("/create-subscription")
-def create_subscription(payload: CreateSubscriptionSchema, service: RazorpayService = Depends(get_razorpay_service)):
+async def create_subscription(payload: CreateSubscriptionSchema, service: RazorpayGateway = Depends(get_razorpay_service)):
     subscription_data = payload.dict(exclude_none=True)
     if 'callback_url' in subscription_data:
         callback_url = "https://api.razorpay.com/"
         subscription_data['notes'] = subscription_data.get('notes', {})
         subscription_data['notes']['callback_url'] = str(callback_url)
-    subscription = service.create_subscription(subscription_data)
+    subscription = await service.create_subscription(subscription_data)
     return {"subscription": subscription}
 
 @router.get("/get-subscription/{subscription_id}")
-def get_subscription(subscription_id: str, service: RazorpayService = Depends(get_razorpay_service)):
+async def get_subscription(subscription_id: str, service: RazorpayGateway = Depends(get_razorpay_service)):
     try:
-        subscription = service.fetch_subscription(subscription_id)
+        subscription = await service.fetch_subscription(subscription_id)
         return {
                 "success": True,
                 "message": "Subscription Details Fetched Successfully!",
@@ -310,12 +313,12 @@ def get_subscription(subscription_id: str, service: RazorpayService = Depends(ge
             }
         
 @router.get("/get-subscription-invoices/{subscription_id}")
-def get_subscription_invoices(subscription_id: str, service: RazorpayService = Depends(get_razorpay_service), count: int = 10, skip: int = 0):
+async def get_subscription_invoices(subscription_id: str, service: RazorpayGateway = Depends(get_razorpay_service), count: int = 10, skip: int = 0):
     """
     Fetch all invoices for a given subscription with optional pagination params.
     """
     try:
-        invoices = service.fetch_invoices_for_subscription(subscription_id, count=count, skip=skip)
+        invoices = await service.fetch_invoices_for_subscription(subscription_id, count=count, skip=skip)
         return {
             "success": True,
             "message": "Invoices fetched successfully!",
@@ -330,15 +333,97 @@ def get_subscription_invoices(subscription_id: str, service: RazorpayService = D
             "data": {"error": str(e)}
         }
 
+def _load_closure(subscription_id: str) -> dict:
+    """
+    Database part of get_closure_payment_link, run in the threadpool. Returns either a finished response
+    ("response") or the plain values the Razorpay calls need.
+    """
+    filters = [
+        Subscription.razorpay_subscription_id == subscription_id,
+        Subscription.is_deleted == False
+    ]
+    with DBSession() as session:
+        local_subscription = (
+            session.query(Subscription)
+            .options(
+                selectinload(Subscription.plan),
+                selectinload(Subscription.plan).selectinload(Plan.applicant),
+                selectinload(Subscription.plan).selectinload(Plan.applicant).selectinload(LoanApplicant.approval_details)
+            )
+            .filter(*filters)
+            .first()
+        )
+
+        if not local_subscription:
+            return {"response": {
+                "success": False,
+                "message": "Subscription not found in DB",
+                "status_code": status.HTTP_404_NOT_FOUND,
+                "data": {}
+            }}
+
+        # Access loan details
+        loan = local_subscription.plan.applicant if local_subscription.plan else None
+        if not loan or not loan.approval_details:
+            return {"response": {
+                "success": False,
+                "message": "No loan or approval details associated with this subscription",
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "data": {}
+            }}
+
+        loan_approval_detail = loan.approval_details[0]
+
+        # Step 2: Calculate EMI schedule
+        emi_result = calculate_emi_schedule(
+            loan_amount=loan_approval_detail.user_accepted_amount,
+            tenure_months=loan_approval_detail.approved_tenure_months,
+            annual_interest_rate=loan_approval_detail.approved_interest_rate,
+            processing_fee=loan_approval_detail.approved_processing_fee,
+            is_fee_percentage=True,
+            emi_schedule_day=resolve_emi_schedule_day(loan.loan_type, loan.emi_start_day_atm),
+        )
+        if not emi_result:
+            return {"response": {
+                "success": False,
+                "message": "Failed to calculate EMI schedule",
+                "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "data": {}
+            }}
+
+        return {
+            "local_subscription_id": local_subscription.id,
+            "user_accepted_amount": loan_approval_detail.user_accepted_amount,
+            "emi_result": emi_result,
+            "razorpay_plan_id": local_subscription.plan.razorpay_plan_id,
+            "stored_plan_data": local_subscription.plan.plan_data
+        }
+
+
 @router.get("/get-closure-payment-link/{subscription_id}")
-def get_closure_payment_link(
+async def get_closure_payment_link(
     subscription_id: str,
     callback_url: str = Query(..., description="URL to redirect after payment"),
-    service: RazorpayService = Depends(get_razorpay_service)
+    service: RazorpayGateway = Depends(get_razorpay_service)
 ):
     try:
-        # Step 1: Fetch subscription from Razorpay
-        sub = service.fetch_subscription(subscription_id)
+        # Steps 1-2: Local subscription, loan and EMI schedule, read off the event loop
+        closure = await run_in_threadpool(_load_closure, subscription_id)
+        if "response" in closure:
+            return closure["response"]
+
+        user_accepted_amount = closure["user_accepted_amount"]
+        emi_result = closure["emi_result"]
+        razorpay_plan_id = closure["razorpay_plan_id"]
+        stored_plan_data = closure["stored_plan_data"]
+
+        # Step 3: Fetch subscription and plan from Razorpay concurrently
+        sub, plan = await gather_with_timeout(
+            service.fetch_subscription(subscription_id),
+            service.fetch_plan(razorpay_plan_id)
+        )
+        if isinstance(sub, Exception):
+            raise sub
         if not sub:
             return {
                 "success": False,
@@ -347,8 +432,10 @@ def get_closure_payment_link(
                 "data": {}
             }
 
-        # Step 2: Fetch plan from Razorpay
-        plan = service.fetch_plan(sub['plan_id'])
+        # Step 4: The plan is only checked for existence, the stored copy will do when Razorpay fails
+        if isinstance(plan, Exception):
+            app_logger.warning(f"[Closure Payment Link] Plan fetch failed for {razorpay_plan_id}: {plan!r}")
+            plan = stored_plan_data
         if not plan:
             return {
                 "success": False,
@@ -357,65 +444,6 @@ def get_closure_payment_link(
                 "data": {}
             }
 
-        # Step 3: Fetch local subscription details with related entities
-        filters = [
-            Subscription.razorpay_subscription_id == subscription_id,
-            Subscription.is_deleted == False
-        ]
-        with DBSession() as session:
-            local_subscription = (
-                session.query(Subscription)
-                .options(
-                    selectinload(Subscription.plan),
-                    selectinload(Subscription.plan).selectinload(Plan.applicant),
-                    selectinload(Subscription.plan).selectinload(Plan.applicant).selectinload(LoanApplicant.approval_details)
-                )
-                .filter(*filters)
-                .first()
-            )
-
-            if not local_subscription:
-                return {
-                    "success": False,
-                    "message": "Subscription not found in DB",
-                    "status_code": status.HTTP_404_NOT_FOUND,
-                    "data": {}
-                }
-
-            # Access loan details
-            loan = local_subscription.plan.applicant if local_subscription.plan else None
-            if not loan or not loan.approval_details:
-                return {
-                    "success": False,
-                    "message": "No loan or approval details associated with this subscription",
-                    "status_code": status.HTTP_400_BAD_REQUEST,
-                    "data": {}
-                }
-
-            loan_approval_detail = loan.approval_details[0]
-            user_accepted_amount = loan_approval_detail.user_accepted_amount
-            approved_interest_rate = loan_approval_detail.approved_interest_rate
-            approved_tenure_months = loan_approval_detail.approved_tenure_months
-            approved_processing_fee = loan_approval_detail.approved_processing_fee
-
-            # Step 4: Calculate EMI schedule
-            emi_result = calculate_emi_schedule(
-                loan_amount=user_accepted_amount,
-                tenure_months=approved_tenure_months,
-                annual_interest_rate=approved_interest_rate,
-                processing_fee=approved_processing_fee,
-                is_fee_percentage=True,
-                loan_type=loan.loan_type,
-                emi_start_day_atm=loan.emi_start_day_atm,
-            )
-            if not emi_result:
-                return {
-                    "success": False,
-                    "message": "Failed to calculate EMI schedule",
-                    "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    "data": {}
-                }
-
         # Step 5: Validate and compute foreclosure amount from EMI schedule
         required_sub_keys = ['paid_count', 'total_count', 'remaining_count']
         if not all(key in sub for key in required_sub_keys):
@@ -458,7 +486,7 @@ def get_closure_payment_link(
         max_retries = 3  # To handle duplicate reference_id
         for attempt in range(max_retries):
             try:
-                payment = service.create_payment_link(
+                payment = await service.create_payment_link(
                     amount=foreclosure_amt * 100,
                     currency="INR",
                     description="Closure Payment",
@@ -486,12 +514,12 @@ def get_closure_payment_link(
 
         # Step 7: Create foreclosure and payment details in DB
         foreclosure_data = {
-            "subscription_id": local_subscription.id,
+            "subscription_id": closure["local_subscription_id"],
             "amount": foreclosure_amt,
             "reason": "Subscription Closure",
             "status": "pending"
         }
-        foreclosure_response = foreclosure_service.create_foreclosure(foreclosure_data)
+        foreclosure_response = await run_in_threadpool(foreclosure_service.create_foreclosure, foreclosure_data)
         if not foreclosure_response['success']:
             return {
                 "success": False,
@@ -508,7 +536,9 @@ def get_closure_payment_link(
             "payment_method": None,
             "foreclosure_id": foreclosure_response["data"].id
         }
-        payment_details_response = payment_details_service.create_payment_details(payment_details_data)
+        payment_details_response = await run_in_threadpool(
+            payment_details_service.create_payment_details, payment_details_data
+        )
         if not payment_details_response['success']:
             return {
                 "success": False,
@@ -562,12 +592,12 @@ def get_closure_payment_link(
         }
         
 @router.get("/get-payment-details/{payment_id}")
-def get_payment_details(payment_id: str, service: RazorpayService = Depends(get_razorpay_service)):
+async def get_payment_details(payment_id: str, service: RazorpayGateway = Depends(get_razorpay_service)):
     """
     API to fetch payment details from Razorpay.
     """
     try:
-        payment_link_details = service.get_payment_link_details(payment_id)
+        payment_link_details = await service.get_payment_link_details(payment_id)
         return {
             "success": True,
             "message": "Payment link details fetched successfully!",
@@ -0,0 +1,189 @@
+import calendar
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Dict, List, Sequence, Union
+
+import numpy as np
+
+# Python round() is correctly rounded, numpy's is rint(x * 100) / 100. They only disagree when x * 100 lands
+# next to a .5 boundary, so those few values are re-rounded with Python round().
+_TIE_TOLERANCE = 1e-6
+
+
+def round2(values: np.ndarray) -> np.ndarray:
+    """
+    Round to 2 decimals with exactly the result of Python's round(value, 2) for every element.
+    """
+    rounded = np.round(values, 2)
+    scaled = values * 100
+    near_tie = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < _TIE_TOLERANCE
+    if near_tie.any():
+        for position in zip(*np.nonzero(near_tie)):
+            rounded[position] = round(float(values[position]), 2)
+    return rounded
+
+
+def monthly_emi(loan_amount: float, annual_interest_rate: float, tenure_months: int) -> float:
+    """
+    Standard reducing balance EMI. Interest free loans are repaid in equal instalments.
+    """
+    monthly_rate = annual_interest_rate / 12 / 100
+    if monthly_rate == 0:
+        return loan_amount / tenure_months
+    return (loan_amount * monthly_rate * (1 + monthly_rate) ** tenure_months) / (
+            (1 + monthly_rate) ** tenure_months - 1
+    )
+
+
+@dataclass
+class AmortizationResult:
+    """
+    Month-wise breakdown for a batch of loans. The month arrays have one row per loan and one column per month
+    up to the longest tenure. Columns past a loan's own tenure are zero and must be ignored.
+    `clamped` marks the months where the balance went below zero and was set to 0.
+    """
+    emi: np.ndarray
+    tenure_months: np.ndarray
+    interest: np.ndarray
+    principal: np.ndarray
+    balance: np.ndarray
+    clamped: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.emi)
+
+    def total_interest(self, loan_index: int) -> float:
+        # Python sum keeps the left to right float addition of the original loop
+        return sum(self.interest[loan_index, :self.tenure_months[loan_index]].tolist())
+
+
+def amortize(
+        loan_amounts: Sequence[float], annual_interest_rates: Sequence[float], tenure_months: Sequence[int]
+) -> AmortizationResult:
+    """
+    Amortize many loans at once. Each month depends on the rounded balance of the previous one, so months are
+    stepped in order while every step is a single array operation across all the loans.
+    """
+    loan_amounts = np.asarray(loan_amounts, dtype=np.float64)
+    annual_interest_rates = np.asarray(annual_interest_rates, dtype=np.float64)
+    tenures = np.asarray(tenure_months, dtype=np.int64)
+    if loan_amounts.shape != annual_interest_rates.shape or loan_amounts.shape != tenures.shape:
+        raise ValueError("loan_amounts, annual_interest_rates and tenure_months must have the same length")
+    if (loan_amounts <= 0).any() or (tenures <= 0).any():
+        raise ValueError("Principal and tenure must be greater than zero.")
+
+    loan_count = len(loan_amounts)
+    max_tenure = int(tenures.max()) if loan_count else 0
+    monthly_rates = annual_interest_rates / 12 / 100
+    # Scalar EMI per loan, so it is bit-identical to the float expression used so far
+    emi = np.array([
+        monthly_emi(float(amount), float(rate), int(tenure))
+        for amount, rate, tenure in zip(loan_amounts, annual_interest_rates, tenures)
+    ], dtype=np.float64)
+
+    interest = np.zeros((loan_count, max_tenure))
+    principal = np.zeros((loan_count, max_tenure))
+    balance = np.zeros((loan_count, max_tenure))
+    clamped = np.zeros((loan_count, max_tenure), dtype=bool)
+
+    if loan_count == 1:
+        # Array calls on a single loan cost more than they save, step it with plain floats instead
+        _amortize_single(float(loan_amounts[0]), float(monthly_rates[0]), float(emi[0]), int(tenures[0]),
+                         interest[0], principal[0], balance[0], clamped[0])
+        return AmortizationResult(
+            emi=emi, tenure_months=tenures, interest=interest, principal=principal, balance=balance, clamped=clamped
+        )
+
+    current_balance = loan_amounts.copy()
+    for month in range(max_tenure):
+        active = tenures > month
+        month_interest = round2(current_balance * monthly_rates)
+        month_principal = round2(emi - month_interest)
+        month_balance = round2(current_balance - month_principal)
+        below_zero = month_balance < 0
+        month_balance[below_zero] = 0
+
+        interest[:, month] = np.where(active, month_interest, 0)
+        principal[:, month] = np.where(active, month_principal, 0)
+        balance[:, month] = np.where(active, month_balance, 0)
+        clamped[:, month] = active & below_zero
+        current_balance = np.where(active, month_balance, current_balance)
+
+    return AmortizationResult(
+        emi=emi, tenure_months=tenures, interest=interest, principal=principal, balance=balance, clamped=clamped
+    )
+
+
+def _amortize_single(
+        loan_amount: float, monthly_rate: float, emi: float, tenure_months: int,
+        interest: np.ndarray, principal: np.ndarray, balance: np.ndarray, clamped: np.ndarray
+) -> None:
+    interest_paid, principal_paid, balances, was_clamped = [], [], [], []
+    current_balance = loan_amount
+    for _ in range(tenure_months):
+        month_interest = round(current_balance * monthly_rate, 2)
+        month_principal = round(emi - month_interest, 2)
+        current_balance = round(current_balance - month_principal, 2)
+        was_clamped.append(current_balance < 0)
+        current_balance = max(current_balance, 0)
+        interest_paid.append(month_interest)
+        principal_paid.append(month_principal)
+        balances.append(current_balance)
+    interest[:] = interest_paid
+    principal[:] = principal_paid
+    balance[:] = balances
+    clamped[:] = was_clamped
+
+
+def first_emi_month(start_date: Union[date, datetime]) -> tuple[int, int]:
+    """
+    (year, month) the schedule counts from: the start month, or the next one when starting on the 25th or later.
+    The first instalment falls one month after it.
+    """
+    year, month = start_date.year, start_date.month
+    if start_date.day >= 25:
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return year, month
+
+
+def schedule_labels(start_date: Union[date, datetime], tenure_months: int, emi_schedule_day: int) -> List[str]:
+    year, month = first_emi_month(start_date)
+    month_index = year * 12 + (month - 1)
+    labels = []
+    for offset in range(1, tenure_months + 1):
+        label_year, label_month = divmod(month_index + offset, 12)
+        labels.append(f"{emi_schedule_day} {calendar.month_abbr[label_month + 1]} {label_year}")
+    return labels
+
+
+def schedule_rows(result: AmortizationResult, loan_index: int, labels: List[str]) -> List[Dict[str, Any]]:
+    """
+    Build the schedule rows returned by the API for one loan of the batch.
+    """
+    tenure = int(result.tenure_months[loan_index])
+    emi = float(result.emi[loan_index])
+    emi_2 = round(emi, 2)
+    emi_0 = round(emi, 0)
+    interest = result.interest[loan_index, :tenure].tolist()
+    principal = result.principal[loan_index, :tenure].tolist()
+    balance = result.balance[loan_index, :tenure].tolist()
+    clamped = result.clamped[loan_index, :tenure].tolist()
+
+    rows = []
+    for label, month_interest, month_principal, month_balance, was_clamped in zip(
+            labels, interest, principal, balance, clamped
+    ):
+        # A clamped balance has always been the int 0 from max(balance, 0)
+        month_balance = 0 if was_clamped else month_balance
+        rows.append({
+            "month": label,
+            "principal_paid": month_principal,
+            "interest_paid": month_interest,
+            "emi": emi_2,
+            "balance": month_balance,
+            "show_balance": int(month_balance),
+            "show_principal_paid": int(month_principal),
+            "show_interest_paid": int(month_interest),
+            "show_emi": emi_0,
+        })
+    return rows
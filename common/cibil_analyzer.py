@@ -0,0 +1,190 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app_logging import app_logger
+from db_domains import naive_utc_now
+
+# Payment history is a run of 3 character month blocks, "000" is a month paid on time
+_BLOCK = 3
+_ON_TIME = "000"
+
+
+@dataclass
+class CibilAnalysis:
+    credit_used: int = 0
+    credit_limit: int = 0
+    on_time_blocks: int = 0
+    history_blocks: int = 0
+    oldest_opened: Optional[date] = None
+    account_count: int = 0
+    # Account type -> number of accounts
+    account_mix: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def utilization_percent(self) -> float:
+        return round((self.credit_used / self.credit_limit) * 100, 2) if self.credit_limit > 0 else 0
+
+    @property
+    def payment_history_percent(self) -> float:
+        return round((self.on_time_blocks / self.history_blocks) * 100, 2) if self.history_blocks > 0 else 0
+
+    def credit_age(self, today: Optional[date] = None) -> Tuple[int, int]:
+        """
+        Years and months since the oldest account was opened.
+        """
+        if self.oldest_opened is None:
+            return 0, 0
+        today = today or date.today()
+        years = today.year - self.oldest_opened.year
+        months = today.month - self.oldest_opened.month
+        if months < 0:
+            years -= 1
+            months += 12
+        return years, months
+
+    def summary_columns(self) -> Dict[str, Any]:
+        """
+        Values of the UserCibilReport summary columns.
+        """
+        return {
+            "payment_on_time_count": self.on_time_blocks,
+            "payment_history_count": self.history_blocks,
+            "payment_history_percent": self.payment_history_percent,
+            "credit_used_amount": self.credit_used,
+            "credit_limit_amount": self.credit_limit,
+            "credit_utilization_percent": self.utilization_percent,
+            "oldest_account_opened_on": self.oldest_opened,
+            "loan_account_count": self.account_count
+        }
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    if not isinstance(value, str):
+        return None
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        app_logger.warning(f"Skipping account due to invalid date: {value}")
+        return None
+
+
+def _count_history(history: str) -> Tuple[int, int]:
+    """
+    On time and total numeric month blocks of a payment history string. A trailing partial block is ignored.
+    """
+    on_time = total = 0
+    for start in range(0, len(history) - len(history) % _BLOCK, _BLOCK):
+        block = history[start:start + _BLOCK]
+        if block.isdecimal():
+            total += 1
+            if block == _ON_TIME:
+                on_time += 1
+    return on_time, total
+
+
+def analyze_accounts(accounts: Iterable[Dict[str, Any]]) -> CibilAnalysis:
+    """
+    Every metric in one pass over the accounts.
+    """
+    analysis = CibilAnalysis()
+    for acc in accounts:
+        analysis.account_count += 1
+        account_type = acc.get("accountType", "") or ""
+        analysis.account_mix[account_type] = analysis.account_mix.get(account_type, 0) + 1
+
+        # Credit utilization of open credit cards
+        lowered_type = account_type.lower()
+        if "credit card" in lowered_type and "closed" not in (acc.get("accountStatus", "") or "").lower():
+            try:
+                high = int(acc.get("highCreditAmount", 0))
+                balance = int(acc.get("currentBalance", 0))
+                if high > 0 and balance >= 0:
+                    analysis.credit_used += balance
+                    analysis.credit_limit += high
+            except (ValueError, TypeError) as e:
+                app_logger.warning(f"Skipping credit card due to error: {e}")
+
+        payment_history = acc.get("paymentHistory", "")
+        if isinstance(payment_history, str):
+            on_time, total = _count_history(payment_history)
+            analysis.on_time_blocks += on_time
+            analysis.history_blocks += total
+
+        opened = _parse_date(acc.get("dateOpened"))
+        if opened is not None and (analysis.oldest_opened is None or opened < analysis.oldest_opened):
+            analysis.oldest_opened = opened
+    return analysis
+
+
+def report_accounts(credit_report: Any) -> List[Dict[str, Any]]:
+    if isinstance(credit_report, list) and credit_report:
+        return credit_report[0].get("accounts", []) or []
+    return []
+
+
+def analyze_credit_report(credit_report: Any) -> CibilAnalysis:
+    return analyze_accounts(report_accounts(credit_report))
+
+
+def build_cibil_summary(credit_report: Any) -> Dict[str, Any]:
+    """
+    Summary columns of a UserCibilReport, computed from the vendor credit_report once when the report is stored.
+    """
+    return {
+        **analyze_credit_report(credit_report).summary_columns(),
+        "summary_computed_at": naive_utc_now()
+    }
+
+
+def analyze_reports(credit_reports: Iterable[Tuple[Any, Any]]) -> Dict[Any, CibilAnalysis]:
+    """
+    Analyse many reports, given as (key, credit_report) pairs such as (report id, JSON), for portfolio scans.
+    """
+    return {key: analyze_credit_report(credit_report) for key, credit_report in credit_reports}
+
+
+def portfolio_risk(analyses: Iterable[CibilAnalysis], today: Optional[date] = None) -> Dict[str, Any]:
+    """
+    Aggregate risk view over analysed reports: utilization and payment history bands, thin files, the
+    account mix and the average metrics.
+    """
+    today = today or date.today()
+    utilization_bands = {"<=10": 0, "<=30": 0, "<=50": 0, ">50": 0}
+    history_bands = {"100": 0, ">=95": 0, "<95": 0, "no_history": 0}
+    count = thin_files = 0
+    total_utilization = total_history = 0.0
+    account_mix: Dict[str, int] = {}
+    for analysis in analyses:
+        count += 1
+        for account_type, accounts in analysis.account_mix.items():
+            account_mix[account_type] = account_mix.get(account_type, 0) + accounts
+        utilization = analysis.utilization_percent
+        total_utilization += utilization
+        band = "<=10" if utilization <= 10 else "<=30" if utilization <= 30 else "<=50" if utilization <= 50 else ">50"
+        utilization_bands[band] += 1
+
+        history = analysis.payment_history_percent
+        total_history += history
+        if analysis.history_blocks == 0:
+            history_bands["no_history"] += 1
+        else:
+            history_bands["100" if history == 100 else ">=95" if history >= 95 else "<95"] += 1
+
+        years, months = analysis.credit_age(today)
+        if years * 12 + months < 24 or analysis.account_count <= 1:
+            thin_files += 1
+
+    return {
+        "reports": count,
+        "average_utilization_percent": round(total_utilization / count, 2) if count else 0,
+        "average_payment_history_percent": round(total_history / count, 2) if count else 0,
+        "utilization_bands": utilization_bands,
+        "payment_history_bands": history_bands,
+        "thin_files": thin_files,
+        "account_mix": account_mix
+    }
@@ -1,11 +1,29 @@
+import asyncio
 import mimetypes
+from typing import Any, Optional
 
 import aioboto3
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
+from botocore.exceptions import ClientError
 
-from common.cache_string import gettext
 from config import app_config
 
+S3_FILE_TYPES = ["aadhar_card", "pan_card", "income_proof", "self_employed", "salaried", "profile_image",
+                 "property_documents"]
+
+# One S3 client for the whole process, its connection pool is reused by every upload
+_s3_client: Optional[Any] = None
+_s3_client_context: Optional[Any] = None
+_s3_client_lock: Optional[asyncio.Lock] = None
+
+
+async def close_s3_client() -> None:
+    global _s3_client, _s3_client_context
+    if _s3_client_context is not None:
+        await _s3_client_context.__aexit__(None, None, None)
+    _s3_client, _s3_client_context = None, None
+
 
 class AWSClient:
     """Handles AWS authentication and S3 client creation."""
@@ -15,35 +33,116 @@ class AWSClient:
         self.AWS_SECRET_KEY = app_config.AWS_SECRET_KEY
         self.AWS_REGION = app_config.AWS_REGION
         self.S3_BUCKET_NAME = app_config.AWS_BUCKET_NAME
+        self.S3_ENDPOINT_URL = app_config.AWS_S3_ENDPOINT_URL
+        self.transfer_config = TransferConfig(
+            multipart_threshold=app_config.S3_MULTIPART_THRESHOLD_BYTES,
+            multipart_chunksize=app_config.S3_MULTIPART_CHUNK_BYTES,
+            max_concurrency=app_config.S3_MULTIPART_CONCURRENCY,
+            max_io_queue=1
+        )
 
     async def get_s3_client(self):
-        """Returns an async S3 client session."""
-        try:
-            session = aioboto3.Session()
-            return session.client("s3", aws_access_key_id=self.AWS_ACCESS_KEY,
-                                  aws_secret_access_key=self.AWS_SECRET_KEY,
-                                  region_name=self.AWS_REGION, config=Config(signature_version='s3v4'))
-        except Exception as e:
-            print(e)
-            return {"success": False, "message": gettext("aws_client_error"), "status_code": 422, "data": []}
+        """Returns the shared async S3 client, opening it on first use."""
+        global _s3_client, _s3_client_context, _s3_client_lock
+        if _s3_client is not None:
+            return _s3_client
+        if _s3_client_lock is None:
+            _s3_client_lock = asyncio.Lock()
+        async with _s3_client_lock:
+            if _s3_client is None:
+                session = aioboto3.Session()
+                context = session.client(
+                    "s3", aws_access_key_id=self.AWS_ACCESS_KEY, aws_secret_access_key=self.AWS_SECRET_KEY,
+                    region_name=self.AWS_REGION, endpoint_url=self.S3_ENDPOINT_URL,
+                    config=Config(signature_version='s3v4', max_pool_connections=app_config.S3_MAX_POOL_CONNECTIONS)
+                )
+                _s3_client = await context.__aenter__()
+                _s3_client_context = context
+        return _s3_client
+
+    def _s3_key(self, file_name: str, file_type: str) -> str:
+        if file_type not in S3_FILE_TYPES:
+            raise ValueError("Invalid file type for S3 upload.")
+        return f"{file_type}/{file_name}"
+
+    def object_url(self, s3_key: str) -> str:
+        if self.S3_ENDPOINT_URL:
+            return f"{self.S3_ENDPOINT_URL.rstrip('/')}/{self.S3_BUCKET_NAME}/{s3_key}"
+        return f"https://{self.S3_BUCKET_NAME}.s3.{self.AWS_REGION}.amazonaws.com/{s3_key}"
 
     async def upload_to_s3(self, file_name: str, binary_data: bytes, file_type: str) -> dict:
         """Uploads a file to S3 and returns the S3 Object URL."""
-        async with await self.get_s3_client() as s3_client:
-            if file_type in ["aadhar_card", "pan_card", "income_proof", "self_employed", "salaried", "profile_image", "property_documents"]:
-                s3_key = f"{file_type}/{file_name}"
-            else:
-                raise ValueError("Invalid file type for S3 upload.")
-
-            content_type, _ = mimetypes.guess_type(file_name)
-            content_type = content_type or "application/octet-stream"
-
-            await s3_client.put_object(
-                Bucket=self.S3_BUCKET_NAME,
-                Key=s3_key,
-                Body=binary_data,
-                ContentType=content_type
-            )
-
-            s3_object_url = f"https://{self.S3_BUCKET_NAME}.s3.{self.AWS_REGION}.amazonaws.com/{s3_key}"
-            return {"s3_object_url": s3_object_url}
+        s3_client = await self.get_s3_client()
+        s3_key = self._s3_key(file_name, file_type)
+
+        content_type, _ = mimetypes.guess_type(file_name)
+        content_type = content_type or "application/octet-stream"
+
+        await s3_client.put_object(
+            Bucket=self.S3_BUCKET_NAME,
+            Key=s3_key,
+            Body=binary_data,
+            ContentType=content_type
+        )
+        return {"s3_object_url": self.object_url(s3_key)}
+
+    async def upload_fileobj_to_s3(self, file_name: str, fileobj: Any, file_type: str,
+                                   content_type: Optional[str] = None) -> dict:
+        """
+        Streams a file object to S3. Files above the multipart threshold go up in parts, so only a few
+        chunks are held in memory at a time.
+        """
+        s3_client = await self.get_s3_client()
+        s3_key = self._s3_key(file_name, file_type)
+        content_type = content_type or mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+
+        await s3_client.upload_fileobj(
+            fileobj,
+            self.S3_BUCKET_NAME,
+            s3_key,
+            ExtraArgs={"ContentType": content_type},
+            Config=self.transfer_config
+        )
+        return {"s3_object_url": self.object_url(s3_key), "key": s3_key}
+
+
+    async def create_presigned_post(self, file_name: str, file_type: str, content_type: str, user_id: int,
+                                    max_bytes: int, expires_in: int) -> dict:
+        """
+        Presigned POST for a browser upload straight to S3. S3 itself enforces the content type, the size
+        limit and the uploader id stored in the object metadata.
+        """
+        s3_client = await self.get_s3_client()
+        s3_key = self._s3_key(file_name, file_type)
+        fields = {"Content-Type": content_type, "x-amz-meta-user-id": str(user_id)}
+        presigned = await s3_client.generate_presigned_post(
+            Bucket=self.S3_BUCKET_NAME,
+            Key=s3_key,
+            Fields=fields,
+            Conditions=[
+                {"Content-Type": content_type},
+                {"x-amz-meta-user-id": str(user_id)},
+                ["content-length-range", 1, max_bytes]
+            ],
+            ExpiresIn=expires_in
+        )
+        return {
+            "url": presigned["url"],
+            "fields": presigned["fields"],
+            "key": s3_key,
+            "s3_object_url": self.object_url(s3_key),
+            "expires_in": expires_in
+        }
+
+    async def head_object(self, s3_key: str) -> Optional[dict]:
+        s3_client = await self.get_s3_client()
+        try:
+            return await s3_client.head_object(Bucket=self.S3_BUCKET_NAME, Key=s3_key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            raise
+
+    async def delete_object(self, s3_key: str) -> None:
+        s3_client = await self.get_s3_client()
+        await s3_client.delete_object(Bucket=self.S3_BUCKET_NAME, Key=s3_key)
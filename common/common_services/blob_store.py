@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+import boto3
+import zstandard
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from config import app_config
+
+
+class BlobStore(ABC):
+    """
+    Content-addressed store of zstd compressed blobs. A blob's reference is the sha256 of its uncompressed
+    bytes, so storing the same content twice keeps one copy.
+    """
+
+    def __init__(self, level: int = app_config.CREDIT_REPORT_ZSTD_LEVEL) -> None:
+        self.level = level
+        # zstd contexts are not thread safe, each thread gets its own
+        self._local = threading.local()
+
+    def _compressor(self) -> zstandard.ZstdCompressor:
+        if not hasattr(self._local, "compressor"):
+            self._local.compressor = zstandard.ZstdCompressor(level=self.level)
+            self._local.decompressor = zstandard.ZstdDecompressor()
+        return self._local.compressor
+
+    def _decompressor(self) -> zstandard.ZstdDecompressor:
+        self._compressor()
+        return self._local.decompressor
+
+    def put(self, data: bytes) -> str:
+        ref = hashlib.sha256(data).hexdigest()
+        if not self._exists(ref):
+            self._write(ref, self._compressor().compress(data))
+        return ref
+
+    def get(self, ref: str) -> bytes:
+        return self._decompressor().decompress(self._read(ref))
+
+    @abstractmethod
+    def _exists(self, ref: str) -> bool:
+        ...
+
+    @abstractmethod
+    def _write(self, ref: str, compressed: bytes) -> None:
+        ...
+
+    @abstractmethod
+    def _read(self, ref: str) -> bytes:
+        ...
+
+
+class LocalBlobStore(BlobStore):
+    def __init__(self, root: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.root = root
+
+    def _path(self, ref: str) -> str:
+        return os.path.join(self.root, ref[:2], ref[2:4], f"{ref}.zst")
+
+    def _exists(self, ref: str) -> bool:
+        return os.path.exists(self._path(ref))
+
+    def _write(self, ref: str, compressed: bytes) -> None:
+        path = self._path(ref)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Written under a temporary name first, readers never see a partial blob
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(compressed)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _read(self, ref: str) -> bytes:
+        with open(self._path(ref), "rb") as blob_file:
+            return blob_file.read()
+
+
+class S3BlobStore(BlobStore):
+    def __init__(self, bucket: str, prefix: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.client = boto3.client(
+            "s3", aws_access_key_id=app_config.AWS_ACCESS_KEY, aws_secret_access_key=app_config.AWS_SECRET_KEY,
+            region_name=app_config.AWS_REGION, endpoint_url=app_config.AWS_S3_ENDPOINT_URL,
+            config=Config(signature_version='s3v4')
+        )
+
+    def _key(self, ref: str) -> str:
+        return f"{self.prefix}/{ref[:2]}/{ref}.zst"
+
+    def _exists(self, ref: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._key(ref))
+            return True
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return False
+            raise
+
+    def _write(self, ref: str, compressed: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket, Key=self._key(ref), Body=compressed,
+                               ContentType="application/zstd")
+
+    def _read(self, ref: str) -> bytes:
+        return self.client.get_object(Bucket=self.bucket, Key=self._key(ref))["Body"].read()
+
+
+_credit_report_store: Optional[BlobStore] = None
+
+
+def get_credit_report_store() -> BlobStore:
+    global _credit_report_store
+    if _credit_report_store is None:
+        if app_config.CREDIT_REPORT_STORE_BACKEND == "s3":
+            _credit_report_store = S3BlobStore(
+                bucket=app_config.CREDIT_REPORT_STORE_BUCKET or app_config.AWS_BUCKET_NAME,
+                prefix=app_config.CREDIT_REPORT_STORE_PREFIX
+            )
+        else:
+            _credit_report_store = LocalBlobStore(root=app_config.CREDIT_REPORT_STORE_PATH)
+    return _credit_report_store
+
+
+def save_credit_report(credit_report: Any) -> str:
+    """
+    Store a vendor credit report and return its reference for UserCibilReport.credit_report_ref.
+    """
+    # Canonical JSON, the same report always maps to the same reference
+    data = json.dumps(credit_report, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return get_credit_report_store().put(data)
+
+
+def load_credit_report(ref: str) -> Any:
+    return json.loads(get_credit_report_store().get(ref))
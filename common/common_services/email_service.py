@@ -5,6 +5,11 @@ from dotenv import load_dotenv
 
 # Configure logging
 from app_logging import app_logger
+from common.enums import EmailOutboxStatus
+from config import app_config
+from db_domains import naive_utc_now
+from db_domains.db_interface import DBInterface
+from models.email import EmailOutbox
 
 # Load environment variables
 load_dotenv()
@@ -13,30 +18,59 @@ class EmailService:
     def __init__(self):
         self.smtp_user_email = os.environ.get("SMTP_USER_EMAIL")
         self.smtp_password = os.environ.get("SMTP_PASSWORD")
-        self.smtp_host = "smtp.gmail.com"
-        self.smtp_port = 465
-        
+        self.smtp_host = app_config.SMTP_HOST
+        self.smtp_port = app_config.SMTP_PORT
+        self.smtp_use_ssl = app_config.SMTP_USE_SSL
+
+    def build_message(self, subject, body, to_email, html_body=None) -> EmailMessage:
+        msg = EmailMessage()
+        msg['Subject'] = subject
+        msg['From'] = self.smtp_user_email
+        msg['To'] = to_email
+        msg.set_content(body)
+
+        if html_body:
+            msg.add_alternative(html_body, subtype='html')
+        return msg
+
+    def connect(self) -> smtplib.SMTP:
+        """
+        Opens an authenticated SMTP connection, the caller owns it and may send any number of messages on it.
+        """
+        smtp_class = smtplib.SMTP_SSL if self.smtp_use_ssl else smtplib.SMTP
+        smtp = smtp_class(self.smtp_host, self.smtp_port, timeout=app_config.SMTP_TIMEOUT_SECONDS)
+        if self.smtp_password:
+            smtp.login(self.smtp_user_email, self.smtp_password)
+        return smtp
+
+    def queue_email(self, subject, body, to_email, html_body=None):
+        """
+        Adds the email to the outbox, the email outbox workers send it. Errors are logged and silenced.
+        """
+        try:
+            DBInterface(EmailOutbox).create(data={
+                "to_email": to_email,
+                "subject": subject,
+                "body": body,
+                "html_body": html_body,
+                "status": EmailOutboxStatus.PENDING,
+                "attempts": 0,
+                "next_attempt_at": naive_utc_now()
+            })
+        except Exception as e:
+            app_logger.error(f"Failed to queue email to {to_email}: {str(e)}")
+
     def send_email(self, subject, body, to_email, html_body=None):
         """
         Sends an email with the given subject and body to the specified recipient.
         Errors are logged and silenced without raising exceptions.
         """
         try:
-            msg = EmailMessage()
-            msg['Subject'] = subject
-            msg['From'] = self.smtp_user_email
-            msg['To'] = to_email
-            msg.set_content(body)
-
-            if html_body:
-                msg.add_alternative(html_body, subtype='html')
-            
-            with smtplib.SMTP_SSL(self.smtp_host, self.smtp_port) as smtp:
-                smtp.login(self.smtp_user_email, self.smtp_password)
-                smtp.send_message(msg)
+            with self.connect() as smtp:
+                smtp.send_message(self.build_message(subject, body, to_email, html_body))
                 app_logger.info(f"Email sent successfully to {to_email}")
 
         except Exception as e:
             app_logger.error(f"Failed to send email to {to_email}: {str(e)}")
             # Silently handle the error without raising
-            pass
\ No newline at end of file
+            pass
@@ -1,4 +1,6 @@
 import datetime
+import hashlib
+import uuid
 from typing import Any
 
 import jwt
@@ -7,7 +9,9 @@ from starlette.responses import JSONResponse
 
 from app_logging import app_logger
 from common.cache_string import gettext
+from common.common_services.token_revocation_store import refresh_token_revocation_store
 from common.response import ApiResponse
+from common.ttl_cache import TTLCache
 from config import app_config
 
 
@@ -26,7 +30,9 @@ class JWTService:
     ACCESS_TOKEN_EXPIRY_MINUTES = 150
     REFRESH_TOKEN_EXPIRY_DAYS = 7
 
-    REVOKED_REFRESH_TOKENS = set()
+    # Verified access token payloads keyed by token hash, each kept until the token's own exp.
+    # Access tokens are not revocable, cached or not, a token stays valid until exp.
+    VERIFIED_ACCESS_TOKENS = TTLCache(max_entries=app_config.JWT_CACHE_MAX_ENTRIES)
 
     @classmethod
     def create_tokens(cls, data: dict, is_refresh: bool = True) -> JSONResponse | dict[str, Any]:
@@ -53,7 +59,10 @@ class JWTService:
             if is_refresh:
                 # Create Refresh Token
                 refresh_payload = data.copy()
-                refresh_payload.update({"exp": now + datetime.timedelta(days=cls.REFRESH_TOKEN_EXPIRY_DAYS)})
+                refresh_payload.update({
+                    "exp": now + datetime.timedelta(days=cls.REFRESH_TOKEN_EXPIRY_DAYS),
+                    "jti": uuid.uuid4().hex
+                })
                 refresh_token = jwt.encode(refresh_payload, cls.REFRESH_SECRET_KEY, algorithm=cls.ALGORITHM)
                 data_dict["refresh_token"] = refresh_token
 
@@ -63,38 +72,64 @@ class JWTService:
             return ApiResponse.create_response(success=False, message=f"Error generating tokens: {str(e)}",
                                                status_code=status.HTTP_400_BAD_REQUEST)
 
+    @classmethod
+    def _refresh_token_jti(cls, refresh_token: str, payload: dict) -> str:
+        # Tokens issued before jti was added are keyed by their hash
+        return payload.get("jti") or cls._token_key(refresh_token)
+
     @classmethod
     def revoke_refresh_token(cls, refresh_token: str) -> JSONResponse | Any | None:
         """
-            Invalidates a refresh token by adding it to a revoked token list.
+            Invalidates a refresh token by adding its jti to the shared revocation store.
 
             Args:
                 refresh_token (str): The refresh token to revoke.
         """
         try:
-            cls.REVOKED_REFRESH_TOKENS.add(refresh_token)
+            payload = jwt.decode(refresh_token, cls.REFRESH_SECRET_KEY, algorithms=[cls.ALGORITHM],
+                                 options={"verify_exp": False})
+            refresh_token_revocation_store.revoke(
+                jti=cls._refresh_token_jti(refresh_token, payload),
+                expires_at=datetime.datetime.fromtimestamp(payload["exp"], datetime.UTC).replace(tzinfo=None),
+                user_id=payload.get("id")
+            )
             return None
         except Exception as e:
             return ApiResponse.create_response(success=False, message=f"Error revoking refresh token: {str(e)}",
                                                status_code=status.HTTP_400_BAD_REQUEST)
 
     @classmethod
-    def is_refresh_token_revoked(cls, refresh_token: str) -> JSONResponse | bool:
+    def is_refresh_token_revoked(cls, refresh_token: str, payload: dict) -> bool:
         """
             Checks if a given refresh token has been revoked.
 
             Args:
                 refresh_token (str): The refresh token to check.
+                payload (dict): The decoded refresh token.
 
             Returns:
                 bool: True if the token is revoked, False otherwise.
         """
-        try:
-            return refresh_token in cls.REVOKED_REFRESH_TOKENS
-        except Exception as e:
-            return ApiResponse.create_response(success=False,
-                                               message=f"Error checking refresh token revocation: {str(e)}",
-                                               status_code=status.HTTP_400_BAD_REQUEST)
+        return refresh_token_revocation_store.is_revoked(cls._refresh_token_jti(refresh_token, payload))
+
+    @staticmethod
+    def _token_key(token: str) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    @classmethod
+    def decode_access_token(cls, token: str) -> dict:
+        """
+        Decodes the access token, serving already verified tokens from the cache.
+        Raises the jwt exceptions for expired or invalid tokens.
+        """
+        token_key = cls._token_key(token)
+        payload = cls.VERIFIED_ACCESS_TOKENS.get(token_key)
+        if payload is None:
+            payload = jwt.decode(token, cls.SECRET_KEY, algorithms=[cls.ALGORITHM])
+            if isinstance(payload.get("exp"), (int, float)):
+                cls.VERIFIED_ACCESS_TOKENS.set(token_key, payload, expires_at=payload["exp"])
+        # Callers get their own copy so the cached payload cannot be changed through request.state
+        return dict(payload)
 
     @classmethod
     def verify_access_token(cls, token: str) -> JSONResponse | Any:
@@ -111,7 +146,7 @@ class JWTService:
             HTTPException: If the token is invalid or expired.
         """
         try:
-            return jwt.decode(token, cls.SECRET_KEY, algorithms=[cls.ALGORITHM])
+            return cls.decode_access_token(token)
         except jwt.ExpiredSignatureError:
             return ApiResponse.create_response(success=False, message=gettext("token_expired"),
                                                status_code=status.HTTP_403_FORBIDDEN)
@@ -138,13 +173,16 @@ class JWTService:
                 HTTPException: If the token is invalid, expired, or revoked.
             """
         try:
-            if cls.is_refresh_token_revoked(token):
-                return ApiResponse.create_response(success=False, message=gettext("invalid_token"),
-                                                   status_code=status.HTTP_410_GONE)
-
             payload = jwt.decode(token, cls.REFRESH_SECRET_KEY, algorithms=[cls.ALGORITHM])
+            if cls.is_refresh_token_revoked(token, payload):
+                return {
+                    "success": False,
+                    "message": gettext("invalid_token"),
+                    "status_code": status.HTTP_410_GONE,
+                }
+
             app_logger.error(f"JWT ERROR ===> {payload}")
-            filtered_payload = {k: v for k, v in payload.items() if k not in ["exp", "iat", "nbf"]}
+            filtered_payload = {k: v for k, v in payload.items() if k not in ["exp", "iat", "nbf", "jti"]}
             app_logger.error(f"JWT ERROR 2 ===> {filtered_payload}")
 
             return cls.create_tokens(filtered_payload, is_refresh=False)
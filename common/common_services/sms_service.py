@@ -1,25 +1,171 @@
-import requests
+import asyncio
+import threading
+import time
+from typing import List, Optional, Tuple
+
+import httpx
 
 from app_logging import app_logger
+from config import app_config
 
+# Fixed account and DLT template parameters of the SMS gateway
+_GATEWAY_PARAMS = {
+    "user": "tracewave",
+    "password": "tracewave14",
+    "senderid": "TRNSWV",
+    "channel": "Trans",
+    "DCS": 0,
+    "flashsms": 0,
+    "Peid": 0,
+    "DLTTemplateId": "1707173510885060059"
+}
 
-class SMSService:
-    @staticmethod
-    def send_sms(phone_number: str, message: str) -> bool:
-        try:
-            sms_url = (
-                f"http://ahd.sendsmsbox.com/api/mt/SendSMS?"
-                f"user=tracewave&password=tracewave14&senderid=TRNSWV&channel=Trans&DCS=0&"
-                f"flashsms=0&number={phone_number}&text={message}"
-                f"&Peid=0&DLTTemplateId=1707173510885060059"
-            )
-            response = requests.get(sms_url)
-            if response.status_code == 200:
-                app_logger.info(f"SMS sent to {phone_number}")
+
+class CircuitBreaker:
+    """
+    Opens after `failure_threshold` consecutive failures and rejects calls for `reset_seconds`,
+    then lets a single trial call through; its result closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold: int, reset_seconds: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None and time.monotonic() - self.opened_at < self.reset_seconds
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
                 return True
-            else:
-                app_logger.error(f"SMS failed for {phone_number}. Status: {response.status_code}")
+            if time.monotonic() - self.opened_at < self.reset_seconds or self._trial_in_flight:
                 return False
+            self._trial_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+class SMSService:
+    """
+    Async SMS gateway client on one pooled httpx.AsyncClient. Messages are queued by `enqueue` and sent by
+    worker tasks on the event loop, so callers never wait on the gateway. A circuit breaker stops sends
+    while the gateway keeps failing.
+    """
+
+    def __init__(
+            self, gateway_url: str = app_config.SMS_GATEWAY_URL, timeout: float = app_config.SMS_TIMEOUT_SECONDS,
+            queue_size: int = app_config.SMS_QUEUE_SIZE, worker_count: int = app_config.SMS_WORKER_COUNT,
+            max_connections: int = app_config.SMS_MAX_CONNECTIONS,
+            breaker: Optional[CircuitBreaker] = None, transport: Optional[httpx.AsyncBaseTransport] = None
+    ) -> None:
+        self.gateway_url = gateway_url
+        self.worker_count = worker_count
+        self.breaker = breaker or CircuitBreaker(app_config.SMS_BREAKER_FAILURE_THRESHOLD,
+                                                 app_config.SMS_BREAKER_RESET_SECONDS)
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 2.0)),
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            transport=transport
+        )
+        self._queue: "asyncio.Queue[Tuple[str, str]]" = asyncio.Queue(maxsize=queue_size)
+        self._workers: List[asyncio.Task] = []
+
+    async def send_sms(self, phone_number: str, message: str) -> bool:
+        if not self.breaker.allow():
+            app_logger.error(f"SMS to {phone_number} skipped, the SMS gateway circuit is open")
+            return False
+        try:
+            response = await self.client.get(self.gateway_url, params={
+                **_GATEWAY_PARAMS,
+                "number": phone_number,
+                "text": message
+            })
         except Exception as e:
-            app_logger.exception(f"SMS send failed. Error: {str(e)}")
+            self.breaker.record_failure()
+            app_logger.error(f"SMS send failed for {phone_number}. Error: {e!r}")
+            return False
+        # Any answer below 500 means the gateway is up, a 4xx is about this message. Recording it also ends
+        # a half-open trial, which would otherwise stay in flight and block every later send
+        if response.status_code >= 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        if response.status_code == 200:
+            app_logger.info(f"SMS sent to {phone_number}")
+            return True
+        app_logger.error(f"SMS failed for {phone_number}. Status: {response.status_code}")
+        return False
+
+    def enqueue(self, phone_number: str, message: str) -> bool:
+        """
+        Queue a message for the workers. Returns False when it cannot be delivered soon: the gateway circuit
+        is open or the queue is full. Must be called from the event loop.
+        """
+        if self.breaker.is_open:
+            return False
+        self._ensure_workers()
+        try:
+            self._queue.put_nowait((phone_number, message))
+        except asyncio.QueueFull:
+            app_logger.error(f"SMS queue full, dropping message to {phone_number}")
             return False
+        return True
+
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def _ensure_workers(self) -> None:
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        for i in range(len(self._workers), self.worker_count):
+            self._workers.append(asyncio.create_task(self._worker(), name=f"sms-worker-{i}"))
+
+    async def _worker(self) -> None:
+        while True:
+            phone_number, message = await self._queue.get()
+            try:
+                await self.send_sms(phone_number, message)
+            except Exception as e:
+                app_logger.exception(f"SMS send failed. Error: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    async def aclose(self) -> None:
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        await self.client.aclose()
+
+
+_sms_service: Optional[SMSService] = None
+
+
+def get_sms_service() -> SMSService:
+    global _sms_service
+    if _sms_service is None:
+        _sms_service = SMSService()
+    return _sms_service
+
+
+async def close_sms_service() -> None:
+    global _sms_service
+    if _sms_service is not None:
+        await _sms_service.aclose()
+        _sms_service = None
@@ -1,38 +1,191 @@
+import asyncio
+import copy
+import hashlib
+import json
+import random
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Optional, Tuple
+
 import httpx
 from starlette import status
 
+from app_logging import app_logger
+from common.ttl_cache import TTLCache
 from config import app_config
 
+# Rejected before processing, safe to send again
+_RETRY_STATUS_CODES = {429, 502, 503, 504}
+
+
+@dataclass(frozen=True)
+class SurpassEndpointPolicy:
+    timeout: float = 30.0
+    # Only lookups are retried, verifications that are billed or start a flow keep 0
+    max_retries: int = 0
+    max_concurrency: int = 10
+    # Successful responses are reused for this long, 0 disables caching
+    cache_ttl_seconds: int = 0
+
+
+# Keyed by endpoint prefix, the longest matching prefix wins. SURPASS_ENDPOINT_POLICIES overrides fields.
+DEFAULT_ENDPOINT_POLICIES: Dict[str, SurpassEndpointPolicy] = {
+    "": SurpassEndpointPolicy(),
+    "pan/pan": SurpassEndpointPolicy(timeout=10.0, max_retries=2, max_concurrency=10, cache_ttl_seconds=86400),
+    "credit-report-cibil": SurpassEndpointPolicy(timeout=60.0, max_concurrency=4),
+    "bank-verification": SurpassEndpointPolicy(timeout=20.0, max_concurrency=5),
+    "digilocker/initialize": SurpassEndpointPolicy(timeout=15.0, max_concurrency=10),
+    "digilocker/download-aadhaar": SurpassEndpointPolicy(timeout=20.0, max_retries=2, max_concurrency=10),
+}
+
+
+def _load_policies() -> Dict[str, SurpassEndpointPolicy]:
+    policies = dict(DEFAULT_ENDPOINT_POLICIES)
+    for prefix, overrides in (app_config.SURPASS_ENDPOINT_POLICIES or {}).items():
+        policies[prefix] = replace(policies.get(prefix, policies[""]), **overrides)
+    return policies
+
+
+class SurpassClient:
+    """
+    Application-lifetime Surpass API client on one pooled httpx.AsyncClient (keep-alive, HTTP/2). Every endpoint
+    gets its own timeout, retry count and concurrency limit, and idempotent lookups such as PAN validation are
+    served from a response cache keyed by the hash of the request.
+    """
+
+    def __init__(
+            self, base_url: str = app_config.SURPASS_API_BASE_URL, token: str = app_config.SURPASS_TOKEN,
+            max_connections: int = app_config.SURPASS_MAX_CONNECTIONS, http2: bool = app_config.SURPASS_HTTP2,
+            policies: Optional[Dict[str, SurpassEndpointPolicy]] = None,
+            transport: Optional[httpx.AsyncBaseTransport] = None
+    ) -> None:
+        self.policies = policies or _load_policies()
+        self.responses = TTLCache(max_entries=app_config.SURPASS_CACHE_MAX_ENTRIES)
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.client = httpx.AsyncClient(
+            base_url=f"{base_url}/api/v1/",
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json"
+            },
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            http2=http2,
+            transport=transport
+        )
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    def policy_for(self, endpoint: str) -> Tuple[str, SurpassEndpointPolicy]:
+        prefix = max((prefix for prefix in self.policies if endpoint.startswith(prefix)), key=len)
+        return prefix, self.policies[prefix]
+
+    @staticmethod
+    def cache_key(method: str, endpoint: str, data: Any, params: Any) -> str:
+        body = json.dumps([method, endpoint, data, params], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(body.encode()).hexdigest()
+
+    async def request(self, endpoint: str, method: str = "POST", data=None, params=None) -> httpx.Response:
+        prefix, policy = self.policy_for(endpoint)
+        semaphore = self._semaphores.get(prefix)
+        if semaphore is None:
+            semaphore = self._semaphores[prefix] = asyncio.Semaphore(policy.max_concurrency)
+
+        attempt = 0
+        while True:
+            try:
+                async with semaphore:
+                    response = await self.client.request(
+                        method, endpoint, json=data if method == "POST" else None, params=params,
+                        timeout=policy.timeout
+                    )
+                if response.status_code not in _RETRY_STATUS_CODES or attempt >= policy.max_retries:
+                    return response
+                app_logger.warning(f"[SurpassClient] {method} {endpoint} returned {response.status_code}, retrying")
+            except httpx.TransportError as e:
+                if attempt >= policy.max_retries:
+                    raise
+                app_logger.warning(f"[SurpassClient] {method} {endpoint} failed ({e!r}), retrying")
+            await asyncio.sleep(random.uniform(0, min(2.0, 0.2 * 2 ** attempt)))
+            attempt += 1
+
+    async def cached_request(self, endpoint: str, method: str = "POST", data=None,
+                             params=None) -> Tuple[Any, int]:
+        """
+        Response JSON and status code. Cacheable endpoints answer repeats from the cache, and concurrent
+        identical lookups share one vendor call.
+        """
+        _, policy = self.policy_for(endpoint)
+        if not policy.cache_ttl_seconds:
+            response = await self.request(endpoint, method, data, params)
+            return response.json(), response.status_code
+
+        key = self.cache_key(method, endpoint, data, params)
+        cached = self.responses.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached[0]), cached[1]
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            response_data, status_code = await asyncio.shield(in_flight)
+            return copy.deepcopy(response_data), status_code
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await self.request(endpoint, method, data, params)
+            result = (response.json(), response.status_code)
+            if response.status_code < 400:
+                self.responses.set(key, result, expires_at=time.time() + policy.cache_ttl_seconds)
+            future.set_result(result)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieved here so an unawaited failure is not reported as never retrieved
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+        return copy.deepcopy(result[0]), result[1]
+
+
+_surpass_client: Optional[SurpassClient] = None
+
+
+def get_surpass_client() -> SurpassClient:
+    global _surpass_client
+    if _surpass_client is None:
+        _surpass_client = SurpassClient()
+    return _surpass_client
+
+
+async def close_surpass_client() -> None:
+    global _surpass_client
+    if _surpass_client is not None:
+        await _surpass_client.aclose()
+        _surpass_client = None
+
 
 class SurpassRequestService:
-    def __init__(self):
-        self.base_url = app_config.SURPASS_API_BASE_URL
-        self.bearer_token = app_config.SURPASS_TOKEN
-        self.api_prefix = "api/v1"
-        self.headers = {
-            "Authorization": f"Bearer {self.bearer_token}",
-            "Content-Type": "application/json"
-        }
+    @property
+    def client(self) -> SurpassClient:
+        return get_surpass_client()
 
     async def make_request(self, endpoint: str, method: str = "POST", data=None, params=None):
-        url = f"{self.base_url}/{self.api_prefix}/{endpoint}"
-        response = None
+        method = method.upper()
+        if method not in ("GET", "POST"):
+            return None, status.HTTP_400_BAD_REQUEST, "Unsupported HTTP method"
 
         try:
-            timeout = httpx.Timeout(30.0)
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                if method.upper() == "GET":
-                    response = await client.get(url, params=params, headers=self.headers)
-                elif method.upper() == "POST":
-                    response = await client.post(url, json=data, headers=self.headers)
-                else:
-                    return None, status.HTTP_400_BAD_REQUEST, "Unsupported HTTP method"
-                response_data = response.json()
-
-                if response.status_code >= 400:
-                    error_message = response_data.get("message", "API returned an error")
-                    return response_data, response.status_code, error_message
-                return response.json(), response.status_code, None
+            response_data, status_code = await self.client.cached_request(endpoint, method, data, params)
+
+            if status_code >= 400:
+                error_message = response_data.get("message", "API returned an error")
+                return response_data, status_code, error_message
+            return response_data, status_code, None
 
         except httpx.RequestError as e:
             return None, status.HTTP_500_INTERNAL_SERVER_ERROR, f"Request error: {str(e)}"
@@ -0,0 +1,119 @@
+import datetime
+import hashlib
+import math
+import threading
+import time
+from typing import Optional
+
+from app_logging import app_logger
+from config import app_config
+from db_domains import naive_utc_now
+from db_domains.db_interface import DBInterface
+from models.user import RevokedRefreshToken
+
+
+class BloomFilter:
+    """
+    Fixed size bloom filter over strings. `in` never misses an added key and wrongly matches
+    roughly `error_rate` of the keys that were not added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(capacity, 1)
+        self.bit_count = max(int(-capacity * math.log(error_rate) / (math.log(2) ** 2)), 8)
+        self.hash_count = max(int(round(self.bit_count / capacity * math.log(2))), 1)
+        self._bits = bytearray((self.bit_count + 7) // 8)
+
+    def _positions(self, key: str):
+        digest = hashlib.sha256(key.encode()).digest()
+        first, second = int.from_bytes(digest[:8], "big"), int.from_bytes(digest[8:16], "big") | 1
+        return ((first + i * second) % self.bit_count for i in range(self.hash_count))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class RefreshTokenRevocationStore:
+    """
+    Revoked refresh tokens live in the revoked_refresh_tokens table, keyed by jti, so every worker and
+    restart sees the same revocations. A local bloom filter answers the common "not revoked" check without
+    a query; only bloom hits are confirmed against the table.
+
+    Other workers' revocations reach the bloom filter through an incremental sync every
+    `sync_seconds`, and a full rebuild every `rebuild_seconds` drops expired tokens from it and the table.
+    """
+
+    def __init__(self, capacity: int, error_rate: float, sync_seconds: int, rebuild_seconds: int) -> None:
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.sync_seconds = sync_seconds
+        self.rebuild_seconds = rebuild_seconds
+        self._lock = threading.Lock()
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._synced_until: Optional[datetime.datetime] = None
+        self._last_sync: Optional[float] = None
+        self._last_rebuild: Optional[float] = None
+
+    def revoke(self, jti: str, expires_at: datetime.datetime, user_id: Optional[int] = None) -> None:
+        if not DBInterface(RevokedRefreshToken).read_single_by_fields(fields=[RevokedRefreshToken.jti == jti]):
+            DBInterface(RevokedRefreshToken).create(data={
+                "jti": jti,
+                "user_id": user_id,
+                "expires_at": expires_at
+            })
+        with self._lock:
+            self._bloom.add(jti)
+
+    def is_revoked(self, jti: str) -> bool:
+        self._sync()
+        if jti not in self._bloom:
+            return False
+        return DBInterface(RevokedRefreshToken).read_single_by_fields(fields=[
+            RevokedRefreshToken.jti == jti,
+            RevokedRefreshToken.expires_at > naive_utc_now()
+        ]) is not None
+
+    def _sync(self) -> None:
+        now = time.monotonic()
+        if self._last_sync is not None and now - self._last_sync < self.sync_seconds:
+            return
+        with self._lock:
+            if self._last_sync is not None and now - self._last_sync < self.sync_seconds:
+                return
+            try:
+                if self._last_rebuild is None or now - self._last_rebuild >= self.rebuild_seconds:
+                    self._rebuild()
+                    self._last_rebuild = now
+                else:
+                    self._load_since(self._synced_until)
+                self._last_sync = now
+            except Exception as e:
+                # Keep serving from the current filter, the next check retries the sync
+                app_logger.warning(f"[RefreshTokenRevocationStore] Sync failed: {e}")
+
+    def _load_since(self, since: Optional[datetime.datetime]) -> None:
+        sync_started = naive_utc_now()
+        fields = [RevokedRefreshToken.expires_at > sync_started]
+        if since is not None:
+            # Overlap the previous window, rows committed late by other workers would be missed otherwise
+            fields.append(RevokedRefreshToken.created_at > since - datetime.timedelta(seconds=self.sync_seconds))
+        for row in DBInterface(RevokedRefreshToken).read_by_fields(fields=fields) or []:
+            self._bloom.add(row.jti)
+        self._synced_until = sync_started
+
+    def _rebuild(self) -> None:
+        DBInterface(RevokedRefreshToken).delete(filters=[RevokedRefreshToken.expires_at <= naive_utc_now()])
+        self._bloom = BloomFilter(self.capacity, self.error_rate)
+        self._load_since(None)
+
+
+refresh_token_revocation_store = RefreshTokenRevocationStore(
+    capacity=app_config.REFRESH_REVOCATION_BLOOM_CAPACITY,
+    error_rate=app_config.REFRESH_REVOCATION_BLOOM_ERROR_RATE,
+    sync_seconds=app_config.REFRESH_REVOCATION_SYNC_SECONDS,
+    rebuild_seconds=app_config.REFRESH_REVOCATION_REBUILD_SECONDS
+)
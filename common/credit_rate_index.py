@@ -0,0 +1,164 @@
+import select
+import threading
+import time
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+
+from app_logging import app_logger
+from config import app_config
+from db_domains.db import engine
+from db_domains.db_interface import DBInterface
+from models.credit import CreditScoreRangeRate
+
+# Postgres channel used to tell the other workers that the rate tables changed
+CREDIT_INDEX_CHANNEL = "credit_rate_index"
+
+
+def parse_score(score: Any) -> Optional[int]:
+    """
+    Credit scores are stored as strings on the loan, anything that is not a number has no band.
+    """
+    try:
+        return int(score)
+    except (TypeError, ValueError):
+        return None
+
+
+class ScoreBandIndex:
+    """
+    Score bands sorted by min_score. The band for a score is found with a binary search for the last band
+    starting at or below it. Bands saved before the admin APIs checked partial updates can overlap, so a
+    band ending below the score does not end the search, earlier and wider bands are tried too.
+    """
+
+    def __init__(self, bands: List[Dict[str, Any]]) -> None:
+        self.bands = sorted(
+            (band for band in bands if band["min_score"] is not None and band["max_score"] is not None),
+            key=lambda band: band["min_score"]
+        )
+        self.min_scores = [band["min_score"] for band in self.bands]
+
+    def find(self, score: Any) -> Optional[Dict[str, Any]]:
+        score = parse_score(score)
+        if score is None:
+            return None
+        for position in range(bisect_right(self.min_scores, score) - 1, -1, -1):
+            if self.bands[position]["max_score"] >= score:
+                return dict(self.bands[position])
+        return None
+
+
+class CreditRateIndex:
+    """
+    In-process copy of the credit score rate table.
+    It is reloaded lazily after an invalidation or once the TTL has passed, so other workers
+    converge even when a change notification is missed.
+    """
+
+    def __init__(self, ttl_seconds: int) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._rates: Dict[str, ScoreBandIndex] = {}
+        self._loaded_at: Optional[float] = None
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._loaded_at = None
+
+    def _ensure_loaded(self) -> None:
+        if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl_seconds:
+            return
+        with self._lock:
+            if self._loaded_at is not None and time.monotonic() - self._loaded_at < self.ttl_seconds:
+                return
+
+            rate_rows = DBInterface(CreditScoreRangeRate).read_by_fields(
+                fields=[CreditScoreRangeRate.is_deleted == False]
+            ) or []
+
+            rates_by_loan_type: Dict[str, List[Dict[str, Any]]] = {}
+            for rate in rate_rows:
+                rates_by_loan_type.setdefault(rate.loan_type.value, []).append({
+                    "id": rate.id,
+                    "min_score": rate.min_score,
+                    "max_score": rate.max_score,
+                    "rate_percentage": rate.rate_percentage
+                })
+            self._rates = {loan_type: ScoreBandIndex(bands) for loan_type, bands in rates_by_loan_type.items()}
+            self._loaded_at = time.monotonic()
+
+    @staticmethod
+    def _loan_type_key(loan_type: Any) -> str:
+        return getattr(loan_type, "value", loan_type)
+
+    def find_rate(self, loan_type: Any, score: Any) -> Optional[Dict[str, Any]]:
+        self._ensure_loaded()
+        index = self._rates.get(self._loan_type_key(loan_type))
+        return index.find(score) if index else None
+
+    def rates_for(self, loan_type: Any) -> List[Dict[str, Any]]:
+        self._ensure_loaded()
+        index = self._rates.get(self._loan_type_key(loan_type))
+        return [dict(band) for band in index.bands] if index else []
+
+
+credit_rate_index = CreditRateIndex(ttl_seconds=app_config.CREDIT_INDEX_TTL_SECONDS)
+
+
+def publish_credit_index_change() -> None:
+    """
+    Drop the local index and, when cross-worker invalidation is enabled, notify the other workers.
+    """
+    credit_rate_index.invalidate()
+    if not app_config.CREDIT_INDEX_LISTEN:
+        return
+    try:
+        with engine.begin() as connection:
+            connection.execute(text("SELECT pg_notify(:channel, '')"), {"channel": CREDIT_INDEX_CHANNEL})
+    except Exception as e:
+        # The TTL still bounds how long the other workers serve the old rates
+        app_logger.warning(f"[CreditRateIndex] Failed to publish invalidation: {e}")
+
+
+class CreditIndexListener(threading.Thread):
+    """
+    Daemon thread holding a LISTEN connection and invalidating the local index on every notification.
+    """
+
+    def __init__(self, poll_seconds: float = 5.0) -> None:
+        super().__init__(name="credit-index-listener", daemon=True)
+        self.poll_seconds = poll_seconds
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                self._listen()
+            except Exception as e:
+                app_logger.warning(f"[CreditRateIndex] Listener connection lost: {e}")
+                # Anything may have changed while disconnected
+                credit_rate_index.invalidate()
+                self._stop_event.wait(self.poll_seconds)
+
+    def _listen(self) -> None:
+        connection = engine.raw_connection()
+        try:
+            dbapi_connection = connection.driver_connection
+            dbapi_connection.autocommit = True
+            with dbapi_connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {CREDIT_INDEX_CHANNEL}")
+            while not self._stop_event.is_set():
+                if select.select([dbapi_connection], [], [], self.poll_seconds) == ([], [], []):
+                    continue
+                dbapi_connection.poll()
+                if dbapi_connection.notifies:
+                    dbapi_connection.notifies.clear()
+                    credit_rate_index.invalidate()
+        finally:
+            # The connection was switched to autocommit, do not hand it back to the pool
+            connection.invalidate()
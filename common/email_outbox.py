@@ -0,0 +1,179 @@
+import datetime
+import random
+import smtplib
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, func, or_, select
+
+from app_logging import app_logger
+from common.common_services.email_service import EmailService
+from common.enums import EmailOutboxStatus
+from config import app_config
+from db_domains import naive_utc_now
+from db_domains.db import DBSession
+from db_domains.db_interface import DBInterface
+from models.email import EmailOutbox
+
+# The connection is gone, reconnecting and sending the same message again is safe
+_CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+class EmailOutboxWorker(threading.Thread):
+    """
+    Daemon thread draining the email outbox in batches over one authenticated SMTP connection, which is kept
+    open between batches and closed after EMAIL_SMTP_IDLE_SECONDS without mail. Failed emails are retried with
+    exponential backoff until EMAIL_MAX_ATTEMPTS.
+    """
+
+    def __init__(self, name: str, poll_seconds: float = app_config.EMAIL_POLL_SECONDS,
+                 batch_size: int = app_config.EMAIL_BATCH_SIZE) -> None:
+        super().__init__(name=name, daemon=True)
+        self.poll_seconds = poll_seconds
+        self.batch_size = batch_size
+        self.email_service = EmailService()
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                batch = self.claim_batch(self.batch_size)
+            except Exception as e:
+                app_logger.warning(f"[EmailOutbox] Claiming emails failed: {e}")
+                batch = []
+            if not batch:
+                if self._smtp is not None and time.monotonic() - self._last_used > app_config.EMAIL_SMTP_IDLE_SECONDS:
+                    self._disconnect()
+                self._stop_event.wait(self.poll_seconds)
+                continue
+            self.send_batch(batch)
+        self._disconnect()
+
+    @staticmethod
+    def claim_batch(limit: int) -> List[Dict[str, Any]]:
+        now = naive_utc_now()
+        stale_lock = now - datetime.timedelta(seconds=app_config.EMAIL_VISIBILITY_TIMEOUT_SECONDS)
+        query = (
+            select(EmailOutbox)
+            .where(or_(
+                and_(EmailOutbox.status == EmailOutboxStatus.PENDING, EmailOutbox.next_attempt_at <= now),
+                # The worker holding it died mid-batch
+                and_(EmailOutbox.status == EmailOutboxStatus.SENDING, EmailOutbox.locked_at < stale_lock)
+            ))
+            .order_by(EmailOutbox.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        with DBSession() as session:
+            emails = session.scalars(query).all()
+            claimed = []
+            for email in emails:
+                email.status = EmailOutboxStatus.SENDING
+                email.locked_at = now
+                email.attempts += 1
+                claimed.append({
+                    "id": email.id,
+                    "to_email": email.to_email,
+                    "subject": email.subject,
+                    "body": email.body,
+                    "html_body": email.html_body,
+                    "attempts": email.attempts
+                })
+            session.commit()
+            return claimed
+
+    def send_batch(self, batch: List[Dict[str, Any]]) -> None:
+        for email in batch:
+            try:
+                self._send(email)
+            except Exception as e:
+                self._mark_failed(email, e)
+                continue
+            app_logger.info(f"Email sent successfully to {email['to_email']}")
+            self._update(email["id"], {
+                "status": EmailOutboxStatus.SENT,
+                "sent_at": naive_utc_now(),
+                "locked_at": None,
+                "last_error": None
+            })
+
+    def _send(self, email: Dict[str, Any]) -> None:
+        message = self.email_service.build_message(email["subject"], email["body"], email["to_email"],
+                                                   email["html_body"])
+        try:
+            self._connection().send_message(message)
+        except _CONNECTION_ERRORS:
+            # The server dropped the idle connection, send once more on a fresh one
+            self._disconnect()
+            self._connection().send_message(message)
+        self._last_used = time.monotonic()
+
+    def _connection(self) -> smtplib.SMTP:
+        if self._smtp is None:
+            self._smtp = self.email_service.connect()
+        return self._smtp
+
+    def _disconnect(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except Exception:
+            pass
+        self._smtp = None
+
+    def _mark_failed(self, email: Dict[str, Any], error: Exception) -> None:
+        attempts = email["attempts"]
+        if attempts >= app_config.EMAIL_MAX_ATTEMPTS:
+            app_logger.error(f"[EmailOutbox] Giving up on email {email['id']} to {email['to_email']}: {error}")
+            self._update(email["id"], {
+                "status": EmailOutboxStatus.FAILED,
+                "locked_at": None,
+                "last_error": str(error)
+            })
+            return
+        delay = min(app_config.EMAIL_MAX_BACKOFF_SECONDS, 2 ** attempts) * random.uniform(0.5, 1.0)
+        app_logger.warning(f"[EmailOutbox] Email {email['id']} failed, retrying in {delay:.0f}s: {error}")
+        self._update(email["id"], {
+            "status": EmailOutboxStatus.PENDING,
+            "next_attempt_at": naive_utc_now() + datetime.timedelta(seconds=delay),
+            "locked_at": None,
+            "last_error": str(error)
+        })
+
+    @staticmethod
+    def _update(email_id: int, data: Dict[str, Any]) -> None:
+        DBInterface(EmailOutbox).update(_id=email_id, data=data)
+
+
+def email_outbox_stats() -> Dict[str, int]:
+    """
+    Number of outbox emails per status; pending plus sending is the queue depth.
+    """
+    with DBSession() as session:
+        counts = dict(session.execute(
+            select(EmailOutbox.status, func.count(EmailOutbox.id))
+            .where(EmailOutbox.status != EmailOutboxStatus.SENT)
+            .group_by(EmailOutbox.status)
+        ).all())
+    stats = {status.value: counts.get(status, 0) for status in EmailOutboxStatus if status != EmailOutboxStatus.SENT}
+    stats["queue_depth"] = stats[EmailOutboxStatus.PENDING.value] + stats[EmailOutboxStatus.SENDING.value]
+    return stats
+
+
+def start_email_workers() -> List[EmailOutboxWorker]:
+    workers = [EmailOutboxWorker(name=f"email-outbox-{i}") for i in range(app_config.EMAIL_WORKER_COUNT)]
+    for worker in workers:
+        worker.start()
+    return workers
+
+
+def stop_email_workers(workers: List[EmailOutboxWorker]) -> None:
+    for worker in workers:
+        worker.stop()
@@ -0,0 +1,154 @@
+import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+from app_logging import app_logger
+from config import app_config
+from db_domains import naive_utc_now
+from db_domains.db_interface import DBInterface
+from models.razorpay import Plan, Subscription
+from services.razorpay_service import RazorpayService
+
+# Subscription columns kept in step with the snapshot. Status is left to the webhook handlers.
+_SUBSCRIPTION_COLUMNS = ("paid_count", "remaining_count", "total_count", "start_at", "end_at", "charge_at",
+                         "auth_attempts")
+
+
+def _merge_invoice(invoice_data: Optional[Dict[str, Any]], invoice: Dict[str, Any]) -> Dict[str, Any]:
+    items = [item for item in (invoice_data or {}).get("items", []) if item.get("id") != invoice.get("id")]
+    items.insert(0, invoice)
+    return {"entity": "collection", "count": len(items), "items": items}
+
+
+class RazorpaySnapshotCache:
+    """
+    Read-through cache of Razorpay plan, subscription and invoice JSON stored on the Plan and Subscription rows.
+    Stored snapshots are served as they are; past the TTL they are refreshed in the background, and webhook
+    events write them immediately. Only rows that were never synced are fetched inline.
+    Plans cannot be edited on Razorpay, so the stored plan_data never goes stale.
+    """
+
+    def __init__(self, ttl_seconds: int, call_timeout: float, fanout_workers: int, max_workers: int = 2) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.call_timeout = call_timeout
+        self._client: Optional[RazorpayService] = None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="razorpay-snapshot")
+        # Separate pool for the gateway calls, so a refresh never waits on a slot held by another refresh
+        self._fanout = ThreadPoolExecutor(max_workers=fanout_workers, thread_name_prefix="razorpay-fanout")
+        self._in_flight: set[int] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> RazorpayService:
+        if self._client is None:
+            self._client = RazorpayService(app_config.RAZORPAY_KEY_ID, app_config.RAZORPAY_SECRET)
+        return self._client
+
+    def _is_stale(self, refreshed_at: Optional[datetime.datetime]) -> bool:
+        return (naive_utc_now() - refreshed_at).total_seconds() > self.ttl_seconds
+
+    def plan(self, plan: Plan) -> Optional[Dict[str, Any]]:
+        if plan.plan_data:
+            return plan.plan_data
+        plan_data = self.client.fetch_plan(plan.razorpay_plan_id)
+        DBInterface(Plan).update(_id=plan.id, data={"plan_data": plan_data})
+        return plan_data
+
+    def subscription(self, subscription: Subscription) -> Optional[Dict[str, Any]]:
+        return self.snapshot(subscription)["subscription_data"]
+
+    def snapshot(self, subscription: Subscription) -> Dict[str, Any]:
+        """
+        Stored subscription_data and invoice_data of the subscription.
+        """
+        if subscription.snapshot_refreshed_at is None:
+            # Never synced, the stored JSON is still the create response
+            snapshot = self._refresh_subscription(subscription.id, subscription.razorpay_subscription_id)
+            return {
+                "subscription_data": snapshot["subscription_data"],
+                "invoice_data": snapshot.get("invoice_data", subscription.invoice_data)
+            }
+        if self._is_stale(subscription.snapshot_refreshed_at):
+            self._schedule_refresh(subscription.id, subscription.razorpay_subscription_id)
+        return {"subscription_data": subscription.subscription_data, "invoice_data": subscription.invoice_data}
+
+    def _schedule_refresh(self, subscription_id: int, razorpay_subscription_id: str) -> None:
+        with self._lock:
+            if subscription_id in self._in_flight:
+                return
+            self._in_flight.add(subscription_id)
+
+        def refresh():
+            try:
+                self._refresh_subscription(subscription_id, razorpay_subscription_id)
+            except Exception as e:
+                app_logger.warning(f"[RazorpaySnapshotCache] Refresh failed for {razorpay_subscription_id}: {e}")
+            finally:
+                with self._lock:
+                    self._in_flight.discard(subscription_id)
+
+        self._executor.submit(refresh)
+
+    def _refresh_subscription(self, subscription_id: int, razorpay_subscription_id: str) -> Dict[str, Any]:
+        # Both calls go out together, so a refresh takes as long as the slower one
+        subscription_call = self._fanout.submit(self.client.fetch_subscription, razorpay_subscription_id)
+        invoice_call = self._fanout.submit(self.client.fetch_invoices_for_subscription,
+                                           subscription_id=razorpay_subscription_id)
+        subscription_data = subscription_call.result(timeout=self.call_timeout)
+        snapshot = {
+            **{column: subscription_data.get(column) for column in _SUBSCRIPTION_COLUMNS},
+            "subscription_data": subscription_data
+        }
+        try:
+            snapshot["invoice_data"] = invoice_call.result(timeout=self.call_timeout)
+            snapshot["snapshot_refreshed_at"] = naive_utc_now()
+        except Exception as e:
+            # Keep the stored invoices and leave the snapshot stale, so the next read retries
+            app_logger.warning(f"[RazorpaySnapshotCache] Invoice fetch failed for {razorpay_subscription_id}: {e!r}")
+        DBInterface(Subscription).update(_id=subscription_id, data=snapshot)
+        return snapshot
+
+    def apply_webhook_event(self, event_data: Dict[str, Any]) -> None:
+        """
+        Write the subscription and invoice entities carried by a Razorpay webhook event into the snapshots.
+        """
+        payload = event_data.get("payload") or {}
+        subscription_entity = (payload.get("subscription") or {}).get("entity")
+        invoice_entity = (payload.get("invoice") or {}).get("entity")
+        razorpay_subscription_id = (subscription_entity or {}).get("id") or (invoice_entity or {}).get(
+            "subscription_id")
+        if not razorpay_subscription_id:
+            return
+
+        subscription = DBInterface(Subscription).read_single_by_fields(fields=[
+            Subscription.razorpay_subscription_id == razorpay_subscription_id,
+            Subscription.is_deleted == False
+        ])
+        if not subscription:
+            return
+
+        event_at = event_data.get("created_at")
+        event_at = datetime.datetime.fromtimestamp(event_at, datetime.UTC).replace(tzinfo=None) if isinstance(
+            event_at, (int, float)) else naive_utc_now()
+        if subscription.snapshot_refreshed_at is not None and event_at < subscription.snapshot_refreshed_at:
+            # Late delivery, the stored snapshot is newer than this event
+            return
+
+        data: Dict[str, Any] = {}
+        if subscription_entity:
+            data.update({column: subscription_entity.get(column) for column in _SUBSCRIPTION_COLUMNS})
+            data["subscription_data"] = subscription_entity
+        if invoice_entity:
+            data["invoice_data"] = _merge_invoice(subscription.invoice_data, invoice_entity)
+        if subscription.snapshot_refreshed_at is not None:
+            # Rows never synced keep waiting for a full fetch, the event alone has no invoice history
+            data["snapshot_refreshed_at"] = event_at
+        DBInterface(Subscription).update(_id=subscription.id, data=data)
+
+
+razorpay_snapshot_cache = RazorpaySnapshotCache(
+    ttl_seconds=app_config.RAZORPAY_SNAPSHOT_TTL_SECONDS,
+    call_timeout=app_config.RAZORPAY_FANOUT_TIMEOUT_SECONDS,
+    fanout_workers=app_config.RAZORPAY_FANOUT_WORKERS
+)
@@ -7,11 +7,15 @@ from starlette import status
 from starlette.responses import JSONResponse, Response
 
 from app_logging import app_logger
+from db_domains.db import mark_rollback_only
 
 
 class ApiResponse:
     @staticmethod
     def create_response(success: bool, message: str, status_code: int, data: list = None) -> JSONResponse:
+        if not success:
+            # The client is told the request failed, so writes already flushed in its unit of work are dropped
+            mark_rollback_only()
         data_dict = {"message": message, "success": success, "status_code": status_code}
         if data:
             if 'data' in data:
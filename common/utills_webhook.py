@@ -1,5 +1,10 @@
 
 import traceback
+from typing import Any, Dict
+
+import razorpay
+
+from common.razorpay_snapshots import razorpay_snapshot_cache
 from db_domains.db import DBSession
 from models.razorpay import Subscription, PaymentDetails
 from services.razorpay_service import RazorpayService
@@ -32,6 +37,29 @@ class WebhookDBService:
             print(f" Subscription {sub_id} updated to {status}")
             return True
 
+    @staticmethod
+    def mark_subscription_authenticated(sub_id: str) -> bool:
+        """Mark the subscription authenticated and move the loan to E_MANDATE_GENERATED."""
+        with DBSession() as session:
+            sub_data = (
+                session.query(Subscription)
+                .filter(
+                    Subscription.razorpay_subscription_id == sub_id,
+                    Subscription.is_deleted == False
+                )
+                .first()
+            )
+            if not sub_data:
+                print(f"⚠ No subscription found for ID: {sub_id}")
+                return False
+
+            sub_data.status = "authenticated"
+            current_loan_status = sub_data.plan.applicant.status
+            if current_loan_status not in ["DISBURSED", "DISBURSEMENT_APPROVAL_PENDING", "COMPLETED", "CANCELLED", "CLOSED"]:
+                sub_data.plan.applicant.status = "E_MANDATE_GENERATED"
+            session.commit()
+            return True
+
     @staticmethod
     def update_payment_link_status(payment_link_id: str, status: str) -> bool:
         try:
@@ -89,7 +117,8 @@ class WebhookDBService:
                             razorpay_subscription_id)
                         print(
                             f"Subscription {razorpay_subscription_id} cancelled in Razorpay.")
-                    except Exception as api_exc:
+                    except razorpay.errors.BadRequestError as api_exc:
+                        # Rejected for good (e.g. already cancelled), retrying will not help
                         print(f"⚠ Razorpay cancellation failed: {api_exc}")
 
                 print(f"Payment Link {payment_link_id} updated to '{status}'")
@@ -99,3 +128,27 @@ class WebhookDBService:
             print(f"Error updating payment link {payment_link_id}: {e}")
             traceback.print_exc()
             return False
+
+    def handle_event(self, event: str, data: Dict[str, Any]) -> None:
+        """
+        Apply a stored Razorpay webhook event. Raises when it could not be applied, so the inbox retries it.
+        """
+        payload = data.get("payload") or {}
+        razorpay_snapshot_cache.apply_webhook_event(data)
+
+        match event:
+            case "subscription.activated":
+                sub_id = payload.get("subscription", {}).get("entity", {}).get("id")
+                if sub_id and not self.update_subscription_status(sub_id, "active"):
+                    raise LookupError(f"Subscription {sub_id} not found")
+            case "subscription.authenticated":
+                sub_id = payload.get("subscription", {}).get("entity", {}).get("id")
+                if sub_id and not self.mark_subscription_authenticated(sub_id):
+                    raise LookupError(f"Subscription {sub_id} not found")
+            case "payment_link.paid":
+                payment_link_id = (payload.get("payment_link", {}).get("entity") or {}).get("id")
+                if not payment_link_id:
+                    print("⚠ No payment link ID found in entity.")
+                    return
+                if not self.update_payment_link_status(payment_link_id, "paid"):
+                    raise LookupError(f"Payment link {payment_link_id} could not be updated")
@@ -1,27 +1,33 @@
 from datetime import datetime
+from functools import lru_cache
 from math import ceil
 from typing import Optional, List, Dict, Any
 
-from dateutil.relativedelta import relativedelta
 from fastapi import UploadFile
 from passlib.context import CryptContext
 from starlette import status
 
 from config import app_config
 from app_logging import app_logger
+from common.amortization import amortize, first_emi_month, schedule_labels, schedule_rows
 from common.cache_string import gettext
 from models.user import User, UserDocument
 from db_domains.db_interface import DBInterface
 from models.loan import EmiScheduleDate, LoanApplicant
 
+DEFAULT_EMI_SCHEDULE_DAY = 5
 
-def format_user_response(user: User, documents: Optional[list[UserDocument]] = None) -> dict:
+
+def format_user_response(
+        user: User, documents: Optional[list[UserDocument]] = None, cibil_reports: Optional[list] = None
+) -> dict:
     """
         Formats a User SQLAlchemy object along with related documents (PAN, Aadhaar).
 
         Args:
             user (User): User SQLAlchemy ORM object
             documents (List[UserDocument] | None): List of related document objects, or None
+            cibil_reports (list | None): CIBIL reports to use instead of user.cibil_reports, the last one is shown
 
         Returns:
             dict: Formatted user data with document URLs and numbers
@@ -35,8 +41,10 @@ def format_user_response(user: User, documents: Optional[list[UserDocument]] = N
         aadhaar_doc = next((doc for doc in documents if doc.document_type.value == "AADHAR"), None)
 
     cibil_data = {}
-    if user.cibil_reports:
-        user_cibil_data = user.cibil_reports[-1]
+    if cibil_reports is None:
+        cibil_reports = user.cibil_reports
+    if cibil_reports:
+        user_cibil_data = cibil_reports[-1]
         cibil_data = {
             "id": user_cibil_data.id,
             "name": user_cibil_data.name,
@@ -139,15 +147,21 @@ class PasswordHashing:
         return self.pwd_context.verify(plain_password, hashed_password)
 
 
+ALLOWED_UPLOAD_CONTENT_TYPES = [
+    "application/pdf",
+    "image/jpeg",
+    "image/jpg",
+    "image/png",
+]
+
+
+def validate_content_type(content_type: Optional[str]):
+    if content_type not in ALLOWED_UPLOAD_CONTENT_TYPES:
+        raise Exception(f"Invalid file type: {content_type}. Only PDF and images are allowed.")
+
+
 def validate_file_type(file: UploadFile):
-    allowed_types = [
-        "application/pdf",
-        "image/jpeg",
-        "image/jpg",
-        "image/png",
-    ]
-    if file.content_type not in allowed_types:
-        raise Exception(f"Invalid file type: {file.content_type}. Only PDF and images are allowed.")
+    validate_content_type(file.content_type)
 
 
 def calculate_emi(
@@ -214,22 +228,99 @@ def calculate_emi(
         }
 
 
+def resolve_emi_schedule_day(loan_type: Optional[str] = None, emi_start_day_atm: Optional[int] = None) -> Any:
+    """
+        Day of the month the EMIs fall on: the loan's own override, else the day configured for its loan type,
+        else the default.
+    """
+    if emi_start_day_atm:
+        return emi_start_day_atm
+    try:
+        emi_schedule_db_interface = DBInterface(EmiScheduleDate)
+        existing_entry = emi_schedule_db_interface.read_single_by_fields(
+            fields=[
+                EmiScheduleDate.emi_schedule_loan_type == loan_type,
+                EmiScheduleDate.is_deleted == False,
+            ]
+        )
+        return existing_entry.emi_schedule_date if existing_entry else DEFAULT_EMI_SCHEDULE_DAY
+    except Exception as e:
+        app_logger.warning(f"Error fetching EMI schedule date: {e}")
+        return DEFAULT_EMI_SCHEDULE_DAY
+
+
+class FrozenDict(dict):
+    """
+        Read-only dict, so a cached result cannot be changed by one caller under another.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("FrozenDict is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return FrozenDict((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 def calculate_emi_schedule(
         loan_amount: float, annual_interest_rate: float, tenure_months: int, processing_fee: float = 0.0,
-        is_fee_percentage: bool = False, start_date: datetime = datetime.today(),
-        loan_type: str = None, emi_start_day_atm: int = None
-
+        is_fee_percentage: bool = False, start_date: Optional[datetime] = None,
+        emi_schedule_day: Any = DEFAULT_EMI_SCHEDULE_DAY
 ) -> Dict[str, Any]:
     """
         Generate a month-wise EMI schedule with interest and principal breakdown.
+        The schedule only depends on the loan terms and the first EMI month, so results are memoized and
+        returned read-only (FrozenDict, schedule rows in a tuple). Resolve emi_schedule_day with
+        resolve_emi_schedule_day.
 
         Returns:
             dict: EMI schedule or error message.
     """
+    first_year, first_month = first_emi_month(start_date or datetime.today())
+    return _cached_emi_schedule(
+        loan_amount, annual_interest_rate, tenure_months, processing_fee, emi_schedule_day, first_year, first_month
+    )
+
+
+def emi_schedule_cache_info() -> Dict[str, Any]:
+    info = _cached_emi_schedule.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "hit_ratio": round(info.hits / lookups, 4) if lookups else 0.0,
+        "size": info.currsize,
+        "max_size": info.maxsize,
+    }
+
+
+# typed so that an int and a float amount, which render differently, never share an entry
+@lru_cache(maxsize=app_config.EMI_SCHEDULE_CACHE_SIZE, typed=True)
+def _cached_emi_schedule(
+        loan_amount: float, annual_interest_rate: float, tenure_months: int, processing_fee: float,
+        emi_schedule_day: Any, first_year: int, first_month: int
+) -> Dict[str, Any]:
+    return _freeze(_build_emi_schedule(
+        loan_amount, annual_interest_rate, tenure_months, processing_fee, emi_schedule_day,
+        datetime(first_year, first_month, 1)
+    ))
+
+
+def _build_emi_schedule(
+        loan_amount: float, annual_interest_rate: float, tenure_months: int, processing_fee: float,
+        emi_schedule_day: Any, start_date: datetime
+) -> Dict[str, Any]:
     try:
         app_logger.info(
             f"Generating EMI schedule | Principal: {loan_amount}, Tenure: {tenure_months}, Rate: {annual_interest_rate}%, "
-            f"Processing Fee: {processing_fee}, Is Fee %: {is_fee_percentage}"
+            f"Processing Fee: {processing_fee}, EMI Day: {emi_schedule_day}"
         )
 
         if loan_amount <= 0 or tenure_months <= 0:
@@ -240,59 +331,14 @@ def calculate_emi_schedule(
                 "data": {},
             }
 
-        if start_date.day >= 25:
-            current_month = (start_date.replace(day=1) + relativedelta(months=1))
-        else:
-            current_month = start_date.replace(day=1)
-
         # fee_amount = (loan_amount * (processing_fee / 100)) if is_fee_percentage else processing_fee
         total_principal = loan_amount
-        monthly_rate = annual_interest_rate / 12 / 100
-
-        emi = (total_principal * monthly_rate * (1 + monthly_rate) ** tenure_months) / (
-                (1 + monthly_rate) ** tenure_months - 1
+        amortization = amortize([total_principal], [annual_interest_rate], [tenure_months])
+        emi = float(amortization.emi[0])
+        schedule = schedule_rows(
+            amortization, 0, schedule_labels(start_date, tenure_months, emi_schedule_day)
         )
-
-        balance = total_principal
-        schedule = []
-        # Fetch Static Fixed Date 
-        emi_schedule_date = 5
-        try:
-            if emi_start_day_atm:
-                emi_schedule_date = emi_start_day_atm
-            else:
-                emi_schedule_db_interface = DBInterface(EmiScheduleDate)
-                existing_entry = emi_schedule_db_interface.read_single_by_fields(
-                        fields=[
-                            EmiScheduleDate.emi_schedule_loan_type == loan_type,
-                            EmiScheduleDate.is_deleted == False,
-                        ]
-                    )
-                emi_schedule_date = existing_entry.emi_schedule_date if existing_entry else 5
-        except Exception as e:
-            print(f"Error fetching EMI schedule date: {e}")
-
-        for month in range(1, tenure_months+1):
-            month_date = current_month + relativedelta(months=month)
-            label = f"{str(emi_schedule_date)} {month_date.strftime('%b %Y')}"
-            interest = round(balance * monthly_rate, 2)
-            principal_paid = round(emi - interest, 2)
-            balance = round(balance - principal_paid, 2)
-            balance = max(balance, 0)
-
-            schedule.append(
-                {
-                    "month": label,
-                    "principal_paid": principal_paid,
-                    "interest_paid": interest,
-                    "emi": round(emi, 2),
-                    "balance": balance,
-                    "show_balance": int(balance),
-                    "show_principal_paid": int(principal_paid),
-                    "show_interest_paid": int(interest),
-                    "show_emi": round(emi, 0),
-                }
-            )
+        total_interest = amortization.total_interest(0)
 
         return {
             "success": True,
@@ -306,9 +352,9 @@ def calculate_emi_schedule(
                 "monthly_emi": round(emi, 0),
                 "schedule": schedule,
                 # "total_interest": round(float(ceil(sum(p['interest_paid'] for p in schedule))), 2),
-                "total_interest": round(float(sum(p['interest_paid'] for p in schedule)), 0),
+                "total_interest": round(float(total_interest), 0),
                 # "total_payment": round(float(ceil(sum(p['emi'] for p in schedule))), 0),
-                "total_payment": round(float(sum(p['interest_paid'] for p in schedule))) + loan_amount
+                "total_payment": round(float(total_interest)) + loan_amount
             }
         }
 
@@ -360,8 +406,7 @@ def calculate_foreclosure_details(
                 annual_interest_rate=approved_interest_rate,
                 processing_fee=approved_processing_fee,
                 is_fee_percentage=True,
-                loan_type=loan_details.loan_type,
-                emi_start_day_atm=loan_details.emi_start_day_atm
+                emi_schedule_day=resolve_emi_schedule_day(loan_details.loan_type, loan_details.emi_start_day_atm)
             )
     
     paid_principal_amt = 0.0
@@ -0,0 +1,193 @@
+import datetime
+import hashlib
+import random
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, exists, insert, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import aliased
+
+from app_logging import app_logger
+from common.enums import WebhookEventStatus
+from common.ttl_cache import TTLCache
+from common.utills_webhook import WebhookDBService
+from config import app_config
+from db_domains import naive_utc_now
+from db_domains.db import AsyncDBSession, DBSession
+from db_domains.db_interface import DBInterface
+from models.razorpay import WebhookEvent
+
+# Unfinished events hold back later events with the same ordering key
+_OPEN_STATUSES = [WebhookEventStatus.PENDING, WebhookEventStatus.PROCESSING]
+
+# Event ids this process stored recently. Redeliveries during a retry storm are answered from here without a
+# query, the unique event_id column still catches the ones seen by other workers or after the TTL.
+recent_webhook_events = TTLCache(max_entries=app_config.WEBHOOK_DEDUPE_MAX_ENTRIES)
+
+
+def webhook_ordering_key(data: Dict[str, Any]) -> Optional[str]:
+    """
+    The Razorpay object an event belongs to, events of the same object must be applied in order.
+    """
+    payload = data.get("payload") or {}
+    for entity_name in ("subscription", "payment_link", "payment"):
+        entity = (payload.get(entity_name) or {}).get("entity") or {}
+        if entity.get("id"):
+            return entity["id"]
+    invoice = (payload.get("invoice") or {}).get("entity") or {}
+    return invoice.get("subscription_id") or invoice.get("id")
+
+
+def resolve_webhook_event_id(header_event_id: Optional[str], body: bytes, data: Dict[str, Any]) -> str:
+    # Razorpay always sends the id header, the payload id and body hash only cover hand-replayed requests
+    return header_event_id or data.get("id") or hashlib.sha256(body).hexdigest()
+
+
+async def store_webhook_event(event_id: str, data: Dict[str, Any]) -> bool:
+    """
+    Persist a verified webhook with a single INSERT. Returns False for an event id that was already stored,
+    which makes Razorpay's redeliveries no-ops.
+    """
+    if recent_webhook_events.get(event_id) is not None:
+        return False
+
+    async with AsyncDBSession() as session:
+        try:
+            now = naive_utc_now()
+            await session.execute(insert(WebhookEvent).values(
+                event_id=event_id,
+                event=data.get("event") or "",
+                ordering_key=webhook_ordering_key(data),
+                payload=data,
+                status=WebhookEventStatus.PENDING,
+                attempts=0,
+                next_attempt_at=now,
+                created_at=now,
+                modified_at=now,
+                is_deleted=False
+            ))
+            await session.commit()
+            is_new = True
+        except IntegrityError:
+            await session.rollback()
+            is_new = False
+
+    recent_webhook_events.set(event_id, True, expires_at=time.time() + app_config.WEBHOOK_DEDUPE_TTL_SECONDS)
+    return is_new
+
+
+class WebhookInboxWorker(threading.Thread):
+    """
+    Daemon thread draining the webhook inbox. Workers in every process claim events with SKIP LOCKED, an event is
+    only claimable once the earlier events of its ordering key are done, and failures are retried with
+    exponential backoff until WEBHOOK_MAX_ATTEMPTS.
+    """
+
+    def __init__(self, name: str, poll_seconds: float = app_config.WEBHOOK_POLL_SECONDS) -> None:
+        super().__init__(name=name, daemon=True)
+        self.poll_seconds = poll_seconds
+        self.handler = WebhookDBService()
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                event = self.claim_next()
+            except Exception as e:
+                app_logger.warning(f"[WebhookInbox] Claiming an event failed: {e}")
+                event = None
+            if event is None:
+                self._stop_event.wait(self.poll_seconds)
+                continue
+            self.process(event)
+
+    @staticmethod
+    def claim_next() -> Optional[Dict[str, Any]]:
+        now = naive_utc_now()
+        earlier = aliased(WebhookEvent)
+        blocked = exists().where(
+            earlier.ordering_key == WebhookEvent.ordering_key,
+            earlier.id < WebhookEvent.id,
+            earlier.status.in_(_OPEN_STATUSES)
+        )
+        stale_lock = now - datetime.timedelta(seconds=app_config.WEBHOOK_VISIBILITY_TIMEOUT_SECONDS)
+        query = (
+            select(WebhookEvent)
+            .where(
+                or_(
+                    and_(WebhookEvent.status == WebhookEventStatus.PENDING, WebhookEvent.next_attempt_at <= now),
+                    # The worker holding it died mid-event
+                    and_(WebhookEvent.status == WebhookEventStatus.PROCESSING, WebhookEvent.locked_at < stale_lock)
+                ),
+                ~blocked
+            )
+            .order_by(WebhookEvent.id)
+            .limit(1)
+            .with_for_update(skip_locked=True, of=WebhookEvent)
+        )
+        with DBSession() as session:
+            event = session.scalars(query).first()
+            if event is None:
+                session.rollback()
+                return None
+            event.status = WebhookEventStatus.PROCESSING
+            event.locked_at = now
+            event.attempts += 1
+            claimed = {"id": event.id, "event": event.event, "payload": event.payload, "attempts": event.attempts}
+            session.commit()
+            return claimed
+
+    def process(self, claimed: Dict[str, Any]) -> None:
+        try:
+            self.handler.handle_event(claimed["event"], claimed["payload"])
+        except Exception as e:
+            self._mark_failed(claimed, e)
+            return
+        self._update(claimed["id"], {
+            "status": WebhookEventStatus.PROCESSED,
+            "processed_at": naive_utc_now(),
+            "locked_at": None,
+            "last_error": None
+        })
+
+    def _mark_failed(self, claimed: Dict[str, Any], error: Exception) -> None:
+        attempts = claimed["attempts"]
+        if attempts >= app_config.WEBHOOK_MAX_ATTEMPTS:
+            app_logger.error(f"[WebhookInbox] Giving up on event {claimed['id']} ({claimed['event']}): {error}")
+            self._update(claimed["id"], {
+                "status": WebhookEventStatus.FAILED,
+                "locked_at": None,
+                "last_error": str(error)
+            })
+            return
+        delay = min(app_config.WEBHOOK_MAX_BACKOFF_SECONDS, 2 ** attempts) * random.uniform(0.5, 1.0)
+        app_logger.warning(
+            f"[WebhookInbox] Event {claimed['id']} ({claimed['event']}) failed, retrying in {delay:.0f}s: {error}"
+        )
+        self._update(claimed["id"], {
+            "status": WebhookEventStatus.PENDING,
+            "next_attempt_at": naive_utc_now() + datetime.timedelta(seconds=delay),
+            "locked_at": None,
+            "last_error": str(error)
+        })
+
+    @staticmethod
+    def _update(event_id: int, data: Dict[str, Any]) -> None:
+        DBInterface(WebhookEvent).update(_id=event_id, data=data)
+
+
+def start_webhook_workers() -> List[WebhookInboxWorker]:
+    workers = [WebhookInboxWorker(name=f"webhook-inbox-{i}") for i in range(app_config.WEBHOOK_WORKER_COUNT)]
+    for worker in workers:
+        worker.start()
+    return workers
+
+
+def stop_webhook_workers(workers: List[WebhookInboxWorker]) -> None:
+    for worker in workers:
+        worker.stop()
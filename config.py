@@ -1,5 +1,6 @@
 import os
 from functools import lru_cache
+from typing import Dict, Optional
 
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
@@ -38,6 +39,88 @@ class Setting(BaseSettings):
     SUREPASS_VALIDATION: str
     EMI_START_DATE: str
 
+    # Database connection pool
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+    DB_APPLICATION_NAME: str = "truepay-api"
+    # Defaults to DATABASE_URL with the asyncpg driver
+    ASYNC_DATABASE_URL: Optional[str] = None
+
+    # Credit score rate index
+    CREDIT_INDEX_TTL_SECONDS: int = 300
+    CREDIT_INDEX_LISTEN: bool = False
+
+    # Memoized EMI schedules
+    EMI_SCHEDULE_CACHE_SIZE: int = 4096
+
+    # Verified access token cache
+    JWT_CACHE_MAX_ENTRIES: int = 10000
+
+    # Refresh token revocation store
+    REFRESH_REVOCATION_BLOOM_CAPACITY: int = 100000
+    REFRESH_REVOCATION_BLOOM_ERROR_RATE: float = 0.001
+    REFRESH_REVOCATION_SYNC_SECONDS: int = 5
+    REFRESH_REVOCATION_REBUILD_SECONDS: int = 3600
+
+    # Razorpay HTTP gateway
+    RAZORPAY_API_BASE_URL: str = "https://api.razorpay.com/v1"
+    RAZORPAY_TIMEOUT_SECONDS: float = 10.0
+    RAZORPAY_MAX_RETRIES: int = 3
+    RAZORPAY_MAX_CONNECTIONS: int = 20
+    RAZORPAY_HTTP2: bool = True
+    RAZORPAY_SNAPSHOT_TTL_SECONDS: int = 900
+    RAZORPAY_FANOUT_TIMEOUT_SECONDS: float = 8.0
+    RAZORPAY_FANOUT_WORKERS: int = 8
+
+    # Webhook inbox workers
+    WEBHOOK_WORKER_COUNT: int = 2
+    WEBHOOK_POLL_SECONDS: float = 1.0
+    WEBHOOK_MAX_ATTEMPTS: int = 8
+    WEBHOOK_MAX_BACKOFF_SECONDS: int = 600
+    WEBHOOK_VISIBILITY_TIMEOUT_SECONDS: int = 300
+    WEBHOOK_DEDUPE_TTL_SECONDS: int = 600
+    WEBHOOK_DEDUPE_MAX_ENTRIES: int = 50000
+    AWS_S3_ENDPOINT_URL: Optional[str] = None
+    S3_UPLOAD_CONCURRENCY: int = 4
+    S3_MAX_POOL_CONNECTIONS: int = 20
+    S3_MULTIPART_THRESHOLD_BYTES: int = 8 * 1024 * 1024
+    S3_MULTIPART_CHUNK_BYTES: int = 8 * 1024 * 1024
+    S3_MULTIPART_CONCURRENCY: int = 2
+    S3_UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024
+    S3_PRESIGNED_EXPIRES_SECONDS: int = 900
+    SMTP_HOST: str = "smtp.gmail.com"
+    SMTP_PORT: int = 465
+    SMTP_USE_SSL: bool = True
+    SMTP_TIMEOUT_SECONDS: float = 30.0
+    EMAIL_WORKER_COUNT: int = 1
+    EMAIL_POLL_SECONDS: float = 2.0
+    EMAIL_BATCH_SIZE: int = 20
+    EMAIL_MAX_ATTEMPTS: int = 5
+    EMAIL_MAX_BACKOFF_SECONDS: int = 600
+    EMAIL_VISIBILITY_TIMEOUT_SECONDS: int = 300
+    EMAIL_SMTP_IDLE_SECONDS: int = 60
+    SMS_GATEWAY_URL: str = "http://ahd.sendsmsbox.com/api/mt/SendSMS"
+    SMS_TIMEOUT_SECONDS: float = 5.0
+    SMS_MAX_CONNECTIONS: int = 10
+    SMS_QUEUE_SIZE: int = 1000
+    SMS_WORKER_COUNT: int = 4
+    SMS_BREAKER_FAILURE_THRESHOLD: int = 5
+    SMS_BREAKER_RESET_SECONDS: float = 30.0
+    SURPASS_HTTP2: bool = True
+    SURPASS_MAX_CONNECTIONS: int = 20
+    SURPASS_CACHE_MAX_ENTRIES: int = 10000
+    # JSON like {"pan/pan": {"timeout": 5, "cache_ttl_seconds": 3600}}, merged over the built-in endpoint policies
+    SURPASS_ENDPOINT_POLICIES: Dict[str, dict] = {}
+    CREDIT_REPORT_STORE_BACKEND: str = "local"  # local or s3
+    CREDIT_REPORT_STORE_PATH: str = "storage/credit_reports"
+    CREDIT_REPORT_STORE_BUCKET: Optional[str] = None
+    CREDIT_REPORT_STORE_PREFIX: str = "credit_reports"
+    CREDIT_REPORT_ZSTD_LEVEL: int = 10
+
     # Default Log type
     LOG_LEVEL: str
 
@@ -104,6 +187,72 @@ class Config(object):
     WEBHOOK_SECRET = app_settings.WEBHOOK_SECRET
     SUREPASS_VALIDATION = app_settings.SUREPASS_VALIDATION
     EMI_START_DATE = app_settings.EMI_START_DATE
+    DB_POOL_SIZE = app_settings.DB_POOL_SIZE
+    DB_MAX_OVERFLOW = app_settings.DB_MAX_OVERFLOW
+    DB_POOL_TIMEOUT = app_settings.DB_POOL_TIMEOUT
+    DB_POOL_RECYCLE = app_settings.DB_POOL_RECYCLE
+    DB_POOL_PRE_PING = app_settings.DB_POOL_PRE_PING
+    DB_STATEMENT_TIMEOUT_MS = app_settings.DB_STATEMENT_TIMEOUT_MS
+    DB_APPLICATION_NAME = app_settings.DB_APPLICATION_NAME
+    ASYNC_DATABASE_URL = app_settings.ASYNC_DATABASE_URL
+    CREDIT_INDEX_TTL_SECONDS = app_settings.CREDIT_INDEX_TTL_SECONDS
+    CREDIT_INDEX_LISTEN = app_settings.CREDIT_INDEX_LISTEN
+    EMI_SCHEDULE_CACHE_SIZE = app_settings.EMI_SCHEDULE_CACHE_SIZE
+    JWT_CACHE_MAX_ENTRIES = app_settings.JWT_CACHE_MAX_ENTRIES
+    REFRESH_REVOCATION_BLOOM_CAPACITY = app_settings.REFRESH_REVOCATION_BLOOM_CAPACITY
+    REFRESH_REVOCATION_BLOOM_ERROR_RATE = app_settings.REFRESH_REVOCATION_BLOOM_ERROR_RATE
+    REFRESH_REVOCATION_SYNC_SECONDS = app_settings.REFRESH_REVOCATION_SYNC_SECONDS
+    REFRESH_REVOCATION_REBUILD_SECONDS = app_settings.REFRESH_REVOCATION_REBUILD_SECONDS
+    RAZORPAY_API_BASE_URL = app_settings.RAZORPAY_API_BASE_URL
+    RAZORPAY_TIMEOUT_SECONDS = app_settings.RAZORPAY_TIMEOUT_SECONDS
+    RAZORPAY_MAX_RETRIES = app_settings.RAZORPAY_MAX_RETRIES
+    RAZORPAY_MAX_CONNECTIONS = app_settings.RAZORPAY_MAX_CONNECTIONS
+    RAZORPAY_HTTP2 = app_settings.RAZORPAY_HTTP2
+    RAZORPAY_SNAPSHOT_TTL_SECONDS = app_settings.RAZORPAY_SNAPSHOT_TTL_SECONDS
+    RAZORPAY_FANOUT_TIMEOUT_SECONDS = app_settings.RAZORPAY_FANOUT_TIMEOUT_SECONDS
+    RAZORPAY_FANOUT_WORKERS = app_settings.RAZORPAY_FANOUT_WORKERS
+    WEBHOOK_WORKER_COUNT = app_settings.WEBHOOK_WORKER_COUNT
+    WEBHOOK_POLL_SECONDS = app_settings.WEBHOOK_POLL_SECONDS
+    WEBHOOK_MAX_ATTEMPTS = app_settings.WEBHOOK_MAX_ATTEMPTS
+    WEBHOOK_MAX_BACKOFF_SECONDS = app_settings.WEBHOOK_MAX_BACKOFF_SECONDS
+    WEBHOOK_VISIBILITY_TIMEOUT_SECONDS = app_settings.WEBHOOK_VISIBILITY_TIMEOUT_SECONDS
+    WEBHOOK_DEDUPE_TTL_SECONDS = app_settings.WEBHOOK_DEDUPE_TTL_SECONDS
+    WEBHOOK_DEDUPE_MAX_ENTRIES = app_settings.WEBHOOK_DEDUPE_MAX_ENTRIES
+    AWS_S3_ENDPOINT_URL = app_settings.AWS_S3_ENDPOINT_URL
+    S3_UPLOAD_CONCURRENCY = app_settings.S3_UPLOAD_CONCURRENCY
+    S3_MAX_POOL_CONNECTIONS = app_settings.S3_MAX_POOL_CONNECTIONS
+    S3_MULTIPART_THRESHOLD_BYTES = app_settings.S3_MULTIPART_THRESHOLD_BYTES
+    S3_MULTIPART_CHUNK_BYTES = app_settings.S3_MULTIPART_CHUNK_BYTES
+    S3_MULTIPART_CONCURRENCY = app_settings.S3_MULTIPART_CONCURRENCY
+    S3_UPLOAD_MAX_BYTES = app_settings.S3_UPLOAD_MAX_BYTES
+    S3_PRESIGNED_EXPIRES_SECONDS = app_settings.S3_PRESIGNED_EXPIRES_SECONDS
+    SMTP_HOST = app_settings.SMTP_HOST
+    SMTP_PORT = app_settings.SMTP_PORT
+    SMTP_USE_SSL = app_settings.SMTP_USE_SSL
+    SMTP_TIMEOUT_SECONDS = app_settings.SMTP_TIMEOUT_SECONDS
+    EMAIL_WORKER_COUNT = app_settings.EMAIL_WORKER_COUNT
+    EMAIL_POLL_SECONDS = app_settings.EMAIL_POLL_SECONDS
+    EMAIL_BATCH_SIZE = app_settings.EMAIL_BATCH_SIZE
+    EMAIL_MAX_ATTEMPTS = app_settings.EMAIL_MAX_ATTEMPTS
+    EMAIL_MAX_BACKOFF_SECONDS = app_settings.EMAIL_MAX_BACKOFF_SECONDS
+    EMAIL_VISIBILITY_TIMEOUT_SECONDS = app_settings.EMAIL_VISIBILITY_TIMEOUT_SECONDS
+    EMAIL_SMTP_IDLE_SECONDS = app_settings.EMAIL_SMTP_IDLE_SECONDS
+    SMS_GATEWAY_URL = app_settings.SMS_GATEWAY_URL
+    SMS_TIMEOUT_SECONDS = app_settings.SMS_TIMEOUT_SECONDS
+    SMS_MAX_CONNECTIONS = app_settings.SMS_MAX_CONNECTIONS
+    SMS_QUEUE_SIZE = app_settings.SMS_QUEUE_SIZE
+    SMS_WORKER_COUNT = app_settings.SMS_WORKER_COUNT
+    SMS_BREAKER_FAILURE_THRESHOLD = app_settings.SMS_BREAKER_FAILURE_THRESHOLD
+    SMS_BREAKER_RESET_SECONDS = app_settings.SMS_BREAKER_RESET_SECONDS
+    SURPASS_HTTP2 = app_settings.SURPASS_HTTP2
+    SURPASS_MAX_CONNECTIONS = app_settings.SURPASS_MAX_CONNECTIONS
+    SURPASS_CACHE_MAX_ENTRIES = app_settings.SURPASS_CACHE_MAX_ENTRIES
+    SURPASS_ENDPOINT_POLICIES = app_settings.SURPASS_ENDPOINT_POLICIES
+    CREDIT_REPORT_STORE_BACKEND = app_settings.CREDIT_REPORT_STORE_BACKEND
+    CREDIT_REPORT_STORE_PATH = app_settings.CREDIT_REPORT_STORE_PATH
+    CREDIT_REPORT_STORE_BUCKET = app_settings.CREDIT_REPORT_STORE_BUCKET
+    CREDIT_REPORT_STORE_PREFIX = app_settings.CREDIT_REPORT_STORE_PREFIX
+    CREDIT_REPORT_ZSTD_LEVEL = app_settings.CREDIT_REPORT_ZSTD_LEVEL
 
 
 class LocalConfig(Config):
@@ -1,6 +1,3 @@
-import json
-import re
-
 import jwt
 from fastapi import Request
 from starlette import status
@@ -12,39 +9,12 @@ from common.common_services.jwt_service import JWTService
 from common.enums import UserRole
 from common.response import ApiResponse
 from config import app_config
+from custom_middleware.public_routes import public_path_matcher
 
 # Initialize JWT service
 jwt_service_obj = JWTService()
 SECRET_KEY = app_config.JWT_SECRET_KEY
 
-# Public paths with a full prefix
-API_PREFIX = "/api/base"
-
-PUBLIC_PATHS = {
-    "user": [
-        "/user/send-otp",
-        "/user/verify-otp",
-        "/user/register",
-        "/user/refresh-token"
-    ],
-    "admin": [
-        "/admin/user/auth"
-    ],
-    "global": [
-        "/docs",
-        "/openapi.json",
-        "/open-api",
-        "/media"
-    ],
-    "razorpay":[
-        "/razorpay/webhook"
-    ],
-    "general":[
-        "/contact-us/create-contact-message"
-    ]
-    
-}
-
 
 class AuthMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
@@ -52,28 +22,9 @@ class AuthMiddleware(BaseHTTPMiddleware):
         request_path = request.url.path.rstrip("/")
         app_logger.info(f"[AuthMiddleware] Request path: {request_path}")
 
-        # Combine and normalize all public paths
-        all_public_paths = PUBLIC_PATHS["user"] + PUBLIC_PATHS["admin"] + PUBLIC_PATHS["global"] + PUBLIC_PATHS["razorpay"] + PUBLIC_PATHS["general"]
-        regex_patterns = []
-
-        for path in all_public_paths:
-            path = path.rstrip("/")
-
-            # Generate both the base-prefixed and short variants
-            full_path = f"{API_PREFIX}{path}"
-            short_path = path
-
-            for variant in [full_path, short_path]:
-                # Convert FastAPI-style path params ({param}) to regex
-                pattern = re.sub(r"{[^/]+}", r"[^/]+", variant)
-                pattern = f"^{pattern}$"
-                regex_patterns.append(pattern)
-
-        # Match against regex patterns
-        for pattern in regex_patterns:
-            if re.fullmatch(pattern, request_path):
-                app_logger.info(f"[AuthMiddleware] Matched public path via regex → skipping auth: {pattern}")
-                return await call_next(request)
+        if public_path_matcher.matches(request_path):
+            app_logger.info(f"[AuthMiddleware] Matched public path → skipping auth: {request_path}")
+            return await call_next(request)
 
         # Require Authorization header
         auth_header = request.headers.get("Authorization")
@@ -90,12 +41,8 @@ class AuthMiddleware(BaseHTTPMiddleware):
         app_logger.info(f"[AuthMiddleware] Found token: {token[:10]}...")
 
         try:
-            payload = jwt_service_obj.verify_access_token(token)
-
-            # Decode if necessary
-            if not isinstance(payload, dict):
-                response_body = payload.body
-                payload = json.loads(response_body.decode('utf-8'))
+            # Cached after the first verification, raises the jwt errors handled below
+            payload = jwt_service_obj.decode_access_token(token)
 
             user_id = payload.get("id")
             user_role = payload.get("user_role")
@@ -0,0 +1,71 @@
+import re
+from typing import Callable, Iterable, Optional, Pattern
+
+from fastapi.routing import APIRoute
+
+# Public paths with a full prefix
+API_PREFIX = "/api/base"
+
+# Paths that are not API routes (docs, static files) or are public without a route yet.
+# API routes mark themselves public with @public_route instead of being listed here.
+STATIC_PUBLIC_PATHS = [
+    "/user/register",
+    "/docs",
+    "/openapi.json",
+    "/open-api",
+    "/media"
+]
+
+_PUBLIC_ROUTE_FLAG = "__public_route__"
+_PATH_PARAM = re.compile(r"{[^/]+}")
+
+
+def public_route(endpoint: Callable) -> Callable:
+    """
+    Mark a route as reachable without an access token. Apply it below the router decorator:
+
+        @router.post("/send-otp")
+        @public_route
+        async def send_otp(...):
+    """
+    setattr(endpoint, _PUBLIC_ROUTE_FLAG, True)
+    return endpoint
+
+
+class PublicPathMatcher:
+    """
+    Public paths compiled once: static paths go in a set, parameterized ones ({param}) into a single regex.
+    Every path is registered with and without the API prefix.
+    """
+
+    def __init__(self, paths: Iterable[str] = ()) -> None:
+        self._exact_paths: set[str] = set()
+        self._param_patterns: list[str] = []
+        self._param_regex: Optional[Pattern] = None
+        for path in paths:
+            self.add(path)
+
+    def add(self, path: str) -> None:
+        path = path.rstrip("/")
+        for variant in (f"{API_PREFIX}{path}", path):
+            if not _PATH_PARAM.search(variant):
+                self._exact_paths.add(variant)
+                continue
+            pattern = "[^/]+".join(re.escape(part) for part in _PATH_PARAM.split(variant))
+            if pattern not in self._param_patterns:
+                self._param_patterns.append(pattern)
+                self._param_regex = re.compile("|".join(f"(?:{p})" for p in self._param_patterns))
+
+    def register_routes(self, routes: Iterable) -> None:
+        for route in routes:
+            if isinstance(route, APIRoute) and getattr(route.endpoint, _PUBLIC_ROUTE_FLAG, False):
+                self.add(route.path)
+
+    def matches(self, path: str) -> bool:
+        path = path.rstrip("/")
+        if path in self._exact_paths:
+            return True
+        return self._param_regex is not None and self._param_regex.fullmatch(path) is not None
+
+
+public_path_matcher = PublicPathMatcher(STATIC_PUBLIC_PATHS)
@@ -27,11 +27,19 @@ def utc_now():
     return datetime.datetime.now(datetime.UTC)
 
 
+def naive_utc_now() -> datetime.datetime:
+    """
+    Current UTC time without tzinfo, the form the DateTime columns store and compare against.
+    """
+    return utc_now().replace(tzinfo=None)
+
+
 class CreateUpdateTime(Base):
     __abstract__ = True
 
-    created_at = Column(DateTime, default=utc_now)
-    modified_at = Column(DateTime, default=utc_now, onupdate=utc_now)
+    # Naive UTC, asyncpg rejects aware values for TIMESTAMP WITHOUT TIME ZONE columns
+    created_at = Column(DateTime, default=naive_utc_now)
+    modified_at = Column(DateTime, default=naive_utc_now, onupdate=naive_utc_now)
 
     is_deleted = Column(Boolean, default=False)
     deleted_at = Column(DateTime, nullable=True)
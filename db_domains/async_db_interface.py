@@ -0,0 +1,195 @@
+from datetime import datetime
+from typing import Any, Optional, Sequence, List
+
+from sqlalchemy import select, func, desc, asc
+from sqlalchemy.exc import SQLAlchemyError
+
+from db_domains import Base
+from db_domains.db import AsyncDBSession
+from db_domains.db_interface import DataObject, FilterExpressionMixin
+
+
+class AsyncDBInterface(FilterExpressionMixin):
+    """
+    Async counterpart of DBInterface for async def routes, so queries never block the event loop.
+    """
+
+    def __init__(self, db_model: type[Base]) -> None:
+        self.db_class: type[Base] = db_model
+
+    # Get Methods
+    async def read_all(self) -> Optional[list[Base]]:
+        async with AsyncDBSession() as session:
+            try:
+                items = (await session.scalars(select(self.db_class))).all()
+                return list(items) or None
+            except SQLAlchemyError as e:
+                await session.rollback()
+                raise Exception(f"Error reading all records from {self.db_class.__name__}: {str(e)}")
+
+    async def exists_by_id(self, _id: Any) -> bool:
+        async with AsyncDBSession() as session:
+            try:
+                query = select(self.db_class.id).where(self.db_class.id == _id).limit(1)
+                return (await session.scalar(query)) is not None
+            except SQLAlchemyError as e:
+                await session.rollback()
+                raise Exception(f"Error checking existence of {self.db_class.__name__} with ID {_id}: {str(e)}")
+
+    async def read_by_id(self, _id: Any) -> Optional[Base]:
+        async with AsyncDBSession() as session:
+            try:
+                return await session.get(self.db_class, _id)
+            except SQLAlchemyError as e:
+                await session.rollback()
+                raise Exception(f"Error reading {self.db_class.__name__} with ID {_id}: {str(e)}")
+
+    async def read_by_fields(self, fields: list) -> Optional[Sequence[Base]]:
+        async with AsyncDBSession() as session:
+            try:
+                items = (await session.scalars(select(self.db_class).where(*fields))).all()
+                return list(items) if items else None
+            except Exception as e:
+                await session.rollback()
+                raise Exception(f"Error reading records by fields in {self.db_class.__name__}: {str(e)}")
+
+    async def read_single_by_fields(self, fields: list, options: Optional[list] = None) -> Optional[Base]:
+        async with AsyncDBSession() as session:
+            try:
+                query = select(self.db_class).where(*fields).limit(1)
+                if options:
+                    query = query.options(*options)
+                return (await session.scalars(query)).first()
+            except Exception as e:
+                await session.rollback()
+                raise Exception(f"Error reading single record by fields in {self.db_class.__name__}: {str(e)}")
+
+    async def read_all_by_filters(
+            self, filter_expr: Optional[Any] = None, order_by: Optional[Any] = None, limit: int = 10, offset: int = 0,
+            order_direction: str = "asc"
+    ):
+        async with AsyncDBSession() as session:
+            try:
+                query = select(self.db_class)
+
+                if filter_expr is not None:
+                    query = query.where(filter_expr)
+
+                total_count = await session.scalar(select(func.count()).select_from(query.subquery()))
+
+                if order_by is not None:
+                    query = query.order_by(desc(order_by) if order_direction == "desc" else asc(order_by))
+
+                results = (await session.scalars(query.offset(offset).limit(limit))).all()
+                return list(results), total_count
+            except Exception as e:
+                raise Exception(f"Error reading with filters in {self.db_class.__name__}: {str(e)}")
+
+    async def count_all_by_fields(self, filters: list) -> int:
+        async with AsyncDBSession() as session:
+            try:
+                count = await session.scalar(select(func.count()).select_from(self.db_class).where(*filters))
+                return count or 0
+            except Exception as e:
+                await session.rollback()
+                raise Exception(f"Error counting records by fields in {self.db_class.__name__}: {str(e)}")
+
+    # Create Methods
+    async def create(self, data: dict[str, Any]) -> Base:
+        async with AsyncDBSession() as session:
+            try:
+                item = self.db_class(**data)
+                session.add(item)
+                await session.commit()
+                await session.refresh(item)
+                return item
+            except SQLAlchemyError as e:
+                await session.rollback()
+                raise Exception(f"Error creating {self.db_class.__name__}: {str(e)}")
+
+    async def bulk_create(self, data_list: list[dict]):
+        async with AsyncDBSession() as session:
+            try:
+                instances = [self.db_class(**data) for data in data_list]
+                session.add_all(instances)
+                await session.commit()
+
+                for instance in instances:
+                    await session.refresh(instance)
+
+                return instances
+            except Exception as e:
+                await session.rollback()
+                raise Exception(f"Error in bulk_create for {self.db_class.__name__}: {str(e)}")
+
+    # Update Methods
+    async def update(self, _id: str, data: DataObject, lookup_field: str = None, update_all: bool = False) -> Base | \
+            list[Base] | None:
+        async with AsyncDBSession() as session:
+            try:
+                if lookup_field is None:
+                    items = [await session.get(self.db_class, _id)]
+                    if not items[0]:
+                        raise Exception(f"{self.db_class.__name__} with id = {_id} not found")
+                else:
+                    field_attr = getattr(self.db_class, lookup_field, None)
+                    if field_attr is None:
+                        raise Exception(f"Field '{lookup_field}' not found in model {self.db_class.__name__}")
+
+                    query = select(self.db_class).where(field_attr == _id)
+                    if not update_all:
+                        query = query.limit(1)
+                    items = list((await session.scalars(query)).all())
+                    if not items:
+                        raise Exception(f"{self.db_class.__name__} with {lookup_field} = {_id} not found")
+
+                for item in items:
+                    for key, value in data.items():
+                        setattr(item, key, value)
+
+                await session.commit()
+                for item in items:
+                    await session.refresh(item)
+
+                return items if update_all and lookup_field is not None else items[0]
+
+            except Exception as e:
+                await session.rollback()
+                raise Exception(
+                    f"Error updating {self.db_class.__name__} with {lookup_field or 'id'} = {_id}: {str(e)}"
+                )
+
+    # Delete Methods
+    async def delete(self, filters: list) -> bool:
+        async with AsyncDBSession() as session:
+            try:
+                items = (await session.scalars(select(self.db_class).where(*filters))).all()
+                if not items:
+                    return False
+                for item in items:
+                    await session.delete(item)
+                await session.commit()
+                return True
+            except Exception as e:
+                await session.rollback()
+                raise Exception(f"Error deleting record from {self.db_class.__name__}: {str(e)}")
+
+    async def soft_delete(self, filters: List[Any], modified_id: Optional[str] = None) -> bool:
+        async with AsyncDBSession() as session:
+            try:
+                items = (await session.scalars(select(self.db_class).where(*filters))).all()
+                if not items:
+                    return False
+
+                for item in items:
+                    item.is_deleted = True
+                    item.is_active = False
+                    item.deleted_at = datetime.now()
+                    if modified_id:
+                        item.modified_by = modified_id
+
+                await session.commit()
+                return True
+            except Exception as e:
+                await session.rollback()
+                raise Exception(f"Error performing soft delete in {self.db_class.__name__}: {str(e)}")
@@ -1,20 +1,65 @@
-from sqlalchemy.engine import create_engine
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+from sqlalchemy.engine import create_engine, make_url
 from sqlalchemy.engine.base import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base, Session
+from starlette.concurrency import run_in_threadpool
 
 from config import app_config
+from db_domains.db.pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
 
 # Create the database engine
 engine: Engine = create_engine(
-    app_config.DATABASE_URL, connect_args={'connect_timeout': 10}
+    app_config.DATABASE_URL,
+    poolclass=InstrumentedQueuePool,
+    pool_size=app_config.DB_POOL_SIZE,
+    max_overflow=app_config.DB_MAX_OVERFLOW,
+    pool_timeout=app_config.DB_POOL_TIMEOUT,
+    pool_recycle=app_config.DB_POOL_RECYCLE,
+    pool_pre_ping=app_config.DB_POOL_PRE_PING,
+    connect_args={
+        'connect_timeout': 10,
+        'application_name': app_config.DB_APPLICATION_NAME,
+        'options': f'-c statement_timeout={app_config.DB_STATEMENT_TIMEOUT_MS}',
+    }
 )
 
 # Configure session factory
 DBSession = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine for async def routes, same database through the asyncpg driver
+async_engine: AsyncEngine = create_async_engine(
+    app_config.ASYNC_DATABASE_URL or make_url(app_config.DATABASE_URL).set(drivername="postgresql+asyncpg"),
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    pool_size=app_config.DB_POOL_SIZE,
+    max_overflow=app_config.DB_MAX_OVERFLOW,
+    pool_timeout=app_config.DB_POOL_TIMEOUT,
+    pool_recycle=app_config.DB_POOL_RECYCLE,
+    pool_pre_ping=app_config.DB_POOL_PRE_PING,
+    connect_args={
+        'timeout': 10,
+        'server_settings': {
+            'application_name': app_config.DB_APPLICATION_NAME,
+            'statement_timeout': str(app_config.DB_STATEMENT_TIMEOUT_MS),
+        },
+    }
+)
+
+# Async session factory, objects stay usable after commit since they are returned to the caller
+AsyncDBSession = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
 # Base class for models
 Base = declarative_base()
 
+# Session shared by every DBInterface call inside an active unit of work
+current_session: ContextVar[Optional[Session]] = ContextVar("current_session", default=None)
+
+# Set on the session's info dict when a write inside the unit of work failed
+ROLLBACK_ONLY = "rollback_only"
+
 
 def create_db(file: str):
     """
@@ -44,3 +89,72 @@ def get_db():
         yield db  # Provide the session
     finally:
         db.close()  # Close the session after request
+
+
+def mark_rollback_only() -> None:
+    """
+    Roll back the active unit of work, if any, instead of committing it. For services that catch their
+    errors and report a failure without raising.
+    """
+    session = current_session.get()
+    if session is not None:
+        session.info[ROLLBACK_ONLY] = True
+
+
+def _finish_unit_of_work(session: Session, failed: bool) -> None:
+    try:
+        if failed or session.info.get(ROLLBACK_ONLY):
+            session.rollback()
+        else:
+            session.commit()
+    finally:
+        session.close()
+
+
+@contextmanager
+def unit_of_work() -> Iterator[Session]:
+    """
+    Bind one session to the current context so every DBInterface call made inside the block
+    shares it. Writes are flushed as they happen and committed once when the block exits.
+    Nested calls reuse the outer unit of work.
+    """
+    session = current_session.get()
+    if session is not None:
+        yield session
+        return
+
+    session = DBSession()
+    token = current_session.set(session)
+    failed = False
+    try:
+        yield session
+    except Exception:
+        failed = True
+        raise
+    finally:
+        current_session.reset(token)
+        _finish_unit_of_work(session, failed)
+
+
+# ✅ Request scoped unit of work for FastAPI
+async def get_unit_of_work():
+    """
+    Dependency function that opens a unit of work for the whole request.
+    It is async on purpose: the context variable is set on the request task, so sync endpoints
+    running in the threadpool inherit it. The transaction is committed once before the response is sent.
+    """
+    if current_session.get() is not None:
+        yield current_session.get()
+        return
+
+    session: Session = DBSession()
+    token = current_session.set(session)
+    failed = False
+    try:
+        yield session
+    except Exception:
+        failed = True
+        raise
+    finally:
+        current_session.reset(token)
+        await run_in_threadpool(_finish_unit_of_work, session, failed)
@@ -1,13 +1,17 @@
+import base64
+import json
 import operator
 from datetime import datetime
 from typing import Any, Optional, Sequence, Dict, List
 
-from sqlalchemy import and_, or_, not_, desc, asc, func
+from sqlalchemy import and_, or_, not_, desc, asc, func, tuple_, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload, load_only, defer
 
+from common.cache_string import gettext
+from common.enums import CountMode
 from db_domains import Base
-from db_domains.db import DBSession
+from db_domains.db import DBSession, ROLLBACK_ONLY, current_session
 
 DataObject = dict[str, Any]
 OPERATORS = {
@@ -25,11 +29,39 @@ OPERATORS = {
 }
 
 
-class DBInterface:
-    def __init__(self, db_model: type[Base]) -> None:
-        self.db_class: type[Base] = db_model
+# Cursor pages are keyed on (created_at, id), so that is the only ordering they can follow
+CURSOR_ORDER_FIELDS = ("created_at", "id")
+
+
+class InvalidCursorError(ValueError):
+    """
+    Raised for a malformed pagination cursor or an ordering cursor pagination cannot serve.
+    """
+
+
+def encode_cursor(created_at: datetime, _id: Any) -> str:
+    payload = json.dumps({"created_at": created_at.isoformat(), "id": _id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, Any]:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        created_at, _id = datetime.fromisoformat(payload["created_at"]), payload["id"]
+    except (ValueError, KeyError, TypeError):
+        raise InvalidCursorError(gettext("invalid_pagination_cursor"))
+    # Cursor paginated tables have integer keys, anything else would fail later in the SQL comparison
+    if not isinstance(_id, int) or isinstance(_id, bool):
+        raise InvalidCursorError(gettext("invalid_pagination_cursor"))
+    return created_at, _id
+
+
+class FilterExpressionMixin:
+    """
+    Filter DSL shared by the sync and async interfaces.
+    """
+    db_class: type[Base]
 
-    # Get Methods
     def build_filter_expression(self, filter_def: Dict[str, Any]):
         if "AND" in filter_def:
             return and_(*[self.build_filter_expression(f) for f in filter_def["AND"]])
@@ -49,64 +81,101 @@ class DBInterface:
         else:
             raise ValueError(f"Invalid filter structure: {filter_def}")
 
+
+class DBInterface(FilterExpressionMixin):
+    def __init__(self, db_model: type[Base]) -> None:
+        self.db_class: type[Base] = db_model
+
+    # Session Handling
+    @staticmethod
+    def _acquire_session() -> tuple[Session, bool]:
+        """
+        Return the session of the active unit of work if there is one, otherwise a new session.
+        The flag tells the caller whether the session is shared.
+        """
+        session = current_session.get()
+        if session is not None:
+            return session, True
+        return DBSession(), False
+
+    @staticmethod
+    def _commit(session: Session, is_scoped: bool) -> None:
+        # Inside a unit of work only flush; the owner of the session commits once at the end
+        if is_scoped:
+            session.flush()
+        else:
+            session.commit()
+
+    @staticmethod
+    def _rollback(session: Session, is_scoped: bool) -> None:
+        session.rollback()
+        if is_scoped:
+            session.info[ROLLBACK_ONLY] = True
+
+    @staticmethod
+    def _release(session: Session, is_scoped: bool) -> None:
+        if not is_scoped:
+            session.close()
+
+    # Get Methods
     def read_all(self) -> Optional[list[Base]]:
-        session: Session = DBSession()
+        session, is_scoped = self._acquire_session()
         try:
             items = session.query(self.db_class).all()
             return items or None
         except SQLAlchemyError as e:
-            session.rollback()
+            self._rollback(session, is_scoped)
             raise Exception(f"Error reading all records from {self.db_class.__name__}: {str(e)}")
         finally:
-            session.close()
+            self._release(session, is_scoped)
 
     def exists_by_id(self, _id: Any) -> bool:
-        session: Session = DBSession()
+        session, is_scoped = self._acquire_session()
         try:
             return session.query(self.db_class).filter(self.db_class.id == _id).first() is not None
         except SQLAlchemyError as e:
-            session.rollback()
+            self._rollback(session, is_scoped)
             raise Exception(f"Error checking existence of {self.db_class.__name__} with ID {_id}: {str(e)}")
         finally:
-            session.close()
+            self._release(session, is_scoped)
 
     def read_by_id(self, _id: Any) -> Optional[Base]:
-        session: Session = DBSession()
+        session, is_scoped = self._acquire_session()
         try:
             return session.get(self.db_class, _id)
         except SQLAlchemyError as e:
-            session.rollback()
+            self._rollback(session, is_scoped)
             raise Exception(f"Error reading {self.db_class.__name__} with ID {_id}: {str(e)}")
         finally:
-            session.close()
+            self._release(session, is_scoped)
 
     def read_by_fields(self, fields: list) -> Optional[Sequence[Base]]:
-        session = DBSession()
+        session, is_scoped = self._acquire_session()
         try:
             items = session.query(self.db_class).filter(*fields).all()
             return items if items else None
         except Exception as e:
-            session.rollback()
+            self._rollback(session, is_scoped)
             raise Exception(f"Error reading records by fields in {self.db_class.__name__}: {str(e)}")
         finally:
-            session.close()
+            self._release(session, is_scoped)
 
     def read_single_by_fields(self, fields: list) -> Optional[Base]:
-        session = DBSession()
+        session, is_scoped = self._acquire_session()
         try:
             item = session.query(self.db_class).filter(*fields).first()
             return item if item else None
         except Exception as e:
-            session.rollback()
+            self._rollback(session, is_scoped)
             raise Exception(f"Error reading single record by fields in {self.db_class.__name__}: {str(e)}")
         finally:
-            session.close()
+            self._release(session, is_scoped)
 
     def read_all_by_filters(
             self, filter_expr: Optional[Any] = None, order_by: Optional[Any] = None, limit: int = 10, offset: int = 0,
             order_direction: str = "asc"
     ):
-        session: Session = DBSession()
+        session, is_scoped = self._acquire_session()
         try:
             query = session.query(self.db_class)
 
@@ -125,18 +194,32 @@ class DBInterface:
             results = query.all()
             return results, total_count
         except Exception as e:
-            session.close()
+            self._release(session, is_scoped)
             raise Exception(f"Error reading with filters in {self.db_class.__name__}: {str(e)}")
         finally:
-            session.close()
+            self._release(session, is_scoped)
+
+    @staticmethod
+    def projection_options(load_columns: Optional[list] = None, defer_columns: Optional[list] = None) -> list:
+        """
+        Loader options for a lean load: only `load_columns` are selected and `defer_columns` are left out.
+        The other columns are loaded on first access, which fails once the session is closed.
+        """
+        options = []
+        if load_columns:
+            options.append(load_only(*load_columns))
+        if defer_columns:
+            options.extend(defer(column) for column in defer_columns)
+        return options
 
     def read_all_by_filters_with_joins(
             self, filter_expr: Optional[Any] = None, order_by: Optional[Any] = None,
             limit: int = 10, offset: int = 0, order_direction: str = "asc", join_model: Optional[Any] = None,
             join_on_left: str = "id", join_on_right: str = None,
-            relationship_name: Optional[str] = None
+            relationship_name: Optional[str] = None, options: Optional[list] = None,
+            load_columns: Optional[list] = None, defer_columns: Optional[list] = None
     ):
-        session: Session = DBSession()
+        session, is_scoped = self._acquire_session()
         try:
             query = session.query(self.db_class)
 
@@ -144,6 +227,12 @@ class DBInterface:
             if relationship_name:
                 query = query.options(joinedload(getattr(self.db_class, relationship_name)))
 
+            # Extra loader options, e.g. nested selectinload chains
+            if options:
+                query = query.options(*options)
+
+            query = query.options(*self.projection_options(load_columns, defer_columns))
+
             # If actual join is needed (for filtering or inner join behavior)
             if join_model:
                 on_clause = getattr(self.db_class, join_on_left) == getattr(join_model, join_on_right)
@@ -164,29 +253,132 @@ class DBInterface:
         except Exception as e:
             raise Exception(f"Error reading with filters in {self.db_class.__name__}: {str(e)}")
         finally:
-            session.close()
+            self._release(session, is_scoped)
+
+    def read_all_by_cursor(
+            self, filter_expr: Optional[Any] = None, cursor: Optional[str] = None, limit: int = 10,
+            order_direction: str = "desc", relationship_name: Optional[str] = None,
+            count_mode: CountMode = CountMode.ESTIMATE, options: Optional[list] = None,
+            load_columns: Optional[list] = None, defer_columns: Optional[list] = None,
+            order_by: Optional[str] = None
+    ):
+        """
+        Keyset pagination on (created_at, id). Every page costs the same as the first one, unlike OFFSET.
+        Returns the page, the cursor of the next page (None on the last page) and the total count,
+        which is exact, a planner estimate or None depending on count_mode.
+        Any other `order_by` raises InvalidCursorError instead of being silently ignored.
+        """
+        if order_by and order_by not in CURSOR_ORDER_FIELDS:
+            raise InvalidCursorError(gettext("cursor_order_by_not_supported").format(order_by))
+        session, is_scoped = self._acquire_session()
+        try:
+            query = session.query(self.db_class)
+
+            if relationship_name:
+                query = query.options(selectinload(getattr(self.db_class, relationship_name)))
+
+            if options:
+                query = query.options(*options)
+
+            query = query.options(*self.projection_options(load_columns, defer_columns))
+
+            if filter_expr is not None:
+                query = query.filter(filter_expr)
+
+            total_count = self._count(session, query, count_mode)
+
+            key = tuple_(self.db_class.created_at, self.db_class.id)
+            if cursor:
+                cursor_key = tuple_(*decode_cursor(cursor))
+                query = query.filter(key < cursor_key if order_direction == "desc" else key > cursor_key)
+
+            if order_direction == "desc":
+                query = query.order_by(desc(self.db_class.created_at), desc(self.db_class.id))
+            else:
+                query = query.order_by(asc(self.db_class.created_at), asc(self.db_class.id))
+
+            # One extra row tells whether a next page exists without counting
+            results = query.limit(limit + 1).all()
+            next_cursor = None
+            if len(results) > limit:
+                results = results[:limit]
+                next_cursor = encode_cursor(results[-1].created_at, results[-1].id)
+
+            return results, next_cursor, total_count
+        except InvalidCursorError:
+            raise
+        except Exception as e:
+            raise Exception(f"Error reading with cursor in {self.db_class.__name__}: {str(e)}")
+        finally:
+            self._release(session, is_scoped)
+
+    def read_latest_by_group(
+            self, group_column: Any, group_values: list, columns: list, order_by: list
+    ) -> Dict[Any, Any]:
+        """
+        Latest row of every group in `group_values`, ranked by `order_by` (descending) with a row_number()
+        window. Only `columns` are selected, rows come back as plain Row tuples keyed by their group value.
+        """
+        if not group_values:
+            return {}
+        session, is_scoped = self._acquire_session()
+        try:
+            if group_column not in columns:
+                columns = [group_column, *columns]
+            ranked = (
+                select(
+                    *columns,
+                    func.row_number().over(
+                        partition_by=group_column, order_by=[desc(column) for column in order_by]
+                    ).label("row_rank")
+                )
+                .where(group_column.in_(group_values))
+                .subquery()
+            )
+            query = select(*(ranked.c[column.key] for column in columns)).where(ranked.c.row_rank == 1)
+            return {getattr(row, group_column.key): row for row in session.execute(query).all()}
+        except SQLAlchemyError as e:
+            self._rollback(session, is_scoped)
+            raise Exception(f"Error reading latest {self.db_class.__name__} records: {str(e)}")
+        finally:
+            self._release(session, is_scoped)
+
+    @staticmethod
+    def _count(session: Session, query, count_mode: CountMode) -> Optional[int]:
+        if count_mode == CountMode.NONE:
+            return None
+        if count_mode == CountMode.ESTIMATE and session.get_bind().dialect.name == "postgresql":
+            # Row estimate of the planner for the filtered query, read from the statistics instead of a scan
+            compiled = query.statement.compile(
+                dialect=session.get_bind().dialect, compile_kwargs={"render_postcompile": True}
+            )
+            plan = session.connection().exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {compiled.string}", compiled.params
+            ).scalar()
+            return int(plan[0]["Plan"]["Plan Rows"])
+        return query.order_by(None).count()
 
     # Create Methods
     def create(self, data: dict[str, Any]) -> Base:
-        session: Session = DBSession()
+        session, is_scoped = self._acquire_session()
         try:
             item = self.db_class(**data)
             session.add(item)
-            session.commit()
+            self._commit(session, is_scoped)
             session.refresh(item)
             return item
         except SQLAlchemyError as e:
-            session.rollback()
+            self._rollback(session, is_scoped)
             raise Exception(f"Error creating {self.db_class.__name__}: {str(e)}")
         finally:
-            session.close()
+            self._release(session, is_scoped)
 
     def bulk_create(self, data_list: list[dict]):
-        session = DBSession()
+        session, is_scoped = self._acquire_session()
         try:
             instances = [self.db_class(**data) for data in data_list]
             session.add_all(instances)
-            session.commit()
+            self._commit(session, is_scoped)
 
             # Refresh each instance to load auto-generated fields like id
             for instance in instances:
@@ -194,15 +386,15 @@ class DBInterface:
 
             return instances
         except Exception as e:
-            session.rollback()
+            self._rollback(session, is_scoped)
             raise Exception(f"Error in bulk_create for {self.db_class.__name__}: {str(e)}")
         finally:
-            session.close()
+            self._release(session, is_scoped)
 
     # Update Methods
     def update(self, _id: str, data: DataObject, lookup_field: str = None, update_all: bool = False) -> Base | list[
         Base] | None:
-        session = DBSession()
+        session, is_scoped = self._acquire_session()
         try:
             # Case 1: Lookup by primary key (default behavior)
             if lookup_field is None:
@@ -213,7 +405,7 @@ class DBInterface:
                 for key, value in data.items():
                     setattr(item, key, value)
 
-                session.commit()
+                self._commit(session, is_scoped)
                 session.refresh(item)
                 return item
 
@@ -233,7 +425,7 @@ class DBInterface:
                     for key, value in data.items():
                         setattr(item, key, value)
 
-                session.commit()
+                self._commit(session, is_scoped)
                 for item in items:
                     session.refresh(item)
 
@@ -246,37 +438,37 @@ class DBInterface:
                 for key, value in data.items():
                     setattr(item, key, value)
 
-                session.commit()
+                self._commit(session, is_scoped)
                 session.refresh(item)
                 return item
 
         except Exception as e:
-            session.rollback()
+            self._rollback(session, is_scoped)
             raise Exception(
                 f"Error updating {self.db_class.__name__} with {lookup_field or 'id'} = {_id}: {str(e)}"
             )
         finally:
-            session.close()
+            self._release(session, is_scoped)
 
     # Delete Methods
     def delete(self, filters: list) -> bool | Exception | None:
-        session = DBSession()
+        session, is_scoped = self._acquire_session()
         try:
             items = session.query(self.db_class).filter(*filters).all()
             if items:
                 for item in items:
                     session.delete(item)
-                session.commit()
+                self._commit(session, is_scoped)
                 return True
             return False
         except Exception as e:
-            session.rollback()
+            self._rollback(session, is_scoped)
             raise Exception(f"Error deleting record from {self.db_class.__name__}: {str(e)}")
         finally:
-            session.close()
+            self._release(session, is_scoped)
 
     def soft_delete(self, filters: List[Any], modified_id: Optional[str] = None) -> bool:
-        session = DBSession()
+        session, is_scoped = self._acquire_session()
         try:
             items = session.query(self.db_class).filter(*filters).all()
             if not items:
@@ -289,22 +481,22 @@ class DBInterface:
                 if modified_id:
                     item.modified_by = modified_id
 
-            session.commit()
+            self._commit(session, is_scoped)
             return True
 
         except Exception as e:
-            session.rollback()
+            self._rollback(session, is_scoped)
             raise Exception(f"Error performing soft delete in {self.db_class.__name__}: {str(e)}")
         finally:
-            session.close()
+            self._release(session, is_scoped)
 
     def count_all_by_fields(self, filters: list) -> int:
-        session = DBSession()
+        session, is_scoped = self._acquire_session()
         try:
             count = session.query(func.count()).select_from(self.db_class).filter(*filters).scalar()
             return count or 0
         except Exception as e:
-            session.rollback()
+            self._rollback(session, is_scoped)
             raise Exception(f"Error counting records by fields in {self.db_class.__name__}: {str(e)}")
         finally:
-            session.close()
+            self._release(session, is_scoped)
@@ -14,6 +14,7 @@ from app.admin.admin_dashboard import router as admin_dashboard_router
 from app.admin.admin_loan import router as admin_loan_router
 from app.admin.admin_emi_schedule import router as admin_emi_schedule_router
 from app.admin.admin_disbursement import router as admin_loan_disbursement_router
+from app.admin.admin_internal import router as admin_internal_router
 from app.user.user_auth import router as user_auth_router
 from app.user.user_loan import router as user_loan_router
 from app.user.user_surpass import router as surpass_router
@@ -21,10 +22,18 @@ from app.user.user_razorpay import router as razorpay_router
 from app.user.user_webhook import router as webhook_router
 from app.general.user_contact_us import router as contact_us_router
 from common.cache_string import refresh_cache_strings
+from common.common_services.aws_services import close_s3_client
+from common.common_services.sms_service import close_sms_service
+from common.common_services.surpass_service import close_surpass_client, get_surpass_client
+from common.credit_rate_index import CreditIndexListener
+from common.email_outbox import start_email_workers, stop_email_workers
 from common.response import validation_exception_handler
+from common.webhook_inbox import start_webhook_workers, stop_webhook_workers
 from config import app_config
 from custom_middleware.auth_middleware import AuthMiddleware
+from custom_middleware.public_routes import public_path_matcher
 from db_domains import db
+from services.razorpay_gateway import close_razorpay_gateway
 
 
 @asynccontextmanager
@@ -32,8 +41,24 @@ async def lifespan(app: FastAPI):
     """Lifespan event manager for startup and shutdown tasks."""
     db.init_db()
     print("Initializing database...")
+    credit_index_listener = None
+    if app_config.CREDIT_INDEX_LISTEN:
+        credit_index_listener = CreditIndexListener()
+        credit_index_listener.start()
+    get_surpass_client()
+    webhook_workers = start_webhook_workers()
+    email_workers = start_email_workers()
     yield
     print("Shutting down...")
+    stop_webhook_workers(webhook_workers)
+    stop_email_workers(email_workers)
+    if credit_index_listener:
+        credit_index_listener.stop()
+    await close_razorpay_gateway()
+    await close_s3_client()
+    await close_sms_service()
+    await close_surpass_client()
+    await db.async_engine.dispose()
 
 
 app = FastAPI(
@@ -77,6 +102,10 @@ app.include_router(webhook_router)
 app.include_router(contact_us_router)
 
 app.include_router(admin_emi_schedule_router)
+app.include_router(admin_internal_router)
+
+# Routes decorated with @public_route skip the AuthMiddleware token check
+public_path_matcher.register_routes(app.routes)
 
 if __name__ == "__main__":
     refresh_cache_strings()
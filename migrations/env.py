@@ -13,6 +13,7 @@ from models.surpass import *
 from models.credit import *
 from models.razorpay import *
 from models.contact_us import *
+from models.email import *
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
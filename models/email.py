@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, Text, Enum, DateTime
+
+from common.enums import EmailOutboxStatus
+from db_domains import CreateUpdateTime
+
+
+class EmailOutbox(CreateUpdateTime):
+    """
+    Emails waiting to be sent. Requests only insert here, the email outbox workers deliver them.
+    """
+    __tablename__ = "email_outbox"
+
+    id = Column(Integer, primary_key=True, index=True)
+    to_email = Column(String(255), nullable=False)
+    subject = Column(String(500), nullable=False)
+    body = Column(Text, nullable=False)
+    html_body = Column(Text, nullable=True)
+    status = Column(Enum(EmailOutboxStatus), nullable=False, default=EmailOutboxStatus.PENDING, index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=True, index=True)
+    locked_at = Column(DateTime, nullable=True)
+    sent_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    def __repr__(self):
+        return f"<EmailOutbox id={self.id} to_email={self.to_email} status={self.status}>"
@@ -7,7 +7,8 @@ from sqlalchemy import (
 )
 from sqlalchemy.orm import relationship
 
-from common.enums import IncomeProofType, DocumentType, DocumentStatus, LoanType, LoanStatus, GenderEnum, PaymentType
+from common.enums import IncomeProofType, DocumentType, DocumentStatus, LoanType, LoanStatus, GenderEnum, PaymentType, \
+    UploadFileType
 from db_domains import CreateUpdateTime, CreateByUpdateBy
 
 
@@ -125,6 +126,23 @@ class LoanDocument(CreateUpdateTime, CreateByUpdateBy):
         return f"<LoanDocument id={self.id} applicant_id={self.applicant_id} type={self.document_type}>"
 
 
+class UploadedFile(CreateUpdateTime):
+    """
+    A validated upload, from /loan/upload-file or /loan/upload-complete. Loan forms only accept
+    document_file URLs recorded here for the submitting user.
+    """
+    __tablename__ = "uploaded_files"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    file_type = Column(Enum(UploadFileType), nullable=False)
+    s3_key = Column(String(512), unique=True, nullable=False)
+    document_file = Column(Text, nullable=False)
+
+    def __repr__(self):
+        return f"<UploadedFile id={self.id} user_id={self.user_id} s3_key={self.s3_key}>"
+
+
 class LoanApprovalDetail(CreateUpdateTime, CreateByUpdateBy):
     __tablename__ = "loan_approval_details"
 
@@ -1,4 +1,4 @@
-from common.enums import SubscriptionStatus
+from common.enums import SubscriptionStatus, WebhookEventStatus
 from sqlalchemy import Column, Integer, Enum, String, Float, ForeignKey, DateTime, Text, Boolean, JSON, BigInteger
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -72,6 +72,9 @@ class Subscription(CreateUpdateTime, CreateByUpdateBy):
     addons = Column(JSON, nullable=True)  # JSON string
     auth_attempts = Column(Integer, nullable=True)
     subscription_data = Column(JSON, nullable=True)
+    invoice_data = Column(JSON, nullable=True)
+    # Last time subscription_data / invoice_data were synced from Razorpay, NULL until the first sync
+    snapshot_refreshed_at = Column(DateTime, nullable=True)
     
 
     customer = relationship("Customer", back_populates="subscriptions")
@@ -106,4 +109,24 @@ class PaymentDetails(CreateUpdateTime, CreateByUpdateBy):
     payment_method = Column(String, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
-    foreclosure = relationship("ForeClosure", back_populates="payment_details")
\ No newline at end of file
+    foreclosure = relationship("ForeClosure", back_populates="payment_details")
+
+
+class WebhookEvent(CreateUpdateTime):
+    """
+    Inbox of received Razorpay webhooks. The endpoint only inserts here, the webhook workers process the rows.
+    """
+    __tablename__ = "webhook_events"
+
+    id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(String, unique=True, nullable=False)  # X-Razorpay-Event-Id, the idempotency key
+    event = Column(String, nullable=False)
+    # Events sharing a key (subscription / payment link id) are processed one at a time in arrival order
+    ordering_key = Column(String, nullable=True, index=True)
+    payload = Column(JSON, nullable=False)
+    status = Column(Enum(WebhookEventStatus), nullable=False, default=WebhookEventStatus.PENDING, index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=True, index=True)
+    locked_at = Column(DateTime, nullable=True)
+    processed_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
@@ -1,7 +1,7 @@
 from sqlalchemy import (
-    Column, JSON, String, Integer, ForeignKey, Date, Enum
+    Column, JSON, String, Integer, ForeignKey, Date, Enum, Float, BigInteger, DateTime
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 
 from common.enums import GenderEnum
 from db_domains import CreateUpdateTime
@@ -18,10 +18,24 @@ class UserCibilReport(CreateUpdateTime):
     pan_number = Column(String, nullable=True, index=True)
     mobile = Column(String, nullable=True, index=True)
     credit_score = Column(String, nullable=True, index=True)
-    credit_report = Column(JSON, nullable=True)
+    # Raw vendor report of rows stored before the blob store, never loaded unless asked for
+    credit_report = deferred(Column(JSON, nullable=True))
+    # sha256 reference of the zstd compressed report in the credit report blob store
+    credit_report_ref = Column(String(64), nullable=True, index=True)
 
     report_refresh_date = Column(Date, nullable=True, index=True)
     next_eligible_date = Column(Date, nullable=True, index=True)
     gender = Column(Enum(GenderEnum), nullable=False, server_default="male")
 
+    # Report summary computed when the report is stored, the report view reads only these
+    payment_on_time_count = Column(Integer, nullable=True)
+    payment_history_count = Column(Integer, nullable=True)
+    payment_history_percent = Column(Float, nullable=True)
+    credit_used_amount = Column(BigInteger, nullable=True)
+    credit_limit_amount = Column(BigInteger, nullable=True)
+    credit_utilization_percent = Column(Float, nullable=True)
+    oldest_account_opened_on = Column(Date, nullable=True)
+    loan_account_count = Column(Integer, nullable=True)
+    summary_computed_at = Column(DateTime, nullable=True)
+
     user = relationship("User", backref="cibil_reports")
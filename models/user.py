@@ -1,7 +1,7 @@
 import re
 
 from sqlalchemy import (
-    Column, Integer, String, Boolean, Date, Enum, ForeignKey, UniqueConstraint
+    Column, Integer, String, Boolean, Date, DateTime, Enum, ForeignKey, UniqueConstraint
 )
 from sqlalchemy.orm import relationship
 
@@ -68,3 +68,16 @@ class UserDocument(CreateUpdateTime):
 
     def __repr__(self):
         return f"<UserDocument id={self.id} user_id={self.user_id} type={self.document_type}>"
+
+
+class RevokedRefreshToken(CreateUpdateTime):
+    __tablename__ = "revoked_refresh_tokens"
+
+    id = Column(Integer, primary_key=True, index=True)
+    jti = Column(String(64), unique=True, index=True, nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    # Rows past the refresh token's own expiry are pruned
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<RevokedRefreshToken id={self.id} jti={self.jti} user_id={self.user_id}>"
@@ -4,7 +4,7 @@ from typing import Optional, List
 from pydantic import BaseModel
 from pydantic import constr, model_validator, EmailStr
 
-from common.enums import LoanType, IncomeProofType, DocumentType, LoanStatus
+from common.enums import LoanType, IncomeProofType, DocumentType, LoanStatus, UploadFileType
 
 
 class LoanForm(BaseModel):
@@ -292,4 +292,15 @@ class LoanAadharVerifiedStatusForm(BaseModel):
 class LoanApprovedDocumentForm(BaseModel):
     applicant_id: int
     document_name: str
-    document_file: str
\ No newline at end of file
+    document_file: str
+
+
+class PresignedUploadForm(BaseModel):
+    file_type: UploadFileType
+    file_name: constr(min_length=1, max_length=200)
+    content_type: str
+
+
+class UploadCompleteForm(BaseModel):
+    file_type: UploadFileType
+    key: str
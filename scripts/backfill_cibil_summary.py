@@ -0,0 +1,54 @@
+"""
+Fill the summary columns of CIBIL reports stored before they existed.
+
+    python -m scripts.backfill_cibil_summary [--batch-size 200] [--recompute]
+"""
+import argparse
+
+from sqlalchemy import select
+from sqlalchemy.orm import undefer
+
+from app_logging import app_logger
+from common.cibil_analyzer import analyze_reports
+from common.common_services.blob_store import load_credit_report
+from db_domains import naive_utc_now
+from db_domains.db import DBSession
+from models.surpass import UserCibilReport
+
+
+def backfill_cibil_summary(batch_size: int = 200, recompute: bool = False) -> int:
+    updated, last_id = 0, 0
+    while True:
+        with DBSession() as session:
+            query = select(UserCibilReport).options(undefer(UserCibilReport.credit_report)).where(
+                UserCibilReport.id > last_id
+            )
+            if not recompute:
+                query = query.where(UserCibilReport.summary_computed_at.is_(None))
+            reports = session.scalars(query.order_by(UserCibilReport.id).limit(batch_size)).all()
+            if not reports:
+                return updated
+
+            computed_at = naive_utc_now()
+            analyses = analyze_reports(
+                (report.id, load_credit_report(report.credit_report_ref) if report.credit_report_ref
+                 else report.credit_report)
+                for report in reports
+            )
+            for report in reports:
+                for key, value in analyses[report.id].summary_columns().items():
+                    setattr(report, key, value)
+                report.summary_computed_at = computed_at
+            session.commit()
+
+            last_id = reports[-1].id
+            updated += len(reports)
+            app_logger.info(f"[backfill_cibil_summary] {updated} reports summarised, last id {last_id}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill CIBIL report summary columns")
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--recompute", action="store_true", help="Recompute reports that already have a summary")
+    args = parser.parse_args()
+    print(f"Summarised {backfill_cibil_summary(args.batch_size, args.recompute)} CIBIL reports")
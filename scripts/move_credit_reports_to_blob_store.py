@@ -0,0 +1,50 @@
+"""
+Move raw CIBIL reports still stored in user_cibil_reports.credit_report into the credit report blob store.
+
+    python -m scripts.move_credit_reports_to_blob_store [--batch-size 200]
+"""
+import argparse
+
+from sqlalchemy import select
+from sqlalchemy.orm import undefer
+
+from app_logging import app_logger
+from common.common_services.blob_store import save_credit_report
+from db_domains.db import DBSession
+from models.surpass import UserCibilReport
+
+
+def move_credit_reports(batch_size: int = 200) -> int:
+    moved, last_id = 0, 0
+    while True:
+        with DBSession() as session:
+            reports = session.scalars(
+                select(UserCibilReport)
+                .options(undefer(UserCibilReport.credit_report))
+                .where(
+                    UserCibilReport.id > last_id,
+                    UserCibilReport.credit_report_ref.is_(None),
+                    UserCibilReport.credit_report.is_not(None)
+                )
+                .order_by(UserCibilReport.id)
+                .limit(batch_size)
+            ).all()
+            if not reports:
+                return moved
+
+            for report in reports:
+                # Blob first, the JSON is only cleared once its copy is stored
+                report.credit_report_ref = save_credit_report(report.credit_report)
+                report.credit_report = None
+            session.commit()
+
+            last_id = reports[-1].id
+            moved += len(reports)
+            app_logger.info(f"[move_credit_reports] {moved} reports moved, last id {last_id}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Move raw CIBIL reports into the credit report blob store")
+    parser.add_argument("--batch-size", type=int, default=200)
+    args = parser.parse_args()
+    print(f"Moved {move_credit_reports(args.batch_size)} CIBIL reports")
@@ -10,18 +10,28 @@ from app_logging import app_logger
 from common.cache_string import gettext
 from common.common_services.jwt_service import JWTService
 from common.common_services.otp_service import OTPService
-from common.common_services.sms_service import SMSService
-from common.enums import UserRole, DocumentType
+from common.common_services.sms_service import get_sms_service
+from common.enums import UserRole, DocumentType, PaginationMode, CountMode
 from common.message_template import get_otp_message
 from common.utils import format_user_response, PasswordHashing
 from db_domains import Base
 from db_domains.db import DBSession
-from db_domains.db_interface import DBInterface
+from db_domains.db_interface import DBInterface, InvalidCursorError
 from models.surpass import UserCibilReport
 from models.user import User, UserDocument
 from schemas.auth_schemas import LoginRequest, VerifyOTPRequest, RefreshToken, UpdateProfileRequest, AdminLoginRequest, \
     AddUserRequest, UserResponseSchema, UserUpdateData
 
+# What the admin user listing shows, the rest of the user and report columns are never read for it
+USER_LIST_COLUMNS = [
+    User.id, User.name, User.address, User.phone, User.email, User.role, User.is_active, User.created_at,
+    User.profile_image, User.gender
+]
+CIBIL_LIST_COLUMNS = [
+    UserCibilReport.id, UserCibilReport.user_id, UserCibilReport.name, UserCibilReport.credit_score,
+    UserCibilReport.pan_number, UserCibilReport.report_refresh_date, UserCibilReport.next_eligible_date,
+    UserCibilReport.client_id, UserCibilReport.gender
+]
 
 class UserAuthService:
     def __init__(self, db_model: type[Base]) -> None:
@@ -47,7 +57,8 @@ class UserAuthService:
                 otp, secret = OTPService.generate_otp(phone_number)
                 message = get_otp_message(otp)
 
-                if not SMSService.send_sms(phone_number, message):
+                # Sent by the SMS workers, the response does not wait on the gateway
+                if not get_sms_service().enqueue(phone_number, message):
                     return {
                         "success": False,
                         "message": gettext("error_sending_OTP"),
@@ -435,7 +446,9 @@ class AdminAuthService(UserAuthService):
 
     def get_all_users(
             self, search: Optional[str] = None, status_filter: Optional[bool] = None,
-            order_by: Optional[str] = None, order_direction: Optional[str] = None, limit: int = 10, offset: int = 0
+            order_by: Optional[str] = None, order_direction: Optional[str] = None, limit: int = 10, offset: int = 0,
+            pagination: PaginationMode = PaginationMode.OFFSET, cursor: Optional[str] = None,
+            count_mode: CountMode = CountMode.ESTIMATE
     ) -> Dict[str, Any]:
         try:
             app_logger.info("Fetching all non-admin users")
@@ -446,10 +459,6 @@ class AdminAuthService(UserAuthService):
                     {"field": "is_deleted", "op": "==", "value": False}
                 ]
             }
-            total_users = self.db_interface.count_all_by_fields(
-                filters=[User.is_deleted == False, User.role != UserRole.admin]
-                )
-
             # 🔍 Add status filter
             if status_filter is not None:
                 is_active = str(status_filter).lower() in ["true", "1", "active"]
@@ -474,25 +483,44 @@ class AdminAuthService(UserAuthService):
             order_column = getattr(User, order_by, User.created_at) if order_by else User.created_at
             order_direction = order_direction.lower() if order_direction else "asc"
 
-            # ⏱ Calculate pagination offset
-            if offset != 0:
-                final_offset = (offset - 1) * limit
+            next_cursor = None
+            if pagination == PaginationMode.CURSOR:
+                users, next_cursor, total_count = self.db_interface.read_all_by_cursor(
+                    filter_expr=filter_expr,
+                    cursor=cursor,
+                    order_by=order_by,
+                    limit=limit,
+                    order_direction=order_direction,
+                    count_mode=count_mode,
+                    load_columns=USER_LIST_COLUMNS
+                )
             else:
-                final_offset = offset
-
-            users, total_count = self.db_interface.read_all_by_filters_with_joins(
-                filter_expr=filter_expr,
-                order_by=order_column,
-                order_direction=order_direction,
-                limit=limit,
-                offset=final_offset,
-                join_model=UserCibilReport,
-                join_on_left="id",
-                join_on_right="user_id",
-                relationship_name="cibil_reports"
-            )
+                # ⏱ Calculate pagination offset
+                if offset != 0:
+                    final_offset = (offset - 1) * limit
+                else:
+                    final_offset = offset
+
+                users, total_count = self.db_interface.read_all_by_filters_with_joins(
+                    filter_expr=filter_expr,
+                    order_by=order_column,
+                    order_direction=order_direction,
+                    limit=limit,
+                    offset=final_offset,
+                    load_columns=USER_LIST_COLUMNS
+                )
 
-            user_list = [format_user_response(user) for user in users]
+            # Only the scalar fields of each user's latest report, never the report rows themselves
+            latest_reports = DBInterface(UserCibilReport).read_latest_by_group(
+                group_column=UserCibilReport.user_id,
+                group_values=[user.id for user in users],
+                columns=CIBIL_LIST_COLUMNS,
+                order_by=[UserCibilReport.id]
+            )
+            user_list = [
+                format_user_response(user, cibil_reports=[latest_reports[user.id]] if user.id in latest_reports else [])
+                for user in users
+            ]
 
             return {
                 "success": True,
@@ -503,9 +531,19 @@ class AdminAuthService(UserAuthService):
                 "data": {
                     "user": user_list,
                     "total_count": total_count,
+                    "next_cursor": next_cursor,
                 }
             }
 
+        except InvalidCursorError as e:
+            app_logger.warning(f"Rejected cursor page of users: {e}")
+            return {
+                "success": False,
+                "message": str(e),
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "data": []
+            }
+
         except Exception as e:
             app_logger.error(f"Error retrieving users: {e}", exc_info=True)
             return {
@@ -5,7 +5,8 @@ from starlette import status
 
 from app_logging import app_logger
 from common.cache_string import gettext
-from db_domains.db_interface import DBInterface
+from common.enums import PaginationMode, CountMode
+from db_domains.db_interface import DBInterface, InvalidCursorError
 from models.contact_us import ContactUs
 from schemas.contact_us_schema import ContactUsCreateSchema, ContactUsResponseSchema, ContactUsUpdateSchema
 
@@ -55,7 +56,10 @@ class ContactUsService:
             limit: int = 10,
             offset: int = 0,
             start_date: Optional[str] = None,
-            end_date: Optional[str] = None
+            end_date: Optional[str] = None,
+            pagination: PaginationMode = PaginationMode.OFFSET,
+            cursor: Optional[str] = None,
+            count_mode: CountMode = CountMode.ESTIMATE
     ) -> Dict[str, Any]:
         try:
             app_logger.info("Fetching all contact entries")
@@ -65,10 +69,6 @@ class ContactUsService:
                     {"field": "is_deleted", "op": "==", "value": False}
                 ]
             }
-            total_contacts = self.db_interface.count_all_by_fields(
-                filters=[ContactUs.is_deleted == False]
-            )
-
             date_format = "%Y-%m-%d"
             if start_date and end_date:
                 try:
@@ -107,18 +107,35 @@ class ContactUsService:
             ) if order_by else ContactUs.created_at
             order_direction = order_direction.lower() if order_direction else "desc"
 
-            if offset != 0:
-                final_offset = (offset - 1) * limit
+            next_cursor = None
+            if pagination == PaginationMode.CURSOR:
+                contacts, next_cursor, total_counts = self.db_interface.read_all_by_cursor(
+                    filter_expr=filter_expr,
+                    cursor=cursor,
+                    order_by=order_by,
+                    limit=limit,
+                    order_direction=order_direction,
+                    count_mode=count_mode
+                )
+                # The unfiltered total is a second full count, so it is skipped in cursor mode
+                total_contacts = None
             else:
-                final_offset = offset
+                total_contacts = self.db_interface.count_all_by_fields(
+                    filters=[ContactUs.is_deleted == False]
+                )
 
-            contacts, total_counts = self.db_interface.read_all_by_filters(
-                filter_expr=filter_expr,
-                order_by=order_column,
-                order_direction=order_direction,
-                limit=limit,
-                offset=final_offset
-            )
+                if offset != 0:
+                    final_offset = (offset - 1) * limit
+                else:
+                    final_offset = offset
+
+                contacts, total_counts = self.db_interface.read_all_by_filters(
+                    filter_expr=filter_expr,
+                    order_by=order_column,
+                    order_direction=order_direction,
+                    limit=limit,
+                    offset=final_offset
+                )
 
             contact_list = [
                 ContactUsResponseSchema.model_validate(contact).model_dump()
@@ -134,10 +151,20 @@ class ContactUsService:
                 "data": {
                     "contact_entries": contact_list,
                     "total_db_contacts": total_contacts,
-                    "total_count": total_counts
+                    "total_count": total_counts,
+                    "next_cursor": next_cursor
                 }
             }
 
+        except InvalidCursorError as e:
+            app_logger.warning(f"Rejected cursor page of contact entries: {e}")
+            return {
+                "success": False,
+                "message": str(e),
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "data": []
+            }
+
         except Exception as e:
             app_logger.error(
                 f"Error retrieving contact entries: {str(e)}", exc_info=True)
@@ -5,6 +5,7 @@ from sqlalchemy import and_, or_
 from starlette import status
 
 from app_logging import app_logger
+from common.credit_rate_index import publish_credit_index_change
 from db_domains import Base
 from db_domains.db import DBSession
 from db_domains.db_interface import DBInterface
@@ -71,6 +72,7 @@ class CreditScoreService:
             data["created_by"] = user_id
             print(f"Data => {data}")
             new_entry = self.db_interface.create(data=data)
+            publish_credit_index_change()
 
             return {
                 "success": True,
@@ -112,20 +114,26 @@ class CreditScoreService:
                     "data": {}
                 }
 
-            with DBSession() as session:
-                overlapping_entry = (
-                    session.query(CreditScoreRangeRate)
-                    .filter(
-                        CreditScoreRangeRate.loan_type == existing_entry.loan_type,
-                        CreditScoreRangeRate.is_deleted == False,
-                        CreditScoreRangeRate.id != credit_range_id,
-                        and_(
-                            CreditScoreRangeRate.min_score <= form_data.max_score,
-                            CreditScoreRangeRate.max_score >= form_data.min_score
+            # Partial updates leave scores unset, so the overlap check runs on the band as it will be saved.
+            # Deleting never creates an overlap and must stay possible for bands that already overlap.
+            min_score = form_data.min_score if form_data.min_score is not None else existing_entry.min_score
+            max_score = form_data.max_score if form_data.max_score is not None else existing_entry.max_score
+            overlapping_entry = None
+            if not form_data.is_deleted:
+                with DBSession() as session:
+                    overlapping_entry = (
+                        session.query(CreditScoreRangeRate)
+                        .filter(
+                            CreditScoreRangeRate.loan_type == existing_entry.loan_type,
+                            CreditScoreRangeRate.is_deleted == False,
+                            CreditScoreRangeRate.id != credit_range_id,
+                            and_(
+                                CreditScoreRangeRate.min_score <= max_score,
+                                CreditScoreRangeRate.max_score >= min_score
+                            )
                         )
+                        .first()
                     )
-                    .first()
-                )
 
             if overlapping_entry:
                 return {
@@ -155,6 +163,7 @@ class CreditScoreService:
                     f"[UserID: {user_id}] Updating CreditScoreRateCombined ID={credit_range_id} with: {update_fields}"
                 )
                 self.db_interface.update(_id=str(credit_range_id), data=update_fields)
+                publish_credit_index_change()
 
             return {
                 "success": True,
@@ -328,19 +337,24 @@ class CreditScoreService:
                     "data": {}
                 }
 
-            with DBSession() as session:
-                overlapping_entry = (
-                    session.query(ProcessingFee)
-                    .filter(
-                        ProcessingFee.is_deleted == False,
-                        ProcessingFee.id != fee_id,
-                        and_(
-                            ProcessingFee.min_score <= form_data.max_score,
-                            ProcessingFee.max_score >= form_data.min_score
+            # Same merged-band check as the rate update
+            min_score = form_data.min_score if form_data.min_score is not None else existing_entry.min_score
+            max_score = form_data.max_score if form_data.max_score is not None else existing_entry.max_score
+            overlapping_entry = None
+            if not form_data.is_deleted:
+                with DBSession() as session:
+                    overlapping_entry = (
+                        session.query(ProcessingFee)
+                        .filter(
+                            ProcessingFee.is_deleted == False,
+                            ProcessingFee.id != fee_id,
+                            and_(
+                                ProcessingFee.min_score <= max_score,
+                                ProcessingFee.max_score >= min_score
+                            )
                         )
+                        .first()
                     )
-                    .first()
-                )
 
             if overlapping_entry:
                 return {
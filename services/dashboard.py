@@ -1,14 +1,18 @@
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, undefer
 from starlette import status
 
 from app_logging import app_logger
+from common.cache_string import gettext
+from common.cibil_analyzer import analyze_reports, portfolio_risk
+from common.common_services.blob_store import load_credit_report
 from common.enums import LoanStatus, UserRole
 from config import app_config
 from db_domains import Base
 from db_domains.db import DBSession
 from db_domains.db_interface import DBInterface
 from models.loan import LoanApplicant
+from models.surpass import UserCibilReport
 from models.user import User
 
 
@@ -110,3 +114,46 @@ class DashboardService:
                 "data": {},
                 "status_code": status.HTTP_400_BAD_REQUEST,
             }
+
+    def get_portfolio_risk(self, batch_size: int = 200):
+        """
+        Risk view over every stored CIBIL report, read in id batches from the credit report blob store.
+        """
+        try:
+            app_logger.info("Starting CIBIL portfolio risk scan.")
+            analyses, last_id = [], 0
+            while True:
+                with DBSession() as session:
+                    reports = session.scalars(
+                        select(UserCibilReport)
+                        .options(undefer(UserCibilReport.credit_report))
+                        .where(UserCibilReport.id > last_id, UserCibilReport.is_deleted == False)
+                        .order_by(UserCibilReport.id)
+                        .limit(batch_size)
+                    ).all()
+                    if not reports:
+                        break
+                    analyses.extend(analyze_reports(
+                        (report.id, load_credit_report(report.credit_report_ref) if report.credit_report_ref
+                         else report.credit_report)
+                        for report in reports
+                    ).values())
+                    last_id = reports[-1].id
+
+            risk = portfolio_risk(analyses)
+            app_logger.info(f"CIBIL portfolio risk computed over {risk['reports']} reports.")
+            return {
+                "success": True,
+                "message": gettext("retrieved_successfully").format("Portfolio Risk"),
+                "data": risk,
+                "status_code": status.HTTP_200_OK,
+            }
+
+        except Exception as e:
+            app_logger.error(f"Error computing portfolio risk: {e}", exc_info=True)
+            return {
+                "success": False,
+                "message": str(e),
+                "data": {},
+                "status_code": status.HTTP_400_BAD_REQUEST,
+            }
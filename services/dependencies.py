@@ -1,5 +1,5 @@
-from config import app_config
-from services.razorpay_service import RazorpayService
+from services.razorpay_gateway import RazorpayGateway, get_razorpay_gateway
 
-def get_razorpay_service():
-    return RazorpayService(app_config.RAZORPAY_KEY_ID, app_config.RAZORPAY_SECRET)
+
+def get_razorpay_service() -> RazorpayGateway:
+    return get_razorpay_gateway()
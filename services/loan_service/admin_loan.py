@@ -1,15 +1,15 @@
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 
+from sqlalchemy.orm import selectinload
 from starlette import status
 
 from app_logging import app_logger
 from common.cache_string import gettext
-from common.enums import DocumentType, IncomeProofType, LoanType
-from db_domains.db import DBSession
-from db_domains.db_interface import DBInterface
+from common.credit_rate_index import credit_rate_index
+from common.enums import DocumentType, IncomeProofType, LoanType, PaginationMode, CountMode
+from db_domains.db_interface import DBInterface, InvalidCursorError
 from models.razorpay import Plan, Subscription
-from models.credit import CreditScoreRangeRate
 from models.loan import LoanDocument, LoanApplicant, ApprovedLoanDocument
 from schemas.loan_schemas import LoanApplicantResponseSchema, UpdateLoanForm, LoanApplicantResponseSchemaForAdmin, \
     LoanApprovedDocumentForm
@@ -21,7 +21,9 @@ class AdminLoanService(UserLoanService):
     def get_all_loans(
             self, search: Optional[str] = None, status_filter: Optional[bool] = None,
             order_by: Optional[str] = None, order_direction: Optional[str] = None, limit: int = 10, offset: int = 0,
-            start_date: Optional[str] = None, end_date: Optional[str] = None
+            start_date: Optional[str] = None, end_date: Optional[str] = None,
+            pagination: PaginationMode = PaginationMode.OFFSET, cursor: Optional[str] = None,
+            count_mode: CountMode = CountMode.ESTIMATE
     ):
         try:
             app_logger.info("Fetching all loan applications")
@@ -31,10 +33,6 @@ class AdminLoanService(UserLoanService):
                     {"field": "is_deleted", "op": "==", "value": False}
                 ]
             }
-            total_loans = self.db_interface.count_all_by_fields(
-                filters=[LoanApplicant.is_deleted == False]
-            )
-
             if status_filter:
                 filter_def["AND"].append({"field": "status", "op": "==", "value": status_filter})
 
@@ -71,64 +69,62 @@ class AdminLoanService(UserLoanService):
             ) if order_by else LoanApplicant.created_at
             order_direction = order_direction.lower() if order_direction else "desc"
 
-            if offset != 0:
-                final_offset = (offset - 1) * limit
+            # Plans and their live subscriptions come in two batched queries for the whole page
+            loan_options = [
+                selectinload(LoanApplicant.plans).selectinload(
+                    Plan.subscriptions.and_(Subscription.is_deleted == False)
+                )
+            ]
+
+            next_cursor = None
+            if pagination == PaginationMode.CURSOR:
+                loans, next_cursor, total_loan_count = self.db_interface.read_all_by_cursor(
+                    filter_expr=filter_expr,
+                    cursor=cursor,
+                    order_by=order_by,
+                    limit=limit,
+                    order_direction=order_direction,
+                    count_mode=count_mode,
+                    options=loan_options
+                )
             else:
-                final_offset = offset
-          
-            loans, total_loan_count = self.db_interface.read_all_by_filters_with_joins(
-                filter_expr=filter_expr,
-                order_by=order_column,
-                order_direction=order_direction,
-                limit=limit,
-                offset=final_offset,
-                join_model=Plan,
-                join_on_left="id",
-                join_on_right="applicant_id",
-                relationship_name="plans"
-            )
+                if offset != 0:
+                    final_offset = (offset - 1) * limit
+                else:
+                    final_offset = offset
+
+                loans, total_loan_count = self.db_interface.read_all_by_filters_with_joins(
+                    filter_expr=filter_expr,
+                    order_by=order_column,
+                    order_direction=order_direction,
+                    limit=limit,
+                    offset=final_offset,
+                    options=loan_options
+                )
 
             loan_list = []
-            credit_score_range_rate = DBInterface(CreditScoreRangeRate)
             for loan in loans:
                 loan_data = LoanApplicantResponseSchema.model_validate(loan).model_dump(exclude={"documents"})
                 loan_data['emi_start_day_atm'] = loan.emi_start_day_atm
 
-                # Fetch matching interest rate info for this loan's type
-                rate_entry = credit_score_range_rate.read_by_fields(
-                    fields=[
-                        CreditScoreRangeRate.loan_type == loan.loan_type,
-                        CreditScoreRangeRate.min_score <= loan_data.get("credit_score"),
-                        CreditScoreRangeRate.max_score >= loan_data.get("credit_score"),
-                        CreditScoreRangeRate.is_deleted == False
-                    ]
-                )
+                # Matching interest rate info for this loan's type, resolved from the in-process index
+                rate_band = credit_rate_index.find_rate(loan.loan_type, loan_data.get("credit_score"))
+                rate_entry = [rate_band] if rate_band else []
 
                 # Attach rate info if available
-                if rate_entry:
-                    credit_score_rate_info = [{
-                        "id": i.id,
-                        "min_score": i.min_score,
-                        "max_score": i.max_score,
-                        "rate_percentage": i.rate_percentage
-                    } for i in rate_entry]
-                    loan_data["credit_score_rate_info"] = credit_score_rate_info
-                else:
-                    loan_data["credit_score_rate_info"] = {}
+                loan_data["credit_score_rate_info"] = rate_entry if rate_entry else {}
                     
                 plan_data = []
-                for plan in loan.plans:  
-                    with DBSession() as session:
-                        subscriptions = (
-                            session.query(Subscription)
-    
-                            .filter(Subscription.plan_id == plan.id, Subscription.is_deleted == False)
-                            .all()
-                        )
-                    for subscription in subscriptions: 
-                        plan.plan_data.setdefault("subscriptions", []).append(subscription.subscription_data)
-
-                    plan_data.append(plan.plan_data)
+                for plan in loan.plans:
+                    # Copy so the JSON column value held by the ORM object is never mutated
+                    plan_payload = dict(plan.plan_data) if plan.plan_data is not None else None
+                    if plan.subscriptions:
+                        plan_payload = plan_payload or {}
+                        plan_payload["subscriptions"] = list(plan_payload.get("subscriptions", [])) + [
+                            subscription.subscription_data for subscription in plan.subscriptions
+                        ]
+
+                    plan_data.append(plan_payload)
 
                 loan_data["plans"] = plan_data
 
@@ -142,10 +138,20 @@ class AdminLoanService(UserLoanService):
                 "status_code": status.HTTP_200_OK if loan_list else status.HTTP_404_NOT_FOUND,
                  "data": {
                     "loan_applications": loan_list,
-                    "total_count":total_loan_count
+                    "total_count":total_loan_count,
+                    "next_cursor": next_cursor
                 }
             }
 
+        except InvalidCursorError as e:
+            app_logger.warning(f"Rejected cursor page of loans: {e}")
+            return {
+                "success": False,
+                "message": str(e),
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "data": []
+            }
+
         except Exception as e:
             app_logger.error(f"Error retrieving loans: {e}", exc_info=True)
             return {
@@ -399,28 +405,16 @@ class AdminLoanService(UserLoanService):
             )
 
             loan_list = []
-            credit_score_range_rate = DBInterface(CreditScoreRangeRate)
             for loan in loans:
                 loan_data = LoanApplicantResponseSchemaForAdmin.model_validate(loan).model_dump(exclude={"documents"})
 
                 if loan_data.get("status") == "USER_ACCEPTED" and not loan_data.get("available_for_disbursement"):
                     continue
-                # Fetch matching interest rate info for this loan's type
-                rate_entry = credit_score_range_rate.read_by_fields(
-                    fields=[CreditScoreRangeRate.loan_type == loan.loan_type]
-                )
+                # Interest rate info for this loan's type
+                rate_entry = credit_rate_index.rates_for(loan.loan_type)
 
                 # Attach rate info if available
-                if rate_entry:
-                    credit_score_rate_info = [{
-                        "id": i.id,
-                        "min_score": i.min_score,
-                        "max_score": i.max_score,
-                        "rate_percentage": i.rate_percentage
-                    } for i in rate_entry]
-                    loan_data["credit_score_rate_info"] = credit_score_rate_info
-                else:
-                    loan_data["credit_score_rate_info"] = {}
+                loan_data["credit_score_rate_info"] = rate_entry if rate_entry else {}
 
                 loan_list.append(loan_data)
 
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import uuid
 from datetime import datetime
@@ -16,19 +17,19 @@ from common.common_services.aws_services import AWSClient
 from common.common_services.email_service import EmailService
 from common.email_html_utils import build_loan_email_bodies
 from common.enums import DocumentType, IncomeProofType, LoanType, UploadFileType, LoanStatus
-from common.utils import (calculate_emi_schedule, format_loan_documents,
-    format_plan_and_subscriptions, unix_to_yyyy_mm_dd, validate_file_type, get_latest_paid_at, calculate_foreclosure_details)
+from common.razorpay_snapshots import razorpay_snapshot_cache
+from common.utils import (calculate_emi_schedule, resolve_emi_schedule_day, format_loan_documents,
+    format_plan_and_subscriptions, unix_to_yyyy_mm_dd, validate_file_type, get_latest_paid_at, calculate_foreclosure_details,
+    validate_content_type, ALLOWED_UPLOAD_CONTENT_TYPES)
 from config import app_config
 from db_domains import Base
+from db_domains.async_db_interface import AsyncDBInterface
 from db_domains.db import DBSession
 from db_domains.db_interface import DBInterface
-from models.loan import LoanDocument, LoanApplicant, LoanApprovalDetail, EmiScheduleDate
+from models.loan import LoanDocument, LoanApplicant, LoanApprovalDetail, EmiScheduleDate, UploadedFile
 from models.razorpay import Plan, Subscription, ForeClosure, PaymentDetails
 from schemas.loan_schemas import LoanForm, LoanApplicantResponseSchema, UserApprovedLoanForm, InstantCashForm, \
-    LoanConsentForm, LoanDisbursementForm, LoanAadharVerifiedStatusForm
-from services.razorpay_service import RazorpayService
-razorpay_service_obj = RazorpayService(
-                app_config.RAZORPAY_KEY_ID, app_config.RAZORPAY_SECRET)
+    LoanConsentForm, LoanDisbursementForm, LoanAadharVerifiedStatusForm, PresignedUploadForm, UploadCompleteForm
 
 class UserLoanService:
     def __init__(self, db_model: type[Base]) -> None:
@@ -49,6 +50,43 @@ class UserLoanService:
             return loan.processing_fee
         return 0.0
 
+    @staticmethod
+    def get_unrecorded_upload_urls(user_id: int, loan_application_form: LoanForm) -> list[str]:
+        """
+        Returns the document URLs of the form that were not uploaded by this user through /upload-file or
+        /upload-complete.
+        """
+        document_files = [
+            file for file in [
+                loan_application_form.pan_file,
+                loan_application_form.aadhaar_file,
+                *(loan_application_form.document_file or []),
+                *(loan_application_form.property_document_file or []),
+            ] if file
+        ]
+        if not document_files:
+            return []
+
+        recorded_uploads = DBInterface(UploadedFile).read_by_fields([
+            UploadedFile.user_id == user_id,
+            UploadedFile.document_file.in_(document_files),
+            UploadedFile.is_deleted == False
+        ]) or []
+        recorded_files = {upload.document_file for upload in recorded_uploads}
+        return [file for file in document_files if file not in recorded_files]
+
+    @staticmethod
+    async def record_upload(user_id: int, file_type: UploadFileType, s3_key: str, document_file: str) -> None:
+        uploaded_file_interface = AsyncDBInterface(UploadedFile)
+        if await uploaded_file_interface.read_single_by_fields([UploadedFile.s3_key == s3_key]):
+            return
+        await uploaded_file_interface.create({
+            "user_id": user_id,
+            "file_type": file_type,
+            "s3_key": s3_key,
+            "document_file": document_file
+        })
+
     def add_loan_application(
             self, user_id: str, loan_application_form: LoanForm, background_tasks: BackgroundTasks,
             is_created_by_admin: bool
@@ -56,6 +94,16 @@ class UserLoanService:
         try:
             app_logger.info(f"User {user_id} initiated loan application.")
 
+            unrecorded_files = self.get_unrecorded_upload_urls(user_id, loan_application_form)
+            if unrecorded_files:
+                app_logger.warning(f"User {user_id} submitted unrecorded document files: {unrecorded_files}")
+                return {
+                    "success": False,
+                    "message": gettext("uploaded_file_not_recorded"),
+                    "status_code": status.HTTP_400_BAD_REQUEST,
+                    "data": {"document_files": unrecorded_files}
+                }
+
             # Prepare applicant details
             applicant_details_data = {
                 "name": loan_application_form.name,
@@ -157,7 +205,7 @@ class UserLoanService:
                 email_service_obj = EmailService()
                 plain_body, html_body = build_loan_email_bodies(loan_application_form, applicant_obj, applicant_id)
                 if os.environ.get("IS_PROD").lower() == "true" and is_created_by_admin == False:
-                    background_tasks.add_task(email_service_obj.send_email, subject, plain_body, recipient, html_body)
+                    email_service_obj.queue_email(subject, plain_body, recipient, html_body)
             except Exception as e:
                 app_logger.error(f"Error scheduling email for {loan_application_form.email}: {str(e)}")
             return {
@@ -370,7 +418,7 @@ class UserLoanService:
                 }
 
             # Fetch Razorpay plan and subscription data
-            razorpay_plan_data = razorpay_service_obj.fetch_plan(plan_id=plan_id)
+            razorpay_plan_data = razorpay_snapshot_cache.plan(loan_details.plans[0])
             if not razorpay_plan_data or 'item' not in razorpay_plan_data:
                 app_logger.error("Failed to fetch valid Razorpay plan data")
                 return {
@@ -400,7 +448,7 @@ class UserLoanService:
                     "data": default_data
                 }
 
-            razorpay_sub_data = razorpay_service_obj.fetch_subscription(subscription_id=razorpay_sub_id)
+            razorpay_sub_data = razorpay_snapshot_cache.subscription(loan_details.plans[0].subscriptions[0])
             if not razorpay_sub_data:
                 app_logger.error("Failed to fetch valid Razorpay subscription data")
                 return {
@@ -493,18 +541,17 @@ class UserLoanService:
                 loan_response["plan_details"] = plan_data
                 #NOTE: Fetch Subscription Details and Proceed with The start date and End Date details for "Consumer durable loan Details" Page
                 loan_response["e_mandate_payment_track"] = {}
-                razorpay_sub_id = None
                 razorpay_sub_detail = None
                 razorpay_sub_invoice_detail = None
 
-                if plan_data and isinstance(plan_data, list) and len(plan_data) > 0 and "subscriptions" in plan_data[0]:
-                    subs = plan_data[0].get("subscriptions")
-                    if subs and len(subs) > 0:
-                        razorpay_sub_id = subs[0].get("razorpay_subscription_id")
+                current_subscription = None
+                if loan_with_docs.plans and loan_with_docs.plans[0].subscriptions:
+                    current_subscription = loan_with_docs.plans[0].subscriptions[0]
 
-                if razorpay_sub_id:
-                    razorpay_sub_detail = razorpay_service_obj.fetch_subscription(subscription_id=razorpay_sub_id)
-                    razorpay_sub_invoice_detail = razorpay_service_obj.fetch_invoices_for_subscription(subscription_id=razorpay_sub_id)
+                if current_subscription and current_subscription.razorpay_subscription_id:
+                    snapshot = razorpay_snapshot_cache.snapshot(current_subscription)
+                    razorpay_sub_detail = snapshot["subscription_data"]
+                    razorpay_sub_invoice_detail = snapshot["invoice_data"]
 
                 if razorpay_sub_detail:
                     try:
@@ -585,8 +632,7 @@ class UserLoanService:
                         annual_interest_rate=loan_response["effective_interest_rate"],
                         processing_fee=effective_processing_fee,
                         is_fee_percentage=True,
-                        loan_type=loan_with_docs.loan_type,
-                        emi_start_day_atm=loan_with_docs.emi_start_day_atm
+                        emi_schedule_day=resolve_emi_schedule_day(loan_with_docs.loan_type, loan_with_docs.emi_start_day_atm)
                     )
 
                     if emi_result.get("success"):
@@ -619,8 +665,7 @@ class UserLoanService:
                             annual_interest_rate=loan_approval_detail.approved_interest_rate,
                             processing_fee=effective_processing_fee,
                             is_fee_percentage=True,
-                            loan_type=loan_with_docs.loan_type,
-                            emi_start_day_atm=loan_with_docs.emi_start_day_atm,
+                            emi_schedule_day=resolve_emi_schedule_day(loan_with_docs.loan_type, loan_with_docs.emi_start_day_atm),
                         )
                         if emi_result.get("success"):
                             loan_response["emi_info"] = emi_result["data"]
@@ -663,22 +708,30 @@ class UserLoanService:
 
             }
 
-    async def upload_files_to_s3(self, file_type: UploadFileType, files: List[UploadFile]):
+    async def upload_files_to_s3(self, user_id: int, file_type: UploadFileType, files: List[UploadFile]):
         try:
-            upload_results = []
-            aws_client = AWSClient()
             for file in files:
                 validate_file_type(file)
-                filename = f"{uuid.uuid4().hex}_{file.filename}"
-                file_bytes = await file.read()
 
-                upload_response = await aws_client.upload_to_s3(
-                    file_name=filename,
-                    binary_data=file_bytes,
-                    file_type=file_type.value
-                )
+            aws_client = AWSClient()
+            semaphore = asyncio.Semaphore(app_config.S3_UPLOAD_CONCURRENCY)
+
+            async def upload(file: UploadFile) -> dict:
+                filename = f"{uuid.uuid4().hex}_{file.filename}"
+                async with semaphore:
+                    # Streamed from the spooled temp file, large files go up as multipart
+                    upload_response = await aws_client.upload_fileobj_to_s3(
+                        file_name=filename,
+                        fileobj=file,
+                        file_type=file_type.value,
+                        content_type=file.content_type
+                    )
+                s3_key = upload_response.pop("key")
+                await self.record_upload(user_id, file_type, s3_key, upload_response["s3_object_url"])
                 app_logger.info(f"File uploaded: {upload_response['s3_object_url']}")
-                upload_results.append(upload_response)
+                return upload_response
+
+            upload_results = list(await asyncio.gather(*(upload(file) for file in files)))
             return {
                 "success": True,
                 "message": gettext("uploaded_successfully").format("File"),
@@ -695,6 +748,88 @@ class UserLoanService:
                 "data": {}
             }
 
+    async def create_upload_url(self, user_id: int, form_data: PresignedUploadForm):
+        try:
+            validate_content_type(form_data.content_type)
+            filename = f"{uuid.uuid4().hex}_{os.path.basename(form_data.file_name)}"
+            presigned = await AWSClient().create_presigned_post(
+                file_name=filename,
+                file_type=form_data.file_type.value,
+                content_type=form_data.content_type,
+                user_id=user_id,
+                max_bytes=app_config.S3_UPLOAD_MAX_BYTES,
+                expires_in=app_config.S3_PRESIGNED_EXPIRES_SECONDS
+            )
+            return {
+                "success": True,
+                "message": gettext("upload_url_created_successfully"),
+                "status_code": status.HTTP_200_OK,
+                "data": presigned
+            }
+
+        except Exception as e:
+            app_logger.error(f"Error creating upload URL: {str(e)}", exc_info=True)
+            return {
+                "success": False,
+                "message": str(e),
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "data": {}
+            }
+
+    async def complete_upload(self, user_id: int, form_data: UploadCompleteForm):
+        try:
+            if not form_data.key.startswith(f"{form_data.file_type.value}/"):
+                return {
+                    "success": False,
+                    "message": gettext("uploaded_file_rejected"),
+                    "status_code": status.HTTP_400_BAD_REQUEST,
+                    "data": {}
+                }
+
+            aws_client = AWSClient()
+            s3_object = await aws_client.head_object(form_data.key)
+            if s3_object is None:
+                return {
+                    "success": False,
+                    "message": gettext("not_found").format("File"),
+                    "status_code": status.HTTP_404_NOT_FOUND,
+                    "data": {}
+                }
+
+            if (s3_object.get("Metadata", {}).get("user-id") != str(user_id)
+                    or s3_object.get("ContentType") not in ALLOWED_UPLOAD_CONTENT_TYPES
+                    or s3_object.get("ContentLength", 0) > app_config.S3_UPLOAD_MAX_BYTES):
+                app_logger.warning(f"Rejected upload {form_data.key} for user {user_id}")
+                # Someone else's upload is left alone, an invalid one of this user is removed
+                if s3_object.get("Metadata", {}).get("user-id") == str(user_id):
+                    await aws_client.delete_object(form_data.key)
+                return {
+                    "success": False,
+                    "message": gettext("uploaded_file_rejected"),
+                    "status_code": status.HTTP_400_BAD_REQUEST,
+                    "data": {}
+                }
+
+            s3_object_url = aws_client.object_url(form_data.key)
+            await self.record_upload(user_id, form_data.file_type, form_data.key, s3_object_url)
+            app_logger.info(f"File uploaded: {s3_object_url}")
+            # Same shape as /upload-file, the URL goes into the loan forms' document_file fields
+            return {
+                "success": True,
+                "message": gettext("uploaded_successfully").format("File"),
+                "status_code": status.HTTP_200_OK,
+                "data": [{"s3_object_url": s3_object_url}]
+            }
+
+        except Exception as e:
+            app_logger.error(f"Error completing upload {form_data.key}: {str(e)}", exc_info=True)
+            return {
+                "success": False,
+                "message": gettext("something_went_wrong"),
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "data": {}
+            }
+
     def add_user_approved_loan(self, user_id: int, loan_application_form: UserApprovedLoanForm):
         approval_interface = DBInterface(LoanApprovalDetail)
         applicant_interface = DBInterface(LoanApplicant)
@@ -1,14 +1,14 @@
-from config import app_config
 from typing import Any
 
 from starlette import status
+from starlette.concurrency import run_in_threadpool
 
 from app_logging import app_logger
 from db_domains import Base
 from db_domains.db_interface import DBInterface
 from models.razorpay import Plan
 from schemas.razorpay_schema import CreatePlanSchema
-from services.razorpay_service import RazorpayService
+from services.razorpay_gateway import get_razorpay_gateway
 from fastapi import HTTPException
 
 
@@ -17,14 +17,16 @@ class PlanService:
         self.db_class: type[Base] = db_model
         self.db_interface = DBInterface(self.db_class)
 
-    def add_plan(self, applicant_id: int, user_id: int, form_data: CreatePlanSchema) -> Any:
+    async def add_plan(self, applicant_id: int, user_id: int, form_data: CreatePlanSchema) -> Any:
         try:
-            self.db_interface = DBInterface(Plan)
+            # Awaited from the async Razorpay routes, the sync reads and writes run in the threadpool
+            db_interface = DBInterface(Plan)
 
             app_logger.info(
                 f"[Creating Loan Plan]"
             )
-            existing_entry = self.db_interface.read_single_by_fields(
+            existing_entry = await run_in_threadpool(
+                db_interface.read_single_by_fields,
                 fields=[
                     Plan.applicant_id == applicant_id,
                     Plan.is_deleted == False,
@@ -36,10 +38,8 @@ class PlanService:
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"EMI Plan already exists for loan detail {applicant_id}."
                 )
-            service = RazorpayService(
-                app_config.RAZORPAY_KEY_ID, app_config.RAZORPAY_SECRET)
             plan_data = form_data
-            plan = service.create_plan(plan_data)
+            plan = await get_razorpay_gateway().create_plan(plan_data)
             data = {
                 "applicant_id": applicant_id,
                 "razorpay_plan_id": plan.get("id"),
@@ -54,7 +54,7 @@ class PlanService:
                 "plan_data": plan
             }
             data["created_by"] = user_id
-            new_entry = self.db_interface.create(data=data)
+            new_entry = await run_in_threadpool(db_interface.create, data=data)
             return new_entry
 
         except Exception as e:
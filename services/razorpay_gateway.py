@@ -0,0 +1,174 @@
+import asyncio
+import hashlib
+import hmac
+import random
+from typing import Any, Awaitable, Dict, List, Optional
+
+import httpx
+
+from app_logging import app_logger
+from config import app_config
+
+# Rejected before processing, safe to send again
+_RETRY_STATUS_CODES = {429, 502, 503, 504}
+# The request never reached Razorpay, so even a create can be retried
+_NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+class RazorpayGatewayError(Exception):
+    """
+    Error response from Razorpay. The message is Razorpay's error description, like the errors raised
+    by the razorpay SDK, so existing message checks keep working.
+    """
+
+    def __init__(self, status_code: int, error: Dict[str, Any]) -> None:
+        self.status_code = status_code
+        self.error = error
+        super().__init__(error.get("description") or f"Razorpay request failed with status {status_code}")
+
+
+class RazorpayGateway:
+    """
+    Async Razorpay API client sharing one pooled httpx.AsyncClient (keep-alive, HTTP/2) across requests.
+    Reads and rejected requests are retried with exponential backoff and full jitter; creates are only
+    retried when they never reached Razorpay.
+    """
+
+    def __init__(
+            self, key_id: str, key_secret: str, base_url: str = app_config.RAZORPAY_API_BASE_URL,
+            timeout: float = app_config.RAZORPAY_TIMEOUT_SECONDS, max_retries: int = app_config.RAZORPAY_MAX_RETRIES,
+            max_connections: int = app_config.RAZORPAY_MAX_CONNECTIONS, http2: bool = app_config.RAZORPAY_HTTP2,
+            transport: Optional[httpx.AsyncBaseTransport] = None
+    ) -> None:
+        self.max_retries = max_retries
+        self.client = httpx.AsyncClient(
+            base_url=base_url,
+            auth=(key_id, key_secret),
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 5.0)),
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            http2=http2,
+            transport=transport
+        )
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        return random.uniform(0, min(2.0, 0.2 * 2 ** attempt))
+
+    async def _request(self, method: str, path: str, json: Optional[Dict] = None,
+                       params: Optional[Dict] = None) -> Dict:
+        is_idempotent = method == "GET"
+        attempt = 0
+        while True:
+            try:
+                response = await self.client.request(method, path, json=json, params=params)
+            except httpx.TransportError as e:
+                can_retry = is_idempotent or isinstance(e, _NOT_SENT_ERRORS)
+                if not can_retry or attempt >= self.max_retries:
+                    raise
+                app_logger.warning(f"[RazorpayGateway] {method} {path} failed ({e!r}), retrying")
+            else:
+                if response.status_code < 400:
+                    return response.json()
+                if response.status_code not in _RETRY_STATUS_CODES or attempt >= self.max_retries or (
+                        not is_idempotent and response.status_code != 429):
+                    try:
+                        error = response.json().get("error") or {}
+                    except ValueError:
+                        error = {}
+                    raise RazorpayGatewayError(response.status_code, error)
+                app_logger.warning(f"[RazorpayGateway] {method} {path} returned {response.status_code}, retrying")
+            await asyncio.sleep(self._backoff(attempt))
+            attempt += 1
+
+    async def create_customer(self, name: str, email: str, contact: str) -> Dict:
+        return await self._request("POST", "/customers", json={"name": name, "email": email, "contact": contact})
+
+    async def create_plan(self, plan_data: Dict) -> Dict:
+        return await self._request("POST", "/plans", json=plan_data)
+
+    async def fetch_plan(self, plan_id: str) -> Dict:
+        return await self._request("GET", f"/plans/{plan_id}")
+
+    async def create_subscription(self, subscription_data: Dict) -> Dict:
+        return await self._request("POST", "/subscriptions", json=subscription_data)
+
+    async def fetch_subscription(self, subscription_id: str) -> Dict:
+        return await self._request("GET", f"/subscriptions/{subscription_id}")
+
+    async def cancel_subscription(self, subscription_id: str) -> Dict:
+        return await self._request("POST", f"/subscriptions/{subscription_id}/cancel", json={})
+
+    async def fetch_invoices_for_subscription(self, subscription_id: str, count: int = 10, skip: int = 0) -> Dict:
+        return await self._request("GET", "/invoices", params={
+            "subscription_id": subscription_id,
+            "count": count,
+            "skip": skip
+        })
+
+    async def create_payment_link(self, amount: Any, currency: str, description: str, subscription_id: str,
+                                  callback_url: str) -> Dict:
+        return await self._request("POST", "/payment_links", json={
+            "amount": int(amount),
+            "currency": currency,
+            "description": description,
+            "accept_partial": False,
+            "first_min_partial_amount": amount,
+            "reference_id": subscription_id,  # NOTE This to capture paymenet based on subscription
+            "notify": {
+                "sms": True,
+                "email": True
+            },
+            "notes": {
+                "subscription_id": subscription_id
+            },
+            "reminder_enable": True,
+            "callback_url": callback_url,
+            "callback_method": "get"
+        })
+
+    async def get_payment_link_details(self, payment_id: str) -> Dict:
+        try:
+            return await self._request("GET", f"/payment_links/{payment_id}")
+        except Exception as e:
+            raise Exception(f"Error fetching payment details for {payment_id}: {str(e)}")
+
+    async def fetch_payment_details(self, payment_id: str) -> Dict:
+        try:
+            return await self._request("GET", f"/payments/{payment_id}")
+        except Exception as e:
+            raise Exception(f"Error fetching payment details for {payment_id}: {str(e)}")
+
+    @staticmethod
+    def verify_webhook_signature(payload_body: str, signature: str, secret: str) -> bool:
+        expected = hmac.new(secret.encode("utf-8"), payload_body.encode("utf-8"), hashlib.sha256).hexdigest()
+        return hmac.compare_digest(expected, signature or "")
+
+
+async def gather_with_timeout(
+        *calls: Awaitable, timeout: float = app_config.RAZORPAY_FANOUT_TIMEOUT_SECONDS
+) -> List[Any]:
+    """
+    Run independent gateway calls concurrently, each bounded by its own timeout.
+    Failed or timed out calls come back as their exception so callers can handle partial results.
+    """
+    return await asyncio.gather(*(asyncio.wait_for(call, timeout=timeout) for call in calls), return_exceptions=True)
+
+
+_razorpay_gateway: Optional[RazorpayGateway] = None
+
+
+def get_razorpay_gateway() -> RazorpayGateway:
+    global _razorpay_gateway
+    if _razorpay_gateway is None:
+        _razorpay_gateway = RazorpayGateway(app_config.RAZORPAY_KEY_ID, app_config.RAZORPAY_SECRET)
+    return _razorpay_gateway
+
+
+async def close_razorpay_gateway() -> None:
+    global _razorpay_gateway
+    if _razorpay_gateway is not None:
+        await _razorpay_gateway.aclose()
+        _razorpay_gateway = None
@@ -1,14 +1,14 @@
 from typing import Any
 from fastapi import HTTPException
 from starlette import status
+from starlette.concurrency import run_in_threadpool
 
-from config import app_config
 from app_logging import app_logger
 from db_domains import Base
 from db_domains.db_interface import DBInterface
 from models.razorpay import Subscription
 from schemas.razorpay_schema import CreateSubscriptionSchema
-from services.razorpay_service import RazorpayService
+from services.razorpay_gateway import get_razorpay_gateway
 
 
 class SubscriptionService:
@@ -16,14 +16,16 @@ class SubscriptionService:
         self.db_class: type[Base] = db_model
         self.db_interface = DBInterface(self.db_class)
 
-    def add_subscription(self, plan_id: int, user_id: int, form_data: CreateSubscriptionSchema) -> Any:
+    async def add_subscription(self, plan_id: int, user_id: int, form_data: CreateSubscriptionSchema) -> Any:
         try:
-            self.db_interface = DBInterface(Subscription)
+            # Awaited from the async Razorpay routes, the sync reads and writes run in the threadpool
+            db_interface = DBInterface(Subscription)
 
             app_logger.info(
                 f"[Creating Plan's Subscription ]"
             )
-            existing_entry = self.db_interface.read_single_by_fields(
+            existing_entry = await run_in_threadpool(
+                db_interface.read_single_by_fields,
                 fields=[
                     Subscription.plan_id == plan_id,
                     Subscription.is_deleted == False,
@@ -35,9 +37,7 @@ class SubscriptionService:
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"EMI Subscription Is already exists for plan detail {plan_id}."
                 )
-            service = RazorpayService(
-                app_config.RAZORPAY_KEY_ID, app_config.RAZORPAY_SECRET)
-            new_sub = service.create_subscription(form_data)
+            new_sub = await get_razorpay_gateway().create_subscription(form_data)
             print("new sub", new_sub)
             data = {
                 "status": "created",
@@ -63,7 +63,7 @@ class SubscriptionService:
 
             }
             data["created_by"] = user_id
-            new_entry = self.db_interface.create(data=data)
+            new_entry = await run_in_threadpool(db_interface.create, data=data)
             return new_entry
 
         except Exception as e:
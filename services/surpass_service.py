@@ -1,14 +1,18 @@
+import asyncio
 import re
 from datetime import date, timedelta, datetime
 from typing import Any, Dict
 
+from sqlalchemy.orm import undefer
 from starlette import status
 
 from app_logging import app_logger
 from common.cache_string import gettext
+from common.cibil_analyzer import CibilAnalysis, build_cibil_summary
+from common.common_services.blob_store import load_credit_report, save_credit_report
 from common.common_services.surpass_service import SurpassRequestService
 from common.enums import LoanStatus
-from db_domains.db_interface import DBInterface
+from db_domains.async_db_interface import AsyncDBInterface
 from models.loan import BankAccount, LoanApplicant
 from models.surpass import UserCibilReport
 from schemas.surpass_schemas import GetCibilReportData, PanCardDetails, BankDetails, AadharCardDetails
@@ -21,14 +25,14 @@ class SurpassService:
 
     async def fetch_cibil_score(self, user_id: int, payload_data: GetCibilReportData) -> Dict[str, Any]:
         data_dict = payload_data.model_dump(mode="json", by_alias=True)
-        user_cibil_report = DBInterface(UserCibilReport)
+        user_cibil_report = AsyncDBInterface(UserCibilReport)
         current_date = date.today()
         if (app_settings.SUREPASS_VALIDATION).lower() == "false": # BYPASS API CALL
-            existing_report = user_cibil_report.read_single_by_fields(
+            existing_report = await user_cibil_report.read_single_by_fields(
                 fields=[]
             )
         else:
-            existing_report = user_cibil_report.read_single_by_fields(
+            existing_report = await user_cibil_report.read_single_by_fields(
                 fields=[
                     UserCibilReport.user_id == user_id,
                     UserCibilReport.pan_number == data_dict.get("pan"),
@@ -45,23 +49,28 @@ class SurpassService:
                 return None, request_status_code, request_error
 
             data = response_data.get("data", {})
+            credit_report = data.get("credit_report", {})
             report_data = {
                 "user_id": user_id,
                 "client_id": data.get("client_id"),
                 "name": data.get("name"),
                 "pan_number": data.get("pan"),
                 "mobile": data.get("mobile"),
-                "credit_score": data.get("credit_score"),
-                "credit_report": data.get("credit_report", {}),
+                # asyncpg does not coerce types, credit_score is a String column
+                "credit_score": str(data.get("credit_score")) if data.get("credit_score") is not None else None,
+                # The raw report goes to the blob store, the row keeps its reference
+                "credit_report": None,
+                "credit_report_ref": await asyncio.to_thread(save_credit_report, credit_report),
                 "report_refresh_date": current_date,
                 "next_eligible_date": current_date + timedelta(days=30),
                 "gender": "male" if data.get("gender") == "male" else "female" if data.get("gender") == "female" else "other",
             }
+            report_data.update(build_cibil_summary(credit_report))
 
             if existing_id:
-                user_cibil_report.update(_id=existing_id, data=report_data)
+                await user_cibil_report.update(_id=existing_id, data=report_data)
             else:
-                create_response = user_cibil_report.create(data=report_data)
+                create_response = await user_cibil_report.create(data=report_data)
                 existing_id = create_response.id
 
             return {
@@ -145,8 +154,8 @@ class SurpassService:
                     return "Poor"
 
             app_logger.info(f"Fetching CIBIL report for user_id: {user_id}, cibil_score_id: {cibil_score_id}")
-            user_cibil_report = DBInterface(UserCibilReport)
-            cibil_report = user_cibil_report.read_single_by_fields(
+            user_cibil_report = AsyncDBInterface(UserCibilReport)
+            cibil_report = await user_cibil_report.read_single_by_fields(
                 [
                     UserCibilReport.id == cibil_score_id
                 ]
@@ -159,67 +168,27 @@ class SurpassService:
                     "data": {}
                 }
 
-            accounts = cibil_report.credit_report[0].get("accounts", [])
-
-            # 1. Credit Utilization
-            total_used, total_limit = 0, 0
-            for acc in accounts:
-                account_type = acc.get("accountType", "").lower()
-                account_status = acc.get("accountStatus", "").lower()
-
-                if "credit card" in account_type and "closed" not in account_status:
-                    try:
-                        high = int(acc.get("highCreditAmount", 0))
-                        balance = int(acc.get("currentBalance", 0))
-                        if high > 0 and balance >= 0:
-                            total_used += balance
-                            total_limit += high
-                    except (ValueError, TypeError) as e:
-                        app_logger.warning(f"Skipping credit card due to error: {e}")
-                        continue
-
-            avg_utilization = round((total_used / total_limit) * 100, 2) if total_limit > 0 else 0
-            app_logger.info(f"Total Used: {total_used} | Total Limit: {total_limit} | Utilization: {avg_utilization}%")
-
-            # 2. Payment History
-            on_time, total_blocks = 0, 0
-            for acc in accounts:
-                payment_history = acc.get("paymentHistory", "")
-                if isinstance(payment_history, str):
-                    history_blocks = re.findall(r"...", payment_history)
-                    valid_blocks = [b for b in history_blocks if re.fullmatch(r"\d{3}", b)]
-                    total_blocks += len(valid_blocks)
-                    on_time += sum(1 for b in valid_blocks if b == "000")
-
-            payment_history_percent = round((on_time / total_blocks) * 100, 2) if total_blocks > 0 else 0
-            app_logger.info(f"On Time Payments: {on_time} / {total_blocks} = {payment_history_percent}%")
-
-            # 3. Credit History
-            opened_dates = []
-            for acc in accounts:
-                date_str = acc.get("dateOpened")
-                try:
-                    opened_date = datetime.strptime(date_str, "%Y-%m-%d")
-                    opened_dates.append(opened_date)
-                except (ValueError, TypeError) as e:
-                    app_logger.warning(f"Skipping account due to invalid date: {date_str} | Error: {e}")
-                    continue
-
-            years, months = 0, 0
-            if opened_dates:
-                oldest_date = min(opened_dates)
-                today = datetime.today()
-                years = today.year - oldest_date.year
-                months = today.month - oldest_date.month
-                if months < 0:
-                    years -= 1
-                    months += 12
+            if cibil_report.summary_computed_at is None:
+                # Stored before summaries existed and not backfilled yet
+                if cibil_report.credit_report_ref:
+                    credit_report = await asyncio.to_thread(load_credit_report, cibil_report.credit_report_ref)
+                else:
+                    credit_report = (await user_cibil_report.read_single_by_fields(
+                        [UserCibilReport.id == cibil_score_id], options=[undefer(UserCibilReport.credit_report)]
+                    )).credit_report
+                cibil_report = await user_cibil_report.update(
+                    _id=cibil_score_id, data=build_cibil_summary(credit_report)
+                )
+
+            avg_utilization = cibil_report.credit_utilization_percent
+            payment_history_percent = cibil_report.payment_history_percent
+            app_logger.info(f"Utilization: {avg_utilization}% | Payment History: {payment_history_percent}%")
+
+            years, months = CibilAnalysis(oldest_opened=cibil_report.oldest_account_opened_on).credit_age()
 
             app_logger.info(f"Credit History: {years} years, {months} months")
 
-            # 4. Loan Accounts
-            loan_accounts = len(accounts)
-            app_logger.info(f"Total Loan Accounts: {loan_accounts}")
+            loan_accounts = cibil_report.loan_account_count
 
             report_summary = {
                 "payment_history": {
@@ -329,8 +298,8 @@ class SurpassService:
                 "ifsc_details": True
             }
 
-            bank_account_interface = DBInterface(BankAccount)
-            bank_account = bank_account_interface.read_by_fields(fields=[BankAccount.applicant_id == bank_detail.applicant_id, BankAccount.account_number == bank_detail.id_number, BankAccount.ifsc_code == bank_detail.ifsc, BankAccount.is_deleted == False])
+            bank_account_interface = AsyncDBInterface(BankAccount)
+            bank_account = await bank_account_interface.read_by_fields(fields=[BankAccount.applicant_id == bank_detail.applicant_id, BankAccount.account_number == bank_detail.id_number, BankAccount.ifsc_code == bank_detail.ifsc, BankAccount.is_deleted == False])
 
             if bank_account:
                 return {
@@ -394,13 +363,13 @@ class SurpassService:
 
             app_logger.debug(f"[bank_verifications] Saving verified bank data to DB: {bank_data}")
 
-            bank_account_response = bank_account_interface.create(data=bank_data)
+            bank_account_response = await bank_account_interface.create(data=bank_data)
 
             loan_data = {
                 "status": LoanStatus.BANK_VERIFIED
             }
-            applicant_interface = DBInterface(LoanApplicant)
-            applicant_interface.update(_id=str(bank_detail.applicant_id),
+            applicant_interface = AsyncDBInterface(LoanApplicant)
+            await applicant_interface.update(_id=bank_detail.applicant_id,
                                                              data=loan_data)
 
             app_logger.info(f"[bank_verifications] Bank details saved successfully for user_id={user_id}")
@@ -0,0 +1,52 @@
+import os
+import uuid
+
+import pytest
+from sqlalchemy import create_engine, make_url, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from db_domains.db import AsyncDBSession, Base, DBSession, async_engine as app_async_engine, engine as app_engine
+import models.contact_us  # noqa: F401
+import models.credit  # noqa: F401
+import models.email  # noqa: F401
+import models.loan  # noqa: F401
+import models.razorpay  # noqa: F401
+import models.surpass  # noqa: F401
+import models.user  # noqa: F401
+
+# SQLite cannot catch driver specific failures such as asyncpg rejecting aware datetimes
+TEST_POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+@pytest.fixture
+def postgres_engines():
+    """
+    Binds DBSession and AsyncDBSession to a throwaway schema of TEST_POSTGRES_URL, dropped afterwards.
+    """
+    if not TEST_POSTGRES_URL:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+
+    schema = f"test_{uuid.uuid4().hex[:12]}"
+    url = make_url(TEST_POSTGRES_URL)
+    sync_engine = create_engine(
+        url.set(drivername="postgresql+psycopg2"), poolclass=NullPool,
+        connect_args={"options": f"-csearch_path={schema}"}
+    )
+    async_engine = create_async_engine(
+        url.set(drivername="postgresql+asyncpg"), poolclass=NullPool,
+        connect_args={"server_settings": {"search_path": schema}}
+    )
+    with sync_engine.begin() as connection:
+        connection.execute(text(f'CREATE SCHEMA "{schema}"'))
+    Base.metadata.create_all(sync_engine)
+    DBSession.configure(bind=sync_engine)
+    AsyncDBSession.configure(bind=async_engine)
+    try:
+        yield sync_engine, async_engine
+    finally:
+        DBSession.configure(bind=app_engine)
+        AsyncDBSession.configure(bind=app_async_engine)
+        with sync_engine.begin() as connection:
+            connection.execute(text(f'DROP SCHEMA "{schema}" CASCADE'))
+        sync_engine.dispose()
@@ -0,0 +1,105 @@
+import datetime
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import StaticPool
+
+from common.credit_rate_index import credit_rate_index
+from common.enums import GenderEnum, PaginationMode, SubscriptionStatus, UserRole
+from db_domains.db import Base, DBSession, engine as app_engine
+from models.credit import *  # noqa: F401,F403
+from models.email import *  # noqa: F401,F403
+from models.loan import LoanApplicant
+from models.razorpay import Plan, Subscription
+from models.surpass import *  # noqa: F401,F403
+from models.user import User
+from services.loan_service.admin_loan import AdminLoanService
+
+LOAN_COUNT = 8
+
+
+@pytest.fixture
+def test_engine():
+    test_engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(test_engine)
+    DBSession.configure(bind=test_engine)
+    credit_rate_index.invalidate()
+    try:
+        yield test_engine
+    finally:
+        DBSession.configure(bind=app_engine)
+        credit_rate_index.invalidate()
+        test_engine.dispose()
+
+
+@pytest.fixture
+def loans(test_engine):
+    session = DBSession()
+    admin = User(name="Admin", phone="9999999999", role=UserRole.admin)
+    session.add(admin)
+    session.flush()
+    for i in range(LOAN_COUNT):
+        loan = LoanApplicant(
+            loan_uid=f"LN{i:04d}", name=f"Applicant {i}", email=f"applicant{i}@example.com",
+            phone_number=f"90000000{i:02d}", annual_income=500000, date_of_birth=datetime.date(1990, 1, 1),
+            gender=GenderEnum.male, address="Street", purpose_of_loan="Home", credit_score="750",
+            created_at=datetime.datetime(2024, 1, 1) + datetime.timedelta(hours=i),
+            created_by=admin.id, modified_by=admin.id
+        )
+        for j in range(2):
+            plan = Plan(
+                razorpay_plan_id=f"plan_{i}_{j}", period="monthly", interval=1, item_name="EMI", item_amount=100,
+                plan_data={"id": f"plan_{i}_{j}"}
+            )
+            plan.subscriptions = [
+                Subscription(
+                    razorpay_subscription_id=f"sub_{i}_{j}_{k}", status=SubscriptionStatus.ACTIVE,
+                    subscription_data={"id": f"sub_{i}_{j}_{k}"}, is_deleted=k == 1
+                )
+                for k in range(2)
+            ]
+            loan.plans.append(plan)
+        session.add(loan)
+    session.commit()
+    session.close()
+
+
+def count_statements(test_engine, call) -> tuple[int, dict]:
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine, "before_cursor_execute", record)
+    try:
+        response = call()
+    finally:
+        event.remove(test_engine, "before_cursor_execute", record)
+    return len(statements), response
+
+
+@pytest.mark.parametrize("pagination", [PaginationMode.OFFSET, PaginationMode.CURSOR])
+def test_get_all_loans_query_count_does_not_grow_with_page_size(test_engine, loans, pagination):
+    service = AdminLoanService(LoanApplicant)
+    # Loads the credit rate index, which is shared by every later page
+    service.get_all_loans(limit=1, pagination=pagination)
+
+    single_count, single_page = count_statements(
+        test_engine, lambda: service.get_all_loans(limit=1, pagination=pagination)
+    )
+    full_count, full_page = count_statements(
+        test_engine, lambda: service.get_all_loans(limit=LOAN_COUNT, pagination=pagination)
+    )
+
+    assert single_page["success"] and full_page["success"]
+    assert len(full_page["data"]["loan_applications"]) == LOAN_COUNT
+    assert single_count == full_count
+
+
+def test_get_all_loans_attaches_only_live_subscriptions(test_engine, loans):
+    response = AdminLoanService(LoanApplicant).get_all_loans(limit=LOAN_COUNT)
+
+    for loan in response["data"]["loan_applications"]:
+        assert len(loan["plans"]) == 2
+        for plan in loan["plans"]:
+            assert [subscription["id"][-1] for subscription in plan["subscriptions"]] == ["0"]
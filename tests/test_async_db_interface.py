@@ -0,0 +1,16 @@
+import asyncio
+
+from common.enums import UserRole
+from db_domains.async_db_interface import AsyncDBInterface
+from models.user import User
+
+
+def test_create_and_update_write_timestamps_on_postgres(postgres_engines):
+    user_interface = AsyncDBInterface(User)
+
+    user = asyncio.run(user_interface.create({"name": "Applicant", "phone": "9876543210", "role": UserRole.user}))
+    updated_user = asyncio.run(user_interface.update(_id=user.id, data={"name": "Renamed"}))
+
+    assert user.created_at is not None and user.created_at.tzinfo is None
+    assert updated_user.name == "Renamed"
+    assert updated_user.modified_at >= user.created_at
@@ -0,0 +1,96 @@
+import asyncio
+import io
+
+import pytest
+from fastapi import BackgroundTasks, UploadFile
+from starlette.datastructures import Headers
+
+from common.enums import DocumentType, IncomeProofType, LoanType, UploadFileType, UserRole
+from db_domains.db import DBSession
+from models.loan import LoanApplicant, LoanDocument, UploadedFile
+from models.user import User
+from schemas.loan_schemas import LoanForm
+from services.loan_service import user_loan
+from services.loan_service.user_loan import UserLoanService
+
+
+class FakeAWSClient:
+    def object_url(self, s3_key: str) -> str:
+        return f"https://bucket.example.com/{s3_key}"
+
+    async def upload_fileobj_to_s3(self, file_name: str, fileobj, file_type: str, content_type=None) -> dict:
+        s3_key = f"{file_type}/{file_name}"
+        return {"s3_object_url": self.object_url(s3_key), "key": s3_key}
+
+
+@pytest.fixture
+def applicant(postgres_engines, monkeypatch):
+    monkeypatch.setattr(user_loan, "AWSClient", FakeAWSClient)
+    session = DBSession()
+    user = User(name="Applicant", phone="9876543210", role=UserRole.user)
+    session.add(user)
+    session.commit()
+    user_id = user.id
+    session.close()
+    return user_id
+
+
+def upload(service: UserLoanService, user_id: int, file_type: UploadFileType, file_name: str) -> str:
+    file = UploadFile(
+        file=io.BytesIO(b"%PDF-1.4"), filename=file_name, headers=Headers({"content-type": "application/pdf"})
+    )
+    response = asyncio.run(service.upload_files_to_s3(user_id=user_id, file_type=file_type, files=[file]))
+    assert response["success"], response
+    return response["data"][0]["s3_object_url"]
+
+
+def loan_form(pan_file: str, aadhaar_file: str, document_file: list) -> LoanForm:
+    return LoanForm(
+        name="Applicant", email="applicant@example.com", phone_number="9876543210", annual_income=600000,
+        desired_loan=100000, date_of_birth="1990-01-01", gender="male", address="Street", company_name="Company",
+        company_address="Street", designation="Engineer", purpose_of_loan="Home", loan_type=LoanType.PERSONAL,
+        pan_number="ABCDE1234F", aadhaar_number="123412341234", pan_file=pan_file, aadhaar_file=aadhaar_file,
+        proof_type=IncomeProofType.SALARIED, document_type=DocumentType.SALARY_SLIP, document_file=document_file
+    )
+
+
+def test_loan_form_accepts_documents_uploaded_by_the_applicant(applicant):
+    service = UserLoanService(LoanApplicant)
+    pan_file = upload(service, applicant, UploadFileType.pan_card, "pan.pdf")
+    aadhaar_file = upload(service, applicant, UploadFileType.aadhar_card, "aadhaar.pdf")
+    salary_slip = upload(service, applicant, UploadFileType.salaried, "salary.pdf")
+
+    response = service.add_loan_application(
+        user_id=applicant, loan_application_form=loan_form(pan_file, aadhaar_file, [salary_slip]),
+        background_tasks=BackgroundTasks(), is_created_by_admin=False
+    )
+
+    assert response["success"], response
+    session = DBSession()
+    try:
+        assert session.query(UploadedFile).filter(UploadedFile.user_id == applicant).count() == 3
+        assert {document.document_file for document in session.query(LoanDocument)} == {
+            pan_file, aadhaar_file, salary_slip
+        }
+    finally:
+        session.close()
+
+
+def test_loan_form_rejects_documents_not_uploaded_by_the_applicant(applicant):
+    service = UserLoanService(LoanApplicant)
+    pan_file = upload(service, applicant, UploadFileType.pan_card, "pan.pdf")
+    aadhaar_file = upload(service, applicant, UploadFileType.aadhar_card, "aadhaar.pdf")
+    foreign_file = "https://bucket.example.com/salaried/someone_else.pdf"
+
+    response = service.add_loan_application(
+        user_id=applicant, loan_application_form=loan_form(pan_file, aadhaar_file, [foreign_file]),
+        background_tasks=BackgroundTasks(), is_created_by_admin=False
+    )
+
+    assert not response["success"]
+    assert response["data"] == {"document_files": [foreign_file]}
+    session = DBSession()
+    try:
+        assert session.query(LoanApplicant).count() == 0
+    finally:
+        session.close()
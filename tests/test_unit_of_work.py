@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from common.enums import UserRole
+from common.response import ApiResponse
+from db_domains.db import Base, DBSession, engine as app_engine, unit_of_work
+from db_domains.db_interface import DBInterface
+from models.user import User
+
+
+@pytest.fixture
+def test_engine():
+    test_engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(test_engine)
+    DBSession.configure(bind=test_engine)
+    try:
+        yield test_engine
+    finally:
+        DBSession.configure(bind=app_engine)
+        test_engine.dispose()
+
+
+def user_count() -> int:
+    return DBInterface(User).count_all_by_fields([User.is_deleted == False])
+
+
+@pytest.mark.parametrize("success, expected_users", [(True, 1), (False, 0)])
+def test_unit_of_work_commits_only_successful_responses(test_engine, success, expected_users):
+    with unit_of_work():
+        DBInterface(User).create({"name": "Applicant", "phone": "9876543210", "role": UserRole.user})
+        ApiResponse.create_response(success=success, message="", status_code=200)
+
+    assert user_count() == expected_users